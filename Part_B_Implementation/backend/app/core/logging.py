@@ -9,8 +9,9 @@ import asyncio
 import logging
 import sys
 import uuid
+from contextvars import ContextVar
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 from structlog.processors import JSONRenderer, TimeStamper
@@ -18,6 +19,15 @@ from structlog.stdlib import BoundLogger
 
 from app.core.config import settings
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+# Loop that rows logged from worker threads are handed to. asyncio.to_thread
+# copies the caller's context, so threads it starts see the binding.
+_owner_loop: ContextVar[asyncio.AbstractEventLoop | None] = ContextVar(
+    "audit_owner_loop", default=None
+)
+
 
 def setup_logging() -> None:
     """Configure structured logging for the application."""
@@ -90,8 +100,38 @@ class AuditLogger:
     2. database (audit_logs table) - for permanent storage and querying
     """
 
-    def __init__(self) -> None:
+    # Buffered rows are written in one transaction once FLUSH_SIZE are
+    # queued, or FLUSH_INTERVAL seconds after the first queued row
+    FLUSH_SIZE = 100
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(
+        self, session_factory: "async_sessionmaker[AsyncSession] | None" = None
+    ) -> None:
+        """
+        Initialize the audit logger.
+
+        Args:
+            session_factory: Session factory used to persist audit rows.
+                Defaults to app.db.database.AsyncSessionLocal, looked up
+                on each write since the database is configured after import.
+        """
         self._logger = get_logger("audit")
+        self._session_factory = session_factory
+        self._buffer: list[dict[str, Any]] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        # The event loop only keeps weak references to tasks
+        self._pending_flushes: set[asyncio.Task[None]] = set()
+
+    def _get_session_factory(self) -> "async_sessionmaker[AsyncSession] | None":
+        """Return the injected session factory, or the application's if configured."""
+        if self._session_factory is not None:
+            return self._session_factory
+
+        # Import here to avoid circular imports
+        from app.db.database import AsyncSessionLocal
+
+        return AsyncSessionLocal
 
     def _persist_to_db(
         self,
@@ -101,62 +141,67 @@ class AuditLogger:
         details: dict[str, Any] | None = None,
     ) -> None:
         """
-        Persist audit log to database asynchronously.
+        Queue an audit log row for the database.
 
-        Uses fire-and-forget pattern to avoid blocking the main operation.
+        Rows are buffered and written in batches by flush(), so a burst of
+        actions costs one transaction instead of one task and commit each.
         Falls back gracefully if database is not available.
         """
         try:
-            # Import here to avoid circular imports
-            from app.db.database import AsyncSessionLocal
-            from app.db.models import AuditLogDB
-
             # Skip if database is not configured
-            if AsyncSessionLocal is None:
+            if self._get_session_factory() is None:
                 return
 
-            async def _save_log() -> None:
-                try:
-                    # Try to parse record_id as UUID, fall back to None
-                    parsed_record_id = None
-                    if record_id:
-                        try:
-                            parsed_record_id = uuid.UUID(record_id)
-                        except (ValueError, AttributeError):
-                            # Not a valid UUID - store original in details
-                            pass
-
-                    # Include original identifier in details if not a valid UUID
-                    final_details = details.copy() if details else {}
-                    if record_id and parsed_record_id is None:
-                        final_details["identifier"] = record_id
-
-                    async with AsyncSessionLocal() as session:
-                        log_entry = AuditLogDB(
-                            action=action,
-                            record_id=parsed_record_id,
-                            user_id=user_id,
-                            details=final_details if final_details else None,
-                        )
-                        session.add(log_entry)
-                        await session.commit()
-                except Exception as e:
-                    # Don't fail the main operation if audit logging fails
-                    self._logger.warning(
-                        "audit_db_persist_failed",
-                        action=action,
-                        error=str(e),
-                    )
-
             # Try to get the running event loop
             try:
                 loop = asyncio.get_running_loop()
-                # If we're in an async context, create a task
-                loop.create_task(_save_log())
             except RuntimeError:
-                # No running loop - we're in sync context, skip DB persist
+                # A worker thread bound by bind_loop() queues the row on its
+                # caller's loop; any other sync context skips DB persist.
                 # The log still goes to stdout via structlog
-                pass
+                owner = _owner_loop.get()
+                if owner is not None and not owner.is_closed():
+                    owner.call_soon_threadsafe(
+                        self._persist_to_db, action, record_id, user_id, details
+                    )
+                return
+
+            # Try to parse record_id as UUID, fall back to None
+            parsed_record_id = None
+            if record_id:
+                try:
+                    parsed_record_id = uuid.UUID(record_id)
+                except (ValueError, AttributeError):
+                    # Not a valid UUID - store original in details
+                    pass
+
+            # Include original identifier in details if not a valid UUID
+            final_details = details.copy() if details else {}
+            if record_id and parsed_record_id is None:
+                final_details["identifier"] = record_id
+
+            # Stamp the row now; the insert may run up to FLUSH_INTERVAL later
+            self._buffer.append(
+                {
+                    "action": action,
+                    "record_id": parsed_record_id,
+                    "user_id": user_id,
+                    "details": final_details if final_details else None,
+                    "timestamp": datetime.now(UTC),
+                }
+            )
+
+            if len(self._buffer) >= self.FLUSH_SIZE:
+                task = loop.create_task(self.flush())
+                self._pending_flushes.add(task)
+                task.add_done_callback(self._pending_flushes.discard)
+            elif (
+                self._flush_task is None
+                or self._flush_task.done()
+                # A task left pending on an earlier (closed) loop never runs
+                or self._flush_task.get_loop() is not loop
+            ):
+                self._flush_task = loop.create_task(self._flush_later())
 
         except Exception as e:
             # Graceful fallback - don't crash if import fails
@@ -166,6 +211,81 @@ class AuditLogger:
                 error=str(e),
             )
 
+    def bind_loop(self) -> None:
+        """
+        Route rows from worker threads started by the caller to its loop.
+
+        Call before asyncio.to_thread; the binding lasts for the rest of the
+        calling task.
+        """
+        _owner_loop.set(asyncio.get_running_loop())
+
+    async def _flush_later(self) -> None:
+        """Flush the buffer once FLUSH_INTERVAL has passed."""
+        await asyncio.sleep(self.FLUSH_INTERVAL)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """
+        Write all buffered audit rows to the database in one transaction.
+
+        If the batch fails, each row is retried in its own transaction.
+        """
+        # The timer has nothing left to flush once the buffer is taken here,
+        # and rows queued during the commit below should start a new one
+        timer, self._flush_task = self._flush_task, None
+        if (
+            timer is not None
+            and timer is not asyncio.current_task()
+            and timer.get_loop() is asyncio.get_running_loop()
+        ):
+            timer.cancel()
+
+        if not self._buffer:
+            return
+
+        rows, self._buffer = self._buffer, []
+
+        try:
+            await self._write_rows(rows)
+        except Exception as e:
+            if len(rows) == 1:
+                # Don't fail the main operation if audit logging fails
+                self._logger.warning("audit_db_persist_failed", count=1, error=str(e))
+                return
+
+            # Retry one row per transaction so a bad row or a transient
+            # error loses only the rows that still fail, not the whole batch
+            for row in rows:
+                try:
+                    await self._write_rows([row])
+                except Exception as e:
+                    self._logger.warning(
+                        "audit_db_persist_failed",
+                        count=1,
+                        action=row["action"],
+                        error=str(e),
+                    )
+
+    async def _write_rows(self, rows: list[dict[str, Any]]) -> None:
+        """Insert rows in one transaction, raising on any database error."""
+        # Import here to avoid circular imports
+        from app.db.models import AuditLogDB
+
+        session_factory = self._get_session_factory()
+        if session_factory is None:
+            return
+
+        async with session_factory() as session:
+            session.add_all([AuditLogDB(**row) for row in rows])
+            await session.commit()
+
+    async def close(self) -> None:
+        """Flush buffered rows and wait for batch writes still in flight."""
+        await self.flush()
+        if self._pending_flushes:
+            await asyncio.gather(*self._pending_flushes)
+
     def log_extraction_started(
         self,
         file_path: str,
@@ -2,11 +2,14 @@
 Base extractor class defining the interface for all extractors.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Generic, TypeVar
 from uuid import uuid4
 
+from bs4 import BeautifulSoup
+
 from app.core.logging import audit_logger, get_logger
 from app.models.schemas import ExtractionResult, RecordType
 
@@ -14,6 +17,9 @@ logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+# C-backed parser; much faster than the pure-Python "html.parser"
+HTML_PARSER = "lxml"
+
 
 class BaseExtractor(ABC, Generic[T]):
     """
@@ -25,8 +31,9 @@ class BaseExtractor(ABC, Generic[T]):
 
     record_type: RecordType
 
-    def __init__(self) -> None:
+    def __init__(self, html_parser: str = HTML_PARSER) -> None:
         self.logger = get_logger(self.__class__.__name__)
+        self.html_parser = html_parser
 
     @abstractmethod
     def extract(self, file_path: Path) -> ExtractionResult:
@@ -42,6 +49,23 @@ class BaseExtractor(ABC, Generic[T]):
         """
         pass
 
+    async def extract_async(self, file_path: Path) -> ExtractionResult:
+        """
+        Extract data from a file in a worker thread.
+
+        Parsing (pdfplumber in particular) is blocking, so async callers
+        await this instead of calling extract() on the event loop.
+
+        Args:
+            file_path: Path to the file to extract data from.
+
+        Returns:
+            ExtractionResult as returned by extract().
+        """
+        # extract() logs its audit events from the worker thread
+        audit_logger.bind_loop()
+        return await asyncio.to_thread(self.extract, file_path)
+
     @abstractmethod
     def validate(self, data: T) -> tuple[bool, list[str]]:
         """
@@ -74,6 +98,41 @@ class BaseExtractor(ABC, Generic[T]):
 
         return file_path.read_text(encoding="utf-8")
 
+    def read_bytes(self, file_path: Path) -> bytes:
+        """
+        Read raw file contents without decoding.
+
+        Args:
+            file_path: Path to the file to read.
+
+        Returns:
+            File contents as bytes.
+
+        Raises:
+            FileNotFoundError: If file doesn't exist.
+        """
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        return file_path.read_bytes()
+
+    def parse_html(self, html: str | bytes) -> BeautifulSoup:
+        """
+        Parse HTML content with the extractor's configured parser.
+
+        Raw bytes are handed to the parser as UTF-8 directly, skipping both
+        the str decode and BeautifulSoup's encoding detection.
+
+        Args:
+            html: HTML markup to parse.
+
+        Returns:
+            Parsed BeautifulSoup document.
+        """
+        if isinstance(html, bytes):
+            return BeautifulSoup(html, self.html_parser, from_encoding="utf-8")
+        return BeautifulSoup(html, self.html_parser)
+
     def _create_result(
         self,
         source_file: str,
@@ -97,25 +156,25 @@ class BaseExtractor(ABC, Generic[T]):
         """
         from app.models.schemas import ContactFormData, EmailData, InvoiceData
 
-        result = ExtractionResult(
+        # Results are frozen, so the data field is chosen up front
+        data_field: dict[str, ContactFormData | EmailData | InvoiceData] = {}
+        if isinstance(data, ContactFormData):
+            data_field["form_data"] = data
+        elif isinstance(data, EmailData):
+            data_field["email_data"] = data
+        elif isinstance(data, InvoiceData):
+            data_field["invoice_data"] = data
+
+        return ExtractionResult(
             id=uuid4(),
             source_file=source_file,
             record_type=self.record_type,
             confidence_score=confidence,
             warnings=warnings or [],
             errors=errors or [],
+            **data_field,
         )
 
-        # Set the appropriate data field based on type
-        if isinstance(data, ContactFormData):
-            result.form_data = data
-        elif isinstance(data, EmailData):
-            result.email_data = data
-        elif isinstance(data, InvoiceData):
-            result.invoice_data = data
-
-        return result
-
     def _log_extraction(
         self,
         file_path: Path,
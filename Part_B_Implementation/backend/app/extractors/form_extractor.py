@@ -3,8 +3,10 @@ Form Extractor for HTML contact forms.
 Uses BeautifulSoup for reliable HTML parsing.
 """
 
+import re
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 
 from bs4 import BeautifulSoup
 
@@ -19,8 +21,8 @@ from app.models.schemas import (
 
 logger = get_logger(__name__)
 
-# Mapping of Greek priority values to enum
-PRIORITY_MAP = {
+# Mapping of Greek priority values to enum (keys are casefolded)
+PRIORITY_MAP = MappingProxyType({
     "υψηλή": Priority.HIGH,
     "υψηλη": Priority.HIGH,
     "high": Priority.HIGH,
@@ -30,7 +32,7 @@ PRIORITY_MAP = {
     "χαμηλή": Priority.LOW,
     "χαμηλη": Priority.LOW,
     "low": Priority.LOW,
-}
+})
 
 # Mapping of Greek service names to standardized values
 SERVICE_MAP = {
@@ -47,6 +49,28 @@ SERVICE_MAP = {
     "other": "Άλλο",
 }
 
+# Form fields to extract, in lookup order
+FORM_FIELD_NAMES = (
+    "full_name",
+    "email",
+    "phone",
+    "company",
+    "service",
+    "message",
+    "submission_date",
+    "priority",
+)
+
+# Date formats commonly used in HTML forms, matched in a single pass:
+# HTML5 datetime-local (YYYY-MM-DDTHH:MM), YYYY-MM-DD HH:MM:SS, YYYY-MM-DD,
+# and the Greek DD/MM/YYYY or DD-MM-YYYY
+_DATE_RE = re.compile(
+    r"(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})"
+    r"(?:T(?P<hour>\d{1,2}):(?P<minute>\d{1,2})"
+    r"| (?P<hour_s>\d{1,2}):(?P<minute_s>\d{1,2}):(?P<second>\d{1,2}))?"
+    r"|(?P<eu_day>\d{1,2})(?P<sep>[/-])(?P<eu_month>\d{1,2})(?P=sep)(?P<eu_year>\d{4})"
+)
+
 
 class FormExtractor(BaseExtractor[ContactFormData]):
     """
@@ -65,6 +89,38 @@ class FormExtractor(BaseExtractor[ContactFormData]):
         Args:
             file_path: Path to the HTML file.
 
+        Returns:
+            ExtractionResult with ContactFormData.
+        """
+        try:
+            html_content = self.read_bytes(file_path)
+        except FileNotFoundError as e:
+            self._log_extraction(file_path, file_path.name, False, error_message=str(e))
+            return self._create_result(
+                source_file=file_path.name,
+                errors=[f"File not found: {file_path}"],
+                confidence=0.0,
+            )
+        except OSError as e:
+            self.logger.error("form_extraction_error", file=str(file_path), error=str(e))
+            self._log_extraction(file_path, file_path.name, False, error_message=str(e))
+            return self._create_result(
+                source_file=file_path.name,
+                errors=[f"Extraction error: {str(e)}"],
+                confidence=0.0,
+            )
+
+        return self.extract_from_bytes(html_content, file_path)
+
+    def extract_from_bytes(self, html_content: bytes, file_path: Path) -> ExtractionResult:
+        """
+        Extract data from HTML contact form markup already in memory.
+
+        Args:
+            html_content: Raw UTF-8 HTML.
+            file_path: Path the markup came from. Only used to name the
+                result and in logs; it is never read.
+
         Returns:
             ExtractionResult with ContactFormData.
         """
@@ -73,9 +129,7 @@ class FormExtractor(BaseExtractor[ContactFormData]):
         errors: list[str] = []
 
         try:
-            # Read and parse HTML
-            html_content = self.read_file(file_path)
-            soup = BeautifulSoup(html_content, "html.parser")
+            soup = self.parse_html(html_content)
 
             # Extract form fields
             extracted = self._extract_form_fields(soup)
@@ -148,14 +202,6 @@ class FormExtractor(BaseExtractor[ContactFormData]):
                 warnings=warnings,
             )
 
-        except FileNotFoundError as e:
-            errors.append(f"File not found: {file_path}")
-            self._log_extraction(file_path, extraction_id, False, error_message=str(e))
-            return self._create_result(
-                source_file=file_path.name,
-                errors=errors,
-                confidence=0.0,
-            )
         except Exception as e:
             self.logger.error("form_extraction_error", file=str(file_path), error=str(e))
             errors.append(f"Extraction error: {str(e)}")
@@ -211,19 +257,7 @@ class FormExtractor(BaseExtractor[ContactFormData]):
         """
         fields: dict[str, str | None] = {}
 
-        # Map of field names to extract
-        field_names = [
-            "full_name",
-            "email",
-            "phone",
-            "company",
-            "service",
-            "message",
-            "submission_date",
-            "priority",
-        ]
-
-        for field_name in field_names:
+        for field_name in FORM_FIELD_NAMES:
             # Try input elements
             input_elem = soup.find("input", {"name": field_name})
             if input_elem and input_elem.get("value"):
@@ -255,29 +289,34 @@ class FormExtractor(BaseExtractor[ContactFormData]):
         if not date_str:
             return None
 
-        formats = [
-            "%Y-%m-%dT%H:%M",  # HTML5 datetime-local
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-            "%d/%m/%Y",
-            "%d-%m-%Y",
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
+        match = _DATE_RE.fullmatch(date_str)
+        if not match:
+            return None
 
-        return None
+        parts = match.groupdict()
+        try:
+            if parts["eu_year"]:
+                return datetime(
+                    int(parts["eu_year"]), int(parts["eu_month"]), int(parts["eu_day"])
+                )
+            return datetime(
+                int(parts["year"]),
+                int(parts["month"]),
+                int(parts["day"]),
+                int(parts["hour"] or parts["hour_s"] or 0),
+                int(parts["minute"] or parts["minute_s"] or 0),
+                int(parts["second"] or 0),
+            )
+        except ValueError:
+            # Well-formed but out of range, e.g. month 13
+            return None
 
     def _parse_priority(self, priority_str: str | None) -> Priority | None:
         """Parse priority string to Priority enum."""
         if not priority_str:
             return None
 
-        priority_lower = priority_str.lower().strip()
-        return PRIORITY_MAP.get(priority_lower)
+        return PRIORITY_MAP.get(priority_str.strip().casefold())
 
     def _standardize_service(self, service: str | None) -> str | None:
         """Standardize service name."""
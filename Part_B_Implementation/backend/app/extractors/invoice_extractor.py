@@ -22,6 +22,80 @@ from app.models.schemas import (
 
 logger = get_logger(__name__)
 
+# Regexes are compiled once at import and shared by all extractor instances
+_INVOICE_NUMBER_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Αριθμός:\s*(TF-\d{4}-\d{3})",
+        r"Invoice #?:?\s*(TF-\d{4}-\d{3})",
+        r"(TF-\d{4}-\d{3})",
+    )
+)
+_INVOICE_NUMBER_RE = re.compile(r"(TF-\d{4}-\d{3})")
+_INVOICE_NUMBER_FORMAT_RE = re.compile(r"^TF-\d{4}-\d{3}$")
+
+_DATE_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"Ημερομηνία:\s*(\d{1,2})/(\d{1,2})/(\d{4})",
+        r"Date:\s*(\d{1,2})/(\d{1,2})/(\d{4})",
+        r"(\d{1,2})/(\d{1,2})/(\d{4})",
+    )
+)
+
+_CLIENT_NAME_RE = re.compile(r"Πελάτης:\s*(?:\n)?(.+?)(?:\n|Βας\.|Λεωφ\.|$)", re.IGNORECASE)
+_CLIENT_LABEL_RE = re.compile(r"Πελάτης", re.IGNORECASE)
+_VAT_NUMBER_RE = re.compile(r"ΑΦΜ:\s*(\d{9})")
+_ADDRESS_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"((?:Βας\.|Λεωφ\.|Πλ\.)[^\n\d]*\d+[^\n]*)",
+        r"(\d{5}\s+\w+)",  # Postal code and city
+    )
+)
+
+_ITEMS_HEADER_RE = re.compile(r"Περιγραφή|Description", re.IGNORECASE)
+
+_NET_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Καθαρή Αξία:\s*€?([\d,\.]+)",
+        r"Net Amount:\s*€?([\d,\.]+)",
+        r"Subtotal:\s*€?([\d,\.]+)",
+    )
+)
+_VAT_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"ΦΠΑ\s*(\d+)%:\s*€?([\d,\.]+)",
+        r"VAT\s*(\d+)%:\s*€?([\d,\.]+)",
+    )
+)
+_TOTAL_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"ΣΥΝΟΛΟ:\s*€?([\d,\.]+)",
+        r"Total:\s*€?([\d,\.]+)",
+        r"Σύνολο Πληρωτέο:\s*€?([\d,\.]+)",
+    )
+)
+
+_PAYMENT_TERMS_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Τρόπος Πληρωμής:\s*(.+?)(?:\n|$)",
+        r"Payment Terms?:\s*(.+?)(?:\n|$)",
+        r"Πληρωμή:\s*(.+?)(?:\n|$)",
+    )
+)
+_NOTES_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in (
+        r"Σημειώσεις:\s*(.+?)(?:\n\n|$)",
+        r"Notes:\s*(.+?)(?:\n\n|$)",
+    )
+)
+
 
 class InvoiceExtractor(BaseExtractor[InvoiceData]):
     """
@@ -43,6 +117,38 @@ class InvoiceExtractor(BaseExtractor[InvoiceData]):
         Args:
             file_path: Path to the HTML invoice file.
 
+        Returns:
+            ExtractionResult with InvoiceData.
+        """
+        try:
+            html_content = self.read_bytes(file_path)
+        except FileNotFoundError as e:
+            self._log_extraction(file_path, file_path.name, False, error_message=str(e))
+            return self._create_result(
+                source_file=file_path.name,
+                errors=[f"File not found: {file_path}"],
+                confidence=0.0,
+            )
+        except OSError as e:
+            self.logger.error("invoice_extraction_error", file=str(file_path), error=str(e))
+            self._log_extraction(file_path, file_path.name, False, error_message=str(e))
+            return self._create_result(
+                source_file=file_path.name,
+                errors=[f"Extraction error: {str(e)}"],
+                confidence=0.0,
+            )
+
+        return self.extract_from_bytes(html_content, file_path)
+
+    def extract_from_bytes(self, html_content: bytes, file_path: Path) -> ExtractionResult:
+        """
+        Extract data from HTML invoice markup already in memory.
+
+        Args:
+            html_content: Raw UTF-8 HTML.
+            file_path: Path the markup came from. Only used to name the
+                result and in logs; it is never read.
+
         Returns:
             ExtractionResult with InvoiceData.
         """
@@ -51,22 +157,22 @@ class InvoiceExtractor(BaseExtractor[InvoiceData]):
         errors: list[str] = []
 
         try:
-            # Read and parse HTML
-            html_content = self.read_file(file_path)
-            soup = BeautifulSoup(html_content, "html.parser")
+            soup = self.parse_html(html_content)
+            # Flatten the document once and share it across the helpers
+            text = soup.get_text()
 
             # Extract invoice metadata
-            invoice_number = self._extract_invoice_number(soup, file_path.name)
+            invoice_number = self._extract_invoice_number(soup, file_path.name, text)
             if not invoice_number:
                 errors.append("Could not extract invoice number")
 
-            invoice_date = self._extract_date(soup)
+            invoice_date = self._extract_date(soup, text)
             if not invoice_date:
                 warnings.append("Could not parse invoice date, using current time")
                 invoice_date = datetime.utcnow()
 
             # Extract client info
-            client_info = self._extract_client_info(soup)
+            client_info = self._extract_client_info(soup, text)
             if not client_info.get("name"):
                 errors.append("Could not extract client name")
 
@@ -76,7 +182,7 @@ class InvoiceExtractor(BaseExtractor[InvoiceData]):
                 warnings.append("No line items found in invoice")
 
             # Extract totals
-            totals = self._extract_totals(soup)
+            totals = self._extract_totals(soup, text)
             if not totals.get("net_amount"):
                 # Try to calculate from items
                 if items:
@@ -87,10 +193,10 @@ class InvoiceExtractor(BaseExtractor[InvoiceData]):
                     errors.append("Could not extract invoice amounts")
 
             # Extract payment terms
-            payment_terms = self._extract_payment_terms(soup)
+            payment_terms = self._extract_payment_terms(soup, text)
 
             # Extract notes
-            notes = self._extract_notes(soup)
+            notes = self._extract_notes(soup, text)
 
             if errors:
                 self._log_extraction(
@@ -158,14 +264,6 @@ class InvoiceExtractor(BaseExtractor[InvoiceData]):
                 warnings=warnings,
             )
 
-        except FileNotFoundError as e:
-            errors.append(f"File not found: {file_path}")
-            self._log_extraction(file_path, extraction_id, False, error_message=str(e))
-            return self._create_result(
-                source_file=file_path.name,
-                errors=errors,
-                confidence=0.0,
-            )
         except Exception as e:
             self.logger.error("invoice_extraction_error", file=str(file_path), error=str(e))
             errors.append(f"Extraction error: {str(e)}")
@@ -190,7 +288,7 @@ class InvoiceExtractor(BaseExtractor[InvoiceData]):
         is_valid = True
 
         # Check invoice number format
-        if not re.match(r"^TF-\d{4}-\d{3}$", data.invoice_number):
+        if not _INVOICE_NUMBER_FORMAT_RE.match(data.invoice_number):
             messages.append("Invoice number doesn't match expected format TF-YYYY-NNN")
 
         # Verify VAT calculation (24% standard Greek VAT)
@@ -218,56 +316,49 @@ class InvoiceExtractor(BaseExtractor[InvoiceData]):
         return is_valid, messages
 
     def _extract_invoice_number(
-        self, soup: BeautifulSoup, filename: str
+        self, soup: BeautifulSoup, filename: str, text: str | None = None
     ) -> str | None:
         """Extract invoice number from HTML."""
         # Try to find in text content
-        text = soup.get_text()
-
-        # Pattern for TechFlow invoice numbers
-        patterns = [
-            r"Αριθμός:\s*(TF-\d{4}-\d{3})",
-            r"Invoice #?:?\s*(TF-\d{4}-\d{3})",
-            r"(TF-\d{4}-\d{3})",
-        ]
+        if text is None:
+            text = soup.get_text()
 
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        # Patterns for TechFlow invoice numbers
+        for pattern in _INVOICE_NUMBER_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
 
         # Try to extract from filename
         if "TF-" in filename:
-            match = re.search(r"(TF-\d{4}-\d{3})", filename)
+            match = _INVOICE_NUMBER_RE.search(filename)
             if match:
                 return match.group(1)
 
         return None
 
-    def _extract_date(self, soup: BeautifulSoup) -> datetime | None:
+    def _extract_date(
+        self, soup: BeautifulSoup, text: str | None = None
+    ) -> datetime | None:
         """Extract invoice date from HTML."""
-        text = soup.get_text()
+        if text is None:
+            text = soup.get_text()
 
-        # Patterns for date extraction
-        patterns = [
-            r"Ημερομηνία:\s*(\d{1,2}/\d{1,2}/\d{4})",
-            r"Date:\s*(\d{1,2}/\d{1,2}/\d{4})",
-            r"(\d{1,2}/\d{1,2}/\d{4})",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
-                date_str = match.group(1)
+                day, month, year = match.groups()
                 try:
                     # Greek format: DD/MM/YYYY
-                    return datetime.strptime(date_str, "%d/%m/%Y")
+                    return datetime(int(year), int(month), int(day))
                 except ValueError:
                     continue
 
         return None
 
-    def _extract_client_info(self, soup: BeautifulSoup) -> dict[str, str | None]:
+    def _extract_client_info(
+        self, soup: BeautifulSoup, text: str | None = None
+    ) -> dict[str, str | None]:
         """Extract client information from HTML."""
         info: dict[str, str | None] = {
             "name": None,
@@ -275,19 +366,18 @@ class InvoiceExtractor(BaseExtractor[InvoiceData]):
             "vat_number": None,
         }
 
-        text = soup.get_text()
+        if text is None:
+            text = soup.get_text()
 
         # Find client name after "Πελάτης:" label
-        client_match = re.search(
-            r"Πελάτης:\s*(?:\n)?(.+?)(?:\n|Βας\.|Λεωφ\.|$)", text, re.IGNORECASE
-        )
+        client_match = _CLIENT_NAME_RE.search(text)
         if client_match:
             info["name"] = client_match.group(1).strip()
 
         # If not found, look for company name patterns
         if not info["name"]:
             # Look for text after "Πελάτης" in a div
-            client_div = soup.find(string=re.compile(r"Πελάτης", re.IGNORECASE))
+            client_div = soup.find(string=_CLIENT_LABEL_RE)
             if client_div:
                 parent = client_div.parent
                 if parent:
@@ -300,22 +390,18 @@ class InvoiceExtractor(BaseExtractor[InvoiceData]):
                             break
 
         # Extract VAT number (ΑΦΜ)
-        vat_match = re.search(r"ΑΦΜ:\s*(\d{9})", text)
+        vat_match = _VAT_NUMBER_RE.search(text)
         if vat_match:
             # Second occurrence is typically client VAT
-            all_vat = re.findall(r"ΑΦΜ:\s*(\d{9})", text)
+            all_vat = _VAT_NUMBER_RE.findall(text)
             if len(all_vat) > 1:
                 info["vat_number"] = all_vat[1]
             elif all_vat:
                 info["vat_number"] = all_vat[0]
 
         # Extract address
-        addr_patterns = [
-            r"((?:Βας\.|Λεωφ\.|Πλ\.)[^\n\d]*\d+[^\n]*)",
-            r"(\d{5}\s+\w+)",  # Postal code and city
-        ]
-        for pattern in addr_patterns:
-            addr_match = re.search(pattern, text)
+        for pattern in _ADDRESS_PATTERNS:
+            addr_match = pattern.search(text)
             if addr_match:
                 info["address"] = addr_match.group(1).strip()
                 break
@@ -332,7 +418,7 @@ class InvoiceExtractor(BaseExtractor[InvoiceData]):
             # Try to find any table with item-like structure
             tables = soup.find_all("table")
             for t in tables:
-                if t.find("th", string=re.compile(r"Περιγραφή|Description", re.I)):
+                if t.find("th", string=_ITEMS_HEADER_RE):
                     table = t
                     break
 
@@ -372,7 +458,9 @@ class InvoiceExtractor(BaseExtractor[InvoiceData]):
 
         return items
 
-    def _extract_totals(self, soup: BeautifulSoup) -> dict[str, Decimal | None]:
+    def _extract_totals(
+        self, soup: BeautifulSoup, text: str | None = None
+    ) -> dict[str, Decimal | None]:
         """Extract financial totals from invoice."""
         totals: dict[str, Decimal | None] = {
             "net_amount": None,
@@ -381,74 +469,56 @@ class InvoiceExtractor(BaseExtractor[InvoiceData]):
             "total_amount": None,
         }
 
-        text = soup.get_text()
+        if text is None:
+            text = soup.get_text()
 
         # Extract net amount
-        net_patterns = [
-            r"Καθαρή Αξία:\s*€?([\d,\.]+)",
-            r"Net Amount:\s*€?([\d,\.]+)",
-            r"Subtotal:\s*€?([\d,\.]+)",
-        ]
-        for pattern in net_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _NET_PATTERNS:
+            match = pattern.search(text)
             if match:
                 totals["net_amount"] = self._parse_amount(match.group(1))
                 break
 
         # Extract VAT
-        vat_patterns = [
-            r"ΦΠΑ\s*(\d+)%:\s*€?([\d,\.]+)",
-            r"VAT\s*(\d+)%:\s*€?([\d,\.]+)",
-        ]
-        for pattern in vat_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _VAT_PATTERNS:
+            match = pattern.search(text)
             if match:
                 totals["vat_rate"] = Decimal(match.group(1))
                 totals["vat_amount"] = self._parse_amount(match.group(2))
                 break
 
         # Extract total
-        total_patterns = [
-            r"ΣΥΝΟΛΟ:\s*€?([\d,\.]+)",
-            r"Total:\s*€?([\d,\.]+)",
-            r"Σύνολο Πληρωτέο:\s*€?([\d,\.]+)",
-        ]
-        for pattern in total_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _TOTAL_PATTERNS:
+            match = pattern.search(text)
             if match:
                 totals["total_amount"] = self._parse_amount(match.group(1))
                 break
 
         return totals
 
-    def _extract_payment_terms(self, soup: BeautifulSoup) -> str | None:
+    def _extract_payment_terms(
+        self, soup: BeautifulSoup, text: str | None = None
+    ) -> str | None:
         """Extract payment terms from invoice."""
-        text = soup.get_text()
-
-        patterns = [
-            r"Τρόπος Πληρωμής:\s*(.+?)(?:\n|$)",
-            r"Payment Terms?:\s*(.+?)(?:\n|$)",
-            r"Πληρωμή:\s*(.+?)(?:\n|$)",
-        ]
+        if text is None:
+            text = soup.get_text()
 
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _PAYMENT_TERMS_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
 
         return None
 
-    def _extract_notes(self, soup: BeautifulSoup) -> str | None:
+    def _extract_notes(
+        self, soup: BeautifulSoup, text: str | None = None
+    ) -> str | None:
         """Extract notes from invoice."""
-        text = soup.get_text()
-
-        patterns = [
-            r"Σημειώσεις:\s*(.+?)(?:\n\n|$)",
-            r"Notes:\s*(.+?)(?:\n\n|$)",
-        ]
+        if text is None:
+            text = soup.get_text()
 
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in _NOTES_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
 
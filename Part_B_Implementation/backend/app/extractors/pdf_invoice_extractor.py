@@ -4,10 +4,14 @@ Uses pdfplumber for reliable PDF parsing.
 Extracts invoice details, line items, and totals from PDF invoices.
 """
 
+import importlib.util
 import re
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
+from functools import cache
+from itertools import islice
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 from app.core.logging import get_logger
@@ -21,16 +25,118 @@ from app.models.schemas import (
 
 logger = get_logger(__name__)
 
-# Try to import pdfplumber, handle if not installed
-try:
-    import pdfplumber
-    PDF_SUPPORT = True
-except ImportError:
-    pdfplumber = None  # type: ignore
-    PDF_SUPPORT = False
+# pdfplumber (with pdfminer underneath) is slow to import, so only check
+# that it is installed here and import it on the first PDF extraction
+PDF_SUPPORT = importlib.util.find_spec("pdfplumber") is not None
+if not PDF_SUPPORT:
     logger.warning("pdfplumber not installed, PDF extraction disabled")
 
 
+@cache
+def _get_pdfplumber() -> ModuleType | None:
+    """Import pdfplumber once, returning None if the import fails."""
+    try:
+        import pdfplumber
+    except ImportError:
+        logger.warning("pdfplumber failed to import, PDF extraction disabled")
+        return None
+    return pdfplumber
+
+
+# Regexes are compiled once at import and shared by all extractor instances
+_INVOICE_NUMBER_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Αριθμός:\s*([A-Z]{2,3}-\d{4}-\d{3})",
+        r"Invoice\s*#?\s*:?\s*([A-Z]{2,3}-\d{4}-\d{3})",
+        r"Αρ\.\s*Τιμολογίου:\s*([A-Z0-9-]+)",
+        r"([A-Z]{2,3}-\d{4}-\d{3})",
+    )
+)
+_INVOICE_NUMBER_RE = re.compile(r"([A-Z]{2,3}-\d{4}-\d{3})")
+_INVOICE_NUMBER_FORMAT_RE = re.compile(r"^[A-Z]{2,3}-\d{4}-\d{3}$")
+
+_DATE_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"Ημερομηνία:\s*(\d{1,2})/(\d{1,2})/(\d{4})",
+        r"Date:\s*(\d{1,2})/(\d{1,2})/(\d{4})",
+        r"Ημ/νία:\s*(\d{1,2})/(\d{1,2})/(\d{4})",
+        r"(\d{1,2})/(\d{1,2})/(\d{4})",
+    )
+)
+
+_CLIENT_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in (
+        r"Πελάτης:\s*(.+?)(?:\n|ΑΦΜ|Διεύθυνση)",
+        r"Προς:\s*(.+?)(?:\n|ΑΦΜ)",
+        r"Bill To:\s*(.+?)(?:\n|VAT)",
+    )
+)
+_VAT_NUMBER_RE = re.compile(r"ΑΦΜ:\s*(\d{9})")
+_ADDRESS_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Διεύθυνση:\s*([^\n]+)",
+        r"((?:Οδός|Λεωφ\.|Βας\.)[^,\n]+,?\s*\d{5}\s*\w+)",
+    )
+)
+
+# Header keywords that mark a table as holding invoice line items
+_ITEM_TABLE_HEADERS = ("περιγραφή", "description", "ποσότητα", "quantity")
+
+# Line items in text format, e.g. "Service Description    1    €500.00    €500.00"
+_TEXT_LINE_ITEM_RE = re.compile(r"([A-Za-zΑ-Ωα-ω\s]+)\s+(\d+)\s+€?([\d,.]+)\s+€?([\d,.]+)")
+
+_NET_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Καθαρή Αξία:?\s*€?([\d,\.]+)",
+        r"Net Amount:?\s*€?([\d,\.]+)",
+        r"Σύνολο:?\s*€?([\d,\.]+)(?:\s*ΦΠΑ)",
+        r"Υποσύνολο:?\s*€?([\d,\.]+)",
+    )
+)
+_VAT_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"ΦΠΑ\s*(\d+)%:?\s*€?([\d,\.]+)",
+        r"VAT\s*(\d+)%:?\s*€?([\d,\.]+)",
+    )
+)
+_TOTAL_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"ΣΥΝΟΛΟ:?\s*€?([\d,\.]+)",
+        r"Total:?\s*€?([\d,\.]+)",
+        r"Πληρωτέο:?\s*€?([\d,\.]+)",
+        r"ΠΛΗΡΩΤΕΟ:?\s*€?([\d,\.]+)",
+    )
+)
+
+_PAYMENT_TERMS_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Τρόπος Πληρωμής:?\s*(.+?)(?:\n|$)",
+        r"Payment Terms?:?\s*(.+?)(?:\n|$)",
+        r"Πληρωμή:?\s*(.+?)(?:\n|$)",
+    )
+)
+_NOTES_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in (
+        r"Σημειώσεις:?\s*(.+?)(?:\n\n|$)",
+        r"Notes:?\s*(.+?)(?:\n\n|$)",
+        r"Παρατηρήσεις:?\s*(.+?)(?:\n\n|$)",
+    )
+)
+
+# Currency symbol and plain spaces dropped before parsing amounts; other
+# whitespace (NBSP, newlines) is only trimmed from the ends
+_AMOUNT_STRIP = str.maketrans("", "", "€ ")
+
+
 class PDFInvoiceExtractor(BaseExtractor[InvoiceData]):
     """
     Extractor for PDF invoices.
@@ -78,7 +184,8 @@ class PDFInvoiceExtractor(BaseExtractor[InvoiceData]):
         warnings: list[str] = []
         errors: list[str] = []
 
-        if not PDF_SUPPORT:
+        pdfplumber = _get_pdfplumber() if PDF_SUPPORT else None
+        if pdfplumber is None:
             errors.append("PDF extraction not supported - pdfplumber not installed")
             return self._create_result(
                 source_file=file_path.name,
@@ -247,7 +354,7 @@ class PDFInvoiceExtractor(BaseExtractor[InvoiceData]):
         is_valid = True
 
         # Check invoice number format (flexible for PDF)
-        if not re.match(r"^[A-Z]{2,3}-\d{4}-\d{3}$", data.invoice_number):
+        if not _INVOICE_NUMBER_FORMAT_RE.match(data.invoice_number):
             if not data.invoice_number.startswith("UNKNOWN"):
                 messages.append("Invoice number format not recognized")
 
@@ -269,21 +376,14 @@ class PDFInvoiceExtractor(BaseExtractor[InvoiceData]):
 
     def _extract_invoice_number(self, text: str, filename: str) -> str | None:
         """Extract invoice number from PDF text."""
-        patterns = [
-            r"Αριθμός:\s*([A-Z]{2,3}-\d{4}-\d{3})",
-            r"Invoice\s*#?\s*:?\s*([A-Z]{2,3}-\d{4}-\d{3})",
-            r"Αρ\.\s*Τιμολογίου:\s*([A-Z0-9-]+)",
-            r"([A-Z]{2,3}-\d{4}-\d{3})",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _INVOICE_NUMBER_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
 
         # Try from filename
         if "-" in filename:
-            match = re.search(r"([A-Z]{2,3}-\d{4}-\d{3})", filename.upper())
+            match = _INVOICE_NUMBER_RE.search(filename.upper())
             if match:
                 return match.group(1)
 
@@ -291,19 +391,13 @@ class PDFInvoiceExtractor(BaseExtractor[InvoiceData]):
 
     def _extract_date(self, text: str) -> datetime | None:
         """Extract invoice date from PDF text."""
-        patterns = [
-            r"Ημερομηνία:\s*(\d{1,2}/\d{1,2}/\d{4})",
-            r"Date:\s*(\d{1,2}/\d{1,2}/\d{4})",
-            r"Ημ/νία:\s*(\d{1,2}/\d{1,2}/\d{4})",
-            r"(\d{1,2}/\d{1,2}/\d{4})",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
-                date_str = match.group(1)
+                day, month, year = match.groups()
                 try:
-                    return datetime.strptime(date_str, "%d/%m/%Y")
+                    # Greek format: DD/MM/YYYY
+                    return datetime(int(year), int(month), int(day))
                 except ValueError:
                     continue
 
@@ -318,33 +412,22 @@ class PDFInvoiceExtractor(BaseExtractor[InvoiceData]):
         }
 
         # Client name
-        client_patterns = [
-            r"Πελάτης:\s*(.+?)(?:\n|ΑΦΜ|Διεύθυνση)",
-            r"Προς:\s*(.+?)(?:\n|ΑΦΜ)",
-            r"Bill To:\s*(.+?)(?:\n|VAT)",
-        ]
-        for pattern in client_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in _CLIENT_PATTERNS:
+            match = pattern.search(text)
             if match:
                 info["name"] = match.group(1).strip().split("\n")[0].strip()
                 break
 
         # VAT number
-        vat_match = re.search(r"ΑΦΜ:\s*(\d{9})", text)
-        if vat_match:
-            all_vat = re.findall(r"ΑΦΜ:\s*(\d{9})", text)
-            if len(all_vat) > 1:
-                info["vat_number"] = all_vat[1]  # Client VAT is usually second
-            elif all_vat:
-                info["vat_number"] = all_vat[0]
+        all_vat = _VAT_NUMBER_RE.findall(text)
+        if len(all_vat) > 1:
+            info["vat_number"] = all_vat[1]  # Client VAT is usually second
+        elif all_vat:
+            info["vat_number"] = all_vat[0]
 
         # Address
-        addr_patterns = [
-            r"Διεύθυνση:\s*([^\n]+)",
-            r"((?:Οδός|Λεωφ\.|Βας\.)[^,\n]+,?\s*\d{5}\s*\w+)",
-        ]
-        for pattern in addr_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _ADDRESS_PATTERNS:
+            match = pattern.search(text)
             if match:
                 info["address"] = match.group(1).strip()
                 break
@@ -362,44 +445,40 @@ class PDFInvoiceExtractor(BaseExtractor[InvoiceData]):
                 continue
 
             # Check if this looks like an invoice items table
-            header = table[0] if table else []
-            header_text = " ".join(str(h or "") for h in header).lower()
-            
-            if not any(x in header_text for x in ["περιγραφή", "description", "ποσότητα", "quantity"]):
+            header_text = " ".join(str(h or "") for h in table[0]).lower()
+            if not any(x in header_text for x in _ITEM_TABLE_HEADERS):
                 continue
 
             # Process rows (skip header)
-            for row in table[1:]:
-                if len(row) >= 4:
-                    try:
-                        description = str(row[0] or "").strip()
-                        quantity = int(float(str(row[1] or "0").replace(",", ".")))
-                        unit_price = self._parse_amount(str(row[2] or "0"))
-                        total = self._parse_amount(str(row[3] or "0"))
-
-                        if description and unit_price and total:
-                            items.append(
-                                InvoiceItem(
-                                    description=description,
-                                    quantity=quantity or 1,
-                                    unit_price=unit_price,
-                                    total=total,
-                                )
+            for row in islice(table, 1, None):
+                if len(row) < 4:
+                    continue
+                raw_description, raw_quantity, raw_price, raw_total = row[:4]
+                try:
+                    description = str(raw_description or "").strip()
+                    quantity = int(float(str(raw_quantity or "0").replace(",", ".")))
+                    unit_price = self._parse_amount(str(raw_price or "0"))
+                    total = self._parse_amount(str(raw_total or "0"))
+
+                    if description and unit_price and total:
+                        items.append(
+                            InvoiceItem(
+                                description=description,
+                                quantity=quantity or 1,
+                                unit_price=unit_price,
+                                total=total,
                             )
-                    except (ValueError, TypeError, InvalidOperation):
-                        continue
+                        )
+                except (ValueError, TypeError, InvalidOperation):
+                    continue
 
         return items
 
     def _extract_line_items_from_text(self, text: str) -> list[InvoiceItem]:
         """Try to extract line items from plain text (fallback)."""
         items: list[InvoiceItem] = []
-        
-        # Pattern for line items in text format
-        # e.g., "Service Description    1    €500.00    €500.00"
-        pattern = r"([A-Za-zΑ-Ωα-ω\s]+)\s+(\d+)\s+€?([\d,.]+)\s+€?([\d,.]+)"
-        
-        for match in re.finditer(pattern, text):
+
+        for match in _TEXT_LINE_ITEM_RE.finditer(text):
             try:
                 description = match.group(1).strip()
                 quantity = int(match.group(2))
@@ -430,39 +509,23 @@ class PDFInvoiceExtractor(BaseExtractor[InvoiceData]):
         }
 
         # Net amount
-        net_patterns = [
-            r"Καθαρή Αξία:?\s*€?([\d,\.]+)",
-            r"Net Amount:?\s*€?([\d,\.]+)",
-            r"Σύνολο:?\s*€?([\d,\.]+)(?:\s*ΦΠΑ)",
-            r"Υποσύνολο:?\s*€?([\d,\.]+)",
-        ]
-        for pattern in net_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _NET_PATTERNS:
+            match = pattern.search(text)
             if match:
                 totals["net_amount"] = self._parse_amount(match.group(1))
                 break
 
         # VAT
-        vat_patterns = [
-            r"ΦΠΑ\s*(\d+)%:?\s*€?([\d,\.]+)",
-            r"VAT\s*(\d+)%:?\s*€?([\d,\.]+)",
-        ]
-        for pattern in vat_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _VAT_PATTERNS:
+            match = pattern.search(text)
             if match:
                 totals["vat_rate"] = Decimal(match.group(1))
                 totals["vat_amount"] = self._parse_amount(match.group(2))
                 break
 
         # Total
-        total_patterns = [
-            r"ΣΥΝΟΛΟ:?\s*€?([\d,\.]+)",
-            r"Total:?\s*€?([\d,\.]+)",
-            r"Πληρωτέο:?\s*€?([\d,\.]+)",
-            r"ΠΛΗΡΩΤΕΟ:?\s*€?([\d,\.]+)",
-        ]
-        for pattern in total_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _TOTAL_PATTERNS:
+            match = pattern.search(text)
             if match:
                 totals["total_amount"] = self._parse_amount(match.group(1))
                 break
@@ -471,14 +534,8 @@ class PDFInvoiceExtractor(BaseExtractor[InvoiceData]):
 
     def _extract_payment_terms(self, text: str) -> str | None:
         """Extract payment terms from PDF text."""
-        patterns = [
-            r"Τρόπος Πληρωμής:?\s*(.+?)(?:\n|$)",
-            r"Payment Terms?:?\s*(.+?)(?:\n|$)",
-            r"Πληρωμή:?\s*(.+?)(?:\n|$)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _PAYMENT_TERMS_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
 
@@ -486,14 +543,8 @@ class PDFInvoiceExtractor(BaseExtractor[InvoiceData]):
 
     def _extract_notes(self, text: str) -> str | None:
         """Extract notes from PDF text."""
-        patterns = [
-            r"Σημειώσεις:?\s*(.+?)(?:\n\n|$)",
-            r"Notes:?\s*(.+?)(?:\n\n|$)",
-            r"Παρατηρήσεις:?\s*(.+?)(?:\n\n|$)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in _NOTES_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()[:500]  # Limit to 500 chars
 
@@ -504,27 +555,19 @@ class PDFInvoiceExtractor(BaseExtractor[InvoiceData]):
         if not amount_str:
             return None
 
-        # Remove currency symbols and whitespace
-        cleaned = amount_str.replace("€", "").replace(" ", "").strip()
-
-        # Handle different number formats
-        if "," in cleaned and "." in cleaned:
-            last_comma = cleaned.rfind(",")
-            last_dot = cleaned.rfind(".")
-            if last_comma > last_dot:
-                # European format: 1.234,56
-                cleaned = cleaned.replace(".", "").replace(",", ".")
-            else:
-                # US format: 1,234.56
-                cleaned = cleaned.replace(",", "")
-        elif "," in cleaned:
-            parts = cleaned.split(",")
-            if len(parts) == 2 and len(parts[1]) <= 2:
-                # Decimal separator
-                cleaned = cleaned.replace(",", ".")
-            else:
-                # Thousands separator
-                cleaned = cleaned.replace(",", "")
+        cleaned = amount_str.translate(_AMOUNT_STRIP).strip()
+
+        # The rightmost separator is the decimal point if it's a comma that
+        # follows a dot (1.234,56) or is a lone comma before 1-2 digits
+        # (1234,56); otherwise commas are thousands separators
+        last_comma = cleaned.rfind(",")
+        last_dot = cleaned.rfind(".")
+        if last_comma > last_dot and (
+            last_dot >= 0 or (cleaned.count(",") == 1 and len(cleaned) - last_comma <= 3)
+        ):
+            cleaned = cleaned.replace(".", "").replace(",", ".")
+        else:
+            cleaned = cleaned.replace(",", "")
 
         try:
             return Decimal(cleaned)
@@ -9,6 +9,7 @@ Author: Kypraios Chariton
 Date: December 2025
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import Any
 
@@ -18,7 +19,7 @@ from fastapi.responses import JSONResponse
 
 from app.ai.embeddings import get_embedding_status, start_embedding_model_loading
 from app.core.config import settings
-from app.core.logging import get_logger, setup_logging
+from app.core.logging import audit_logger, get_logger, setup_logging
 from app.db.database import close_db, init_db
 from app.routers import extraction_router, records_router
 from app.routers.notifications import router as notifications_router
@@ -33,6 +34,12 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup and shutdown."""
     # Startup
+    # Run new tasks eagerly: coroutines that finish without suspending
+    # (e.g. notifications with no connected clients) skip the scheduler
+    loop = asyncio.get_running_loop()
+    previous_task_factory = loop.get_task_factory()
+    loop.set_task_factory(asyncio.eager_task_factory)
+
     logger.info(
         "application_startup",
         app_name=settings.app_name,
@@ -67,9 +74,14 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     if settings.database_url:
+        # Write out audit rows still waiting for, or in, a batch flush
+        await audit_logger.close()
         await close_db()
         logger.info("database_closed")
 
+    # Hand the loop back as it was, e.g. to a server or test that reuses it
+    loop.set_task_factory(previous_task_factory)
+
     logger.info("application_shutdown")
 
 
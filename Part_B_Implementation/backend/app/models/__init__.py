@@ -0,0 +1,27 @@
+"""Data models and schemas."""
+
+from app.models.schemas import (
+    ContactFormData,
+    EmailData,
+    EmailType,
+    ExtractionRecord,
+    ExtractionResult,
+    ExtractionStatus,
+    InvoiceData,
+    InvoiceItem,
+    Priority,
+    RecordType,
+)
+
+__all__ = [
+    "ContactFormData",
+    "EmailData",
+    "EmailType",
+    "ExtractionRecord",
+    "ExtractionResult",
+    "ExtractionStatus",
+    "InvoiceData",
+    "InvoiceItem",
+    "Priority",
+    "RecordType",
+]
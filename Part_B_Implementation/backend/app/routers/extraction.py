@@ -176,7 +176,7 @@ async def extract_invoice(
         extractor = PDFInvoiceExtractor()
     else:
         extractor = InvoiceExtractor()
-    result = extractor.extract(file_path)
+    result = await extractor.extract_async(file_path)
 
     if result.has_errors:
         raise HTTPException(status_code=422, detail=result.errors)
@@ -280,7 +280,7 @@ async def extract_all_files(
                     if not pdf_invoice_extractor:
                         errors.append({"file": invoice_file.name, "error": "PDF extraction not supported"})
                         continue
-                    result = pdf_invoice_extractor.extract(invoice_file)
+                    result = await pdf_invoice_extractor.extract_async(invoice_file)
                 else:
                     result = html_invoice_extractor.extract(invoice_file)
                 entry = {
@@ -2,18 +2,52 @@
 WebSocket notification service for real-time updates.
 """
 
+import asyncio
+import json
+import time
+from collections.abc import Mapping
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, TypedDict
 from uuid import uuid4
 
 from fastapi import WebSocket
-from starlette.websockets import WebSocketState
 
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+class Notification(TypedDict):
+    """Envelope shared by every notification sent to clients."""
+
+    type: str
+    id: str
+    timestamp: str
+    data: dict[str, Any]
+    message: str
+
+
+# (time.time() it was formatted at, ISO string) for the last timestamp
+_timestamp_cache: tuple[float, str] = (0.0, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time in ISO format, reused for calls within the same millisecond."""
+    global _timestamp_cache
+    now = time.time()
+    cached_at, cached = _timestamp_cache
+    if 0 <= now - cached_at < 0.001:
+        return cached
+    formatted = datetime.fromtimestamp(now, UTC).isoformat()
+    _timestamp_cache = (now, formatted)
+    return formatted
+
+
+def _encode(message: Mapping[str, Any]) -> str:
+    """Serialize a message exactly as Starlette's send_json would."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
 class NotificationManager:
     """
     Manages WebSocket connections and broadcasts notifications.
@@ -26,7 +60,9 @@ class NotificationManager:
 
     def __init__(self):
         """Initialize the notification manager."""
-        self.active_connections: list[WebSocket] = []
+        # Only live sockets: the endpoint disconnects on WebSocketDisconnect
+        # and broadcast() evicts any socket whose send fails
+        self.active_connections: set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket) -> None:
         """
@@ -36,7 +72,7 @@ class NotificationManager:
             websocket: The WebSocket connection to register.
         """
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
         logger.info(
             "websocket_connected",
             total_connections=len(self.active_connections),
@@ -50,7 +86,7 @@ class NotificationManager:
             websocket: The WebSocket connection to remove.
         """
         if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+            self.active_connections.discard(websocket)
             logger.info(
                 "websocket_disconnected",
                 total_connections=len(self.active_connections),
@@ -62,35 +98,74 @@ class NotificationManager:
         """
         Send a message to a specific WebSocket connection.
 
+        Sockets that have been disconnected are skipped.
+
         Args:
             message: The message dictionary to send.
             websocket: The target WebSocket connection.
         """
-        if websocket.client_state == WebSocketState.CONNECTED:
+        if websocket in self.active_connections:
             await websocket.send_json(message)
 
-    async def broadcast(self, message: dict[str, Any]) -> None:
+    async def broadcast(self, message: Mapping[str, Any]) -> None:
         """
         Broadcast a message to all active WebSocket connections.
 
         Args:
             message: The message dictionary to broadcast.
         """
-        disconnected = []
-        for connection in self.active_connections:
+        # Zero or one listener is the common case; skip serialization
+        # entirely when idle and gather()'s task setup for a single client
+        if not self.active_connections:
+            return
+        if len(self.active_connections) == 1:
+            (connection,) = self.active_connections
             try:
-                if connection.client_state == WebSocketState.CONNECTED:
-                    await connection.send_json(message)
+                await connection.send_text(_encode(message))
             except Exception as e:
+                logger.warning("websocket_broadcast_error", error=str(e))
+                self.disconnect(connection)
+            return
+
+        targets = list(self.active_connections)
+
+        # Serialize once rather than once per client
+        payload = _encode(message)
+
+        # Send to all clients concurrently so one slow peer doesn't delay the rest
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in targets),
+            return_exceptions=True,
+        )
+
+        # Clean up connections whose send failed
+        for connection, result in zip(targets, results, strict=True):
+            if isinstance(result, Exception):
                 logger.warning(
                     "websocket_broadcast_error",
-                    error=str(e),
+                    error=str(result),
                 )
-                disconnected.append(connection)
+                self.disconnect(connection)
+
+    async def _notify(
+        self, notification_type: str, data: dict[str, Any], message: str
+    ) -> None:
+        """
+        Wrap a payload in the standard notification envelope and broadcast it.
 
-        # Clean up disconnected connections
-        for conn in disconnected:
-            self.disconnect(conn)
+        Args:
+            notification_type: Notification type, e.g. "record_created".
+            data: Type-specific payload.
+            message: Human-readable summary.
+        """
+        notification: Notification = {
+            "type": notification_type,
+            "id": str(uuid4()),
+            "timestamp": _now_iso(),
+            "data": data,
+            "message": message,
+        }
+        await self.broadcast(notification)
 
     async def notify_record_created(
         self, record_id: str, source_file: str, record_type: str
@@ -103,17 +178,15 @@ class NotificationManager:
             source_file: Source file name.
             record_type: Type of record (FORM, EMAIL, INVOICE).
         """
-        await self.broadcast({
-            "type": "record_created",
-            "id": str(uuid4()),
-            "timestamp": datetime.now(UTC).isoformat(),
-            "data": {
+        await self._notify(
+            "record_created",
+            {
                 "record_id": record_id,
                 "source_file": source_file,
                 "record_type": record_type,
             },
-            "message": f"New {record_type.lower()} extracted from {source_file}",
-        })
+            f"New {record_type.lower()} extracted from {source_file}",
+        )
 
     async def notify_record_approved(
         self, record_id: str, source_file: str, user_id: str | None = None
@@ -126,17 +199,15 @@ class NotificationManager:
             source_file: Source file name.
             user_id: User who approved (if available).
         """
-        await self.broadcast({
-            "type": "record_approved",
-            "id": str(uuid4()),
-            "timestamp": datetime.now(UTC).isoformat(),
-            "data": {
+        await self._notify(
+            "record_approved",
+            {
                 "record_id": record_id,
                 "source_file": source_file,
                 "user_id": user_id,
             },
-            "message": f"Record approved: {source_file}",
-        })
+            f"Record approved: {source_file}",
+        )
 
     async def notify_record_rejected(
         self, record_id: str, source_file: str, reason: str
@@ -149,17 +220,15 @@ class NotificationManager:
             source_file: Source file name.
             reason: Rejection reason.
         """
-        await self.broadcast({
-            "type": "record_rejected",
-            "id": str(uuid4()),
-            "timestamp": datetime.now(UTC).isoformat(),
-            "data": {
+        await self._notify(
+            "record_rejected",
+            {
                 "record_id": record_id,
                 "source_file": source_file,
                 "reason": reason,
             },
-            "message": f"Record rejected: {source_file}",
-        })
+            f"Record rejected: {source_file}",
+        )
 
     async def notify_batch_operation(
         self, operation: str, count: int, record_type: str | None = None
@@ -172,17 +241,15 @@ class NotificationManager:
             count: Number of records affected.
             record_type: Type of records (optional).
         """
-        await self.broadcast({
-            "type": f"batch_{operation}",
-            "id": str(uuid4()),
-            "timestamp": datetime.now(UTC).isoformat(),
-            "data": {
+        await self._notify(
+            f"batch_{operation}",
+            {
                 "operation": operation,
                 "count": count,
                 "record_type": record_type,
             },
-            "message": f"Batch {operation}: {count} records",
-        })
+            f"Batch {operation}: {count} records",
+        )
 
     async def notify_export_complete(
         self, format: str, count: int, filename: str
@@ -195,17 +262,15 @@ class NotificationManager:
             count: Number of records exported.
             filename: Generated filename.
         """
-        await self.broadcast({
-            "type": "export_complete",
-            "id": str(uuid4()),
-            "timestamp": datetime.now(UTC).isoformat(),
-            "data": {
+        await self._notify(
+            "export_complete",
+            {
                 "format": format,
                 "count": count,
                 "filename": filename,
             },
-            "message": f"Export complete: {count} records to {format.upper()}",
-        })
+            f"Export complete: {count} records to {format.upper()}",
+        )
 
     async def notify_google_sheets_sync(
         self, synced_count: int, spreadsheet_url: str
@@ -217,16 +282,14 @@ class NotificationManager:
             synced_count: Number of records synced.
             spreadsheet_url: URL to the spreadsheet.
         """
-        await self.broadcast({
-            "type": "sheets_sync_complete",
-            "id": str(uuid4()),
-            "timestamp": datetime.now(UTC).isoformat(),
-            "data": {
+        await self._notify(
+            "sheets_sync_complete",
+            {
                 "synced_count": synced_count,
                 "spreadsheet_url": spreadsheet_url,
             },
-            "message": f"Google Sheets synced: {synced_count} records",
-        })
+            f"Google Sheets synced: {synced_count} records",
+        )
 
     async def notify_error(self, error_type: str, message: str) -> None:
         """
@@ -236,15 +299,13 @@ class NotificationManager:
             error_type: Type of error.
             message: Error message.
         """
-        await self.broadcast({
-            "type": "error",
-            "id": str(uuid4()),
-            "timestamp": datetime.now(UTC).isoformat(),
-            "data": {
+        await self._notify(
+            "error",
+            {
                 "error_type": error_type,
             },
-            "message": message,
-        })
+            message,
+        )
 
 
 # Global notification manager instance
@@ -2,27 +2,87 @@
 Pytest configuration and fixtures.
 """
 
+import asyncio
+import os
+from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
 
 import pytest
+from bs4 import BeautifulSoup
+
+from app.models.schemas import ContactFormData, EmailData, EmailType, InvoiceData
+from tests.helpers import find_dummy_data, make_soup
+
+# uvloop ships with uvicorn[standard] and is what the server runs on in
+# production; fall back to the stock asyncio loop where it is not installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore[assignment]  # module binding replaced by a None sentinel
+
+# WebSocket fan-out tests, run on the loop the server uses in production
+UVLOOP_MODULES = frozenset({"test_notification_service.py"})
+
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(item: pytest.Item) -> dict[str, object]:
+        """Run the WebSocket tests on uvloop and everything else on asyncio."""
+        if item.path.name in UVLOOP_MODULES:
+            return {"uvloop": uvloop.new_event_loop}
+        return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_validators() -> None:
+    """
+    Validate one instance of each extraction model before any test runs.
+
+    Moves first-use costs such as loading email-validator out of whichever
+    test happens to run first, once per session (and per xdist worker).
+    """
+    ContactFormData(full_name="x", email="warmup@example.com")
+    EmailData(
+        email_type=EmailType.CLIENT_INQUIRY,
+        sender_email="warmup@example.com",
+        recipient_email="info@techflow.gr",
+        subject="x",
+        date_sent=datetime(2024, 1, 1),
+        body="x",
+    )
+    InvoiceData(
+        invoice_number="TF-2024-000",
+        invoice_date=datetime(2024, 1, 1),
+        client_name="x",
+        net_amount=Decimal("0"),
+        vat_amount=Decimal("0"),
+        total_amount=Decimal("0"),
+    )
+
+
+@pytest.fixture(scope="session")
+def corpus_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Session-wide directory holding pre-written test input files.
+
+    Under pytest-xdist all workers share one directory next to their own
+    base temp dirs, so the corpus is only written by the first worker.
+    """
+    if not os.environ.get("PYTEST_XDIST_WORKER"):
+        return tmp_path_factory.mktemp("corpus")
+
+    root = tmp_path_factory.getbasetemp().parent / "corpus_shared"
+    root.mkdir(exist_ok=True)
+    return root
 
 
 @pytest.fixture
 def dummy_data_path() -> Path:
     """Get path to dummy data directory."""
-    # Check Docker environment first
-    docker_path = Path("/app/data")
-    if docker_path.exists() and (docker_path / "forms").exists():
-        return docker_path
-
-    # Navigate from tests/ to the dummy_data folder (local development)
-    current = Path(__file__).parent
-    # Go up to Part_B_Implementation, then to repo root, then to dummy_data
-    repo_root = current.parent.parent.parent.parent
-    dummy_path = repo_root / "dummy_data"
-
-    if not dummy_path.exists():
-        pytest.skip(f"Dummy data directory not found: {dummy_path}")
+    dummy_path = find_dummy_data()
+    if dummy_path is None:
+        pytest.skip("Dummy data directory not found")
 
     return dummy_path
 
@@ -45,7 +105,7 @@ def invoices_path(dummy_data_path: Path) -> Path:
     return dummy_data_path / "invoices"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_form_html() -> str:
     """Sample HTML form content for testing."""
     return '''<!DOCTYPE html>
@@ -90,7 +150,7 @@ Content-Type: text/plain; charset=UTF-8
 Ευχαριστώ'''
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_invoice_html() -> str:
     """Sample HTML invoice content for testing."""
     return '''<!DOCTYPE html>
@@ -120,3 +180,15 @@ def sample_invoice_html() -> str:
     </div>
 </body>
 </html>'''
+
+
+@pytest.fixture(scope="session")
+def sample_form_soup(sample_form_html: str) -> BeautifulSoup:
+    """Sample HTML form parsed once per session. Treat as read-only."""
+    return make_soup(sample_form_html)
+
+
+@pytest.fixture(scope="session")
+def sample_invoice_soup(sample_invoice_html: str) -> BeautifulSoup:
+    """Sample HTML invoice parsed once per session. Treat as read-only."""
+    return make_soup(sample_invoice_html)
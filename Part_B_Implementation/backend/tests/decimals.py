@@ -0,0 +1,19 @@
+"""
+Shared Decimal constants for tests.
+
+Decimals are immutable, so tests reuse these instead of re-parsing the same
+literals in every assertion and fixture.
+"""
+
+from decimal import Decimal
+
+D_1 = Decimal("1")
+D_24 = Decimal("24")
+D_100 = Decimal("100")
+
+D_24_00 = Decimal("24.00")
+D_100_00 = Decimal("100.00")
+D_124_00 = Decimal("124.00")
+D_240_00 = Decimal("240.00")
+D_850_00 = Decimal("850.00")
+D_1054_00 = Decimal("1054.00")
@@ -0,0 +1,251 @@
+"""
+Shared helpers for building test data.
+"""
+
+import os
+import shutil
+import tempfile
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from decimal import Decimal
+from functools import cache
+from pathlib import Path
+from typing import Any, TypedDict, TypeVar
+
+from bs4 import BeautifulSoup
+from pydantic import BaseModel
+
+from app.extractors.base import HTML_PARSER
+from app.models.schemas import (
+    ContactFormData,
+    EmailData,
+    EmailType,
+    InvoiceData,
+    InvoiceItem,
+    Priority,
+)
+
+M = TypeVar("M", bound=BaseModel)
+
+# Fixed timestamp for fixtures that only need "some" datetime
+FROZEN_NOW = datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class FormDataTD(TypedDict, total=False):
+    """Plain-dict mirror of ContactFormData for test scaffolding."""
+
+    full_name: str
+    email: str
+    phone: str | None
+    company: str | None
+    service_interest: str | None
+    message: str | None
+    submission_date: datetime | None
+    priority: Priority
+
+
+class EmailDataTD(TypedDict, total=False):
+    """Plain-dict mirror of EmailData for test scaffolding."""
+
+    email_type: EmailType
+    sender_name: str | None
+    sender_email: str
+    recipient_email: str
+    subject: str
+    date_sent: datetime
+    body: str
+    phone: str | None
+    company: str | None
+    position: str | None
+    service_interest: str | None
+    invoice_number: str | None
+    invoice_amount: Decimal | None
+    vendor_name: str | None
+
+
+class InvoiceDataTD(TypedDict, total=False):
+    """Plain-dict mirror of InvoiceData for test scaffolding."""
+
+    invoice_number: str
+    invoice_date: datetime
+    client_name: str
+    client_address: str | None
+    client_vat_number: str | None
+    net_amount: Decimal
+    vat_rate: Decimal
+    vat_amount: Decimal
+    total_amount: Decimal
+    payment_terms: str | None
+    notes: str | None
+
+
+def skip_validation() -> bool:
+    """Check whether test fixtures should bypass Pydantic validation."""
+    return os.environ.get("PYDANTIC_SKIP_VALIDATION", "") not in ("", "0")
+
+
+def _build(model: type[M], data: Any) -> M:
+    if skip_validation():
+        return model.model_construct(**data)
+    return model(**data)
+
+
+# Known-good field values, so a fixture only spells out what it cares about
+_FORM_DEFAULTS: dict[str, Any] = {
+    "full_name": "Test User",
+    "email": "test@example.com",
+    "priority": Priority.MEDIUM,
+}
+
+_ITEM_DEFAULTS: dict[str, Any] = {
+    "description": "Item",
+    "quantity": 1,
+    "unit_price": Decimal("100.00"),
+    "total": Decimal("100.00"),
+}
+
+
+def make_form(**kwargs: Any) -> ContactFormData:
+    """
+    Build ContactFormData for tests that don't exercise validation.
+
+    Fields not given fall back to known-good defaults. With
+    PYDANTIC_SKIP_VALIDATION=1 the model is built via model_construct,
+    skipping validation entirely. Tests that assert on validation behaviour
+    must use the real constructor instead.
+    """
+    return _build(ContactFormData, {**_FORM_DEFAULTS, **kwargs})
+
+
+def make_item(**kwargs: Any) -> InvoiceItem:
+    """Build an InvoiceItem with known-good defaults (see make_form)."""
+    return _build(InvoiceItem, {**_ITEM_DEFAULTS, **kwargs})
+
+
+def make_email(data: EmailDataTD) -> EmailData:
+    """Build EmailData from a plain-dict fixture (see make_form)."""
+    return _build(EmailData, data)
+
+
+def make_invoice(data: InvoiceDataTD) -> InvoiceData:
+    """Build InvoiceData from a plain-dict fixture (see make_form)."""
+    return _build(InvoiceData, data)
+
+
+class AsyncStub:
+    """
+    Lightweight stand-in for AsyncMock when a test needs only a few methods.
+
+    Each keyword argument becomes a coroutine method that returns the given
+    value, or raises it if it is an exception. Calls are recorded per method
+    name in ``calls`` as (args, kwargs) tuples.
+    """
+
+    def __init__(self, **methods: Any) -> None:
+        self.calls: defaultdict[str, list[tuple[tuple[Any, ...], dict[str, Any]]]] = (
+            defaultdict(list)
+        )
+        for name, result in methods.items():
+            setattr(self, name, self._method(name, result))
+
+    def _method(self, name: str, result: Any) -> Callable[..., Awaitable[Any]]:
+        async def method(*args: Any, **kwargs: Any) -> Any:
+            self.calls[name].append((args, kwargs))
+            if isinstance(result, BaseException):
+                raise result
+            return result
+
+        return method
+
+
+@cache
+def find_dummy_data() -> Path | None:
+    """
+    Locate the dummy data directory, or None if it is unavailable.
+
+    Usable at collection time, e.g. to parametrize over the dummy files.
+    The lookup is cached, so collection and the dummy_data_path fixture
+    probe the filesystem only once per session.
+    """
+    # Check Docker environment first
+    docker_path = Path("/app/data")
+    if docker_path.exists() and (docker_path / "forms").exists():
+        return docker_path
+
+    # Navigate from tests/ to the dummy_data folder (local development)
+    current = Path(__file__).parent
+    # Go up to Part_B_Implementation, then to repo root, then to dummy_data
+    repo_root = current.parent.parent.parent.parent
+    dummy_path = repo_root / "dummy_data"
+
+    return dummy_path if dummy_path.exists() else None
+
+
+@cache
+def dummy_files(subdir: str, suffix: str) -> tuple[Path, ...]:
+    """
+    Sorted dummy data files in subdir ending with suffix.
+
+    Scanned once per session with os.scandir, which reuses the directory
+    entry's cached file type instead of stat-ing every path like Path.glob.
+    """
+    root = find_dummy_data()
+    if root is None:
+        return ()
+    with os.scandir(root / subdir) as entries:
+        paths = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(suffix) and entry.is_file()
+        ]
+    return tuple(sorted(paths))
+
+
+def make_soup(html: str | bytes) -> BeautifulSoup:
+    """Parse HTML with the same parser the extractors use."""
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+def write_corpus(root: Path, payloads: dict[str, bytes]) -> dict[str, Path]:
+    """
+    Write all test payloads into root in one preparation pass.
+
+    Uses os.writev where the platform provides it so each file is written
+    with a single syscall.
+
+    Returns:
+        Mapping of payload name to the written file path.
+    """
+    paths: dict[str, Path] = {}
+    for name, data in payloads.items():
+        path = root / name
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.writev(fd, [view]) if hasattr(os, "writev") else os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+        paths[name] = path
+    return paths
+
+
+def shared_corpus(root: Path, name: str, payloads: dict[str, bytes]) -> dict[str, Path]:
+    """
+    Write payloads into root/name unless another process already has.
+
+    The corpus is written into a private staging directory and renamed into
+    place, so concurrent xdist workers never see a partially written corpus.
+    Whoever loses the rename race discards its copy and reuses the winner's.
+    """
+    target = root / name
+    if not target.exists():
+        staging = Path(tempfile.mkdtemp(prefix=f".{name}-", dir=root))
+        write_corpus(staging, payloads)
+        try:
+            staging.rename(target)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+    return {payload_name: target / payload_name for payload_name in payloads}
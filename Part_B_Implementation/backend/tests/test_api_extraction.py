@@ -15,12 +15,6 @@ def mock_db():
     return AsyncMock()
 
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
-@pytest.mark.anyio
 async def test_list_files():
     """Test listing available files for extraction."""
     with patch("app.routers.extraction.settings") as mock_settings:
@@ -57,7 +51,6 @@ async def test_list_files():
             assert "invoices" in data["files"]
 
 
-@pytest.mark.anyio
 async def test_health_endpoint():
     """Test health check endpoint."""
     transport = ASGITransport(app=app)
@@ -71,7 +64,6 @@ async def test_health_endpoint():
     assert "version" in data
 
 
-@pytest.mark.anyio
 async def test_root_endpoint():
     """Test root endpoint."""
     transport = ASGITransport(app=app)
@@ -84,7 +76,6 @@ async def test_root_endpoint():
     assert "TechFlow" in data["message"]
 
 
-@pytest.mark.anyio
 async def test_status_endpoint():
     """Test status endpoint."""
     transport = ASGITransport(app=app)
@@ -97,7 +88,6 @@ async def test_status_endpoint():
 
 
 @pytest.mark.integration
-@pytest.mark.anyio
 async def test_extract_form_file_not_found():
     """Test extracting a non-existent form file (requires DB)."""
     transport = ASGITransport(app=app)
@@ -108,7 +98,6 @@ async def test_extract_form_file_not_found():
 
 
 @pytest.mark.integration
-@pytest.mark.anyio
 async def test_extract_email_file_not_found():
     """Test extracting a non-existent email file (requires DB)."""
     transport = ASGITransport(app=app)
@@ -119,7 +108,6 @@ async def test_extract_email_file_not_found():
 
 
 @pytest.mark.integration
-@pytest.mark.anyio
 async def test_extract_invoice_file_not_found():
     """Test extracting a non-existent invoice file (requires DB)."""
     transport = ASGITransport(app=app)
@@ -129,7 +117,6 @@ async def test_extract_invoice_file_not_found():
     assert response.status_code == 404
 
 
-@pytest.mark.anyio
 async def test_cors_headers():
     """Test CORS headers are present."""
     transport = ASGITransport(app=app)
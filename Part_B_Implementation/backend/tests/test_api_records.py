@@ -37,12 +37,6 @@ def sample_record():
     )
 
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
-@pytest.mark.anyio
 async def test_list_records_empty():
     """Test listing records when database is empty."""
     from app.routers.records import get_record_service
@@ -68,7 +62,6 @@ async def test_list_records_empty():
         app.dependency_overrides.clear()
 
 
-@pytest.mark.anyio
 async def test_list_records_with_filters():
     """Test listing records with status and type filters."""
     from app.routers.records import get_record_service
@@ -96,7 +89,6 @@ async def test_list_records_with_filters():
 
 
 @pytest.mark.integration
-@pytest.mark.anyio
 async def test_get_stats():
     """Test getting dashboard statistics (requires DB)."""
     transport = ASGITransport(app=app)
@@ -111,7 +103,6 @@ async def test_get_stats():
     assert "rejected_count" in data
 
 
-@pytest.mark.anyio
 async def test_get_record_not_found():
     """Test getting a non-existent record."""
     from app.routers.records import get_record_service
@@ -134,7 +125,6 @@ async def test_get_record_not_found():
         app.dependency_overrides.clear()
 
 
-@pytest.mark.anyio
 async def test_approve_record_not_found():
     """Test approving a non-existent record."""
     from app.routers.records import get_record_service
@@ -160,7 +150,6 @@ async def test_approve_record_not_found():
         app.dependency_overrides.clear()
 
 
-@pytest.mark.anyio
 async def test_reject_record_not_found():
     """Test rejecting a non-existent record."""
     from app.routers.records import get_record_service
@@ -187,7 +176,6 @@ async def test_reject_record_not_found():
 
 
 @pytest.mark.integration
-@pytest.mark.anyio
 async def test_reject_record_missing_reason():
     """Test rejecting without providing a reason (requires DB)."""
     transport = ASGITransport(app=app)
@@ -201,7 +189,6 @@ async def test_reject_record_missing_reason():
     assert response.status_code == 422
 
 
-@pytest.mark.anyio
 async def test_edit_record_not_found():
     """Test editing a non-existent record."""
     from app.routers.records import get_record_service
@@ -227,7 +214,6 @@ async def test_edit_record_not_found():
         app.dependency_overrides.clear()
 
 
-@pytest.mark.anyio
 async def test_export_no_records():
     """Test exporting when no records available."""
     from app.routers.records import get_export_service
@@ -255,7 +241,6 @@ async def test_export_no_records():
 
 
 @pytest.mark.integration
-@pytest.mark.anyio
 async def test_export_invalid_format():
     """Test exporting with invalid format (requires DB)."""
     transport = ASGITransport(app=app)
@@ -270,7 +255,6 @@ async def test_export_invalid_format():
 
 
 @pytest.mark.integration
-@pytest.mark.anyio
 async def test_batch_approve_empty():
     """Test batch approve with empty list returns validation error."""
     transport = ASGITransport(app=app)
@@ -285,7 +269,6 @@ async def test_batch_approve_empty():
 
 
 @pytest.mark.integration
-@pytest.mark.anyio
 async def test_batch_reject_empty():
     """Test batch reject with empty list returns validation error."""
     transport = ASGITransport(app=app)
@@ -301,7 +284,6 @@ async def test_batch_reject_empty():
 
 
 @pytest.mark.integration
-@pytest.mark.anyio
 async def test_google_sheets_status():
     """Test Google Sheets status endpoint (requires DB)."""
     transport = ASGITransport(app=app)
@@ -315,7 +297,6 @@ async def test_google_sheets_status():
 
 
 @pytest.mark.integration
-@pytest.mark.anyio
 async def test_google_sheets_create_not_configured():
     """Test creating spreadsheet when not configured (requires DB)."""
     transport = ASGITransport(app=app)
@@ -327,7 +308,6 @@ async def test_google_sheets_create_not_configured():
 
 
 @pytest.mark.integration
-@pytest.mark.anyio
 async def test_google_sheets_sync_not_configured():
     """Test syncing to spreadsheet when not configured (requires DB)."""
     transport = ASGITransport(app=app)
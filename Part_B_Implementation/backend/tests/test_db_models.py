@@ -174,6 +174,20 @@ class TestExtractionRecordDB:
         assert record.extraction.form_data is None
         assert record.extraction.email_data is None
 
+    def test_to_pydantic_ignores_unknown_keys(
+        self, sample_form_record: ExtractionRecordDB
+    ) -> None:
+        """Test that stored data with keys the schema no longer knows still loads."""
+        sample_form_record.extracted_data = {
+            **sample_form_record.extracted_data,
+            "legacy_field": "value",
+        }
+
+        record = sample_form_record.to_pydantic()
+
+        assert record.extraction.form_data is not None
+        assert record.extraction.form_data.full_name == "Κώστας Παπαδόπουλος"
+
     def test_to_pydantic_with_warnings(self, sample_form_record: ExtractionRecordDB) -> None:
         """Test conversion preserves warnings."""
         record = sample_form_record.to_pydantic()
@@ -49,7 +49,6 @@ class TestRecordRepository:
         assert repository is not None
         assert repository.session is not None
 
-    @pytest.mark.anyio
     async def test_create(
         self,
         repository: RecordRepository,
@@ -64,7 +63,6 @@ class TestRecordRepository:
         mock_session.refresh.assert_called_once_with(sample_record)
         assert result == sample_record
 
-    @pytest.mark.anyio
     async def test_get_by_id_found(
         self,
         repository: RecordRepository,
@@ -81,7 +79,6 @@ class TestRecordRepository:
         assert result == sample_record
         mock_session.execute.assert_called_once()
 
-    @pytest.mark.anyio
     async def test_get_by_id_not_found(
         self,
         repository: RecordRepository,
@@ -96,7 +93,6 @@ class TestRecordRepository:
 
         assert result is None
 
-    @pytest.mark.anyio
     async def test_list_records_no_filters(
         self,
         repository: RecordRepository,
@@ -119,7 +115,6 @@ class TestRecordRepository:
         assert len(records) == 1
         assert total == 1
 
-    @pytest.mark.anyio
     async def test_list_records_with_status_filter(
         self,
         repository: RecordRepository,
@@ -142,7 +137,6 @@ class TestRecordRepository:
         assert len(records) == 1
         assert records[0].status == "pending"
 
-    @pytest.mark.anyio
     async def test_list_records_with_type_filter(
         self,
         repository: RecordRepository,
@@ -165,7 +159,6 @@ class TestRecordRepository:
         assert len(records) == 1
         assert records[0].record_type == "FORM"
 
-    @pytest.mark.anyio
     async def test_list_records_with_pagination(
         self,
         repository: RecordRepository,
@@ -188,7 +181,6 @@ class TestRecordRepository:
         # Total should be 50 even though we got 1 page
         assert total == 50
 
-    @pytest.mark.anyio
     async def test_update(
         self,
         repository: RecordRepository,
@@ -204,7 +196,6 @@ class TestRecordRepository:
         mock_session.refresh.assert_called_once_with(sample_record)
         assert result == sample_record
 
-    @pytest.mark.anyio
     async def test_delete(
         self,
         repository: RecordRepository,
@@ -217,7 +208,6 @@ class TestRecordRepository:
         mock_session.delete.assert_called_once_with(sample_record)
         mock_session.flush.assert_called_once()
 
-    @pytest.mark.anyio
     async def test_get_exportable_records_default(
         self,
         repository: RecordRepository,
@@ -237,7 +227,6 @@ class TestRecordRepository:
         assert len(records) == 1
         mock_session.execute.assert_called_once()
 
-    @pytest.mark.anyio
     async def test_get_exportable_records_with_ids(
         self,
         repository: RecordRepository,
@@ -257,7 +246,6 @@ class TestRecordRepository:
 
         assert len(records) == 1
 
-    @pytest.mark.anyio
     async def test_get_exportable_records_include_rejected(
         self,
         repository: RecordRepository,
@@ -276,7 +264,6 @@ class TestRecordRepository:
 
         assert len(records) == 1
 
-    @pytest.mark.anyio
     async def test_get_stats(
         self,
         repository: RecordRepository,
@@ -308,7 +295,6 @@ class TestRecordRepository:
         assert stats["by_type"]["FORM"] == 8
         assert stats["by_type"]["EMAIL"] == 6
 
-    @pytest.mark.anyio
     async def test_exists_true(
         self,
         repository: RecordRepository,
@@ -324,7 +310,6 @@ class TestRecordRepository:
 
         assert result is True
 
-    @pytest.mark.anyio
     async def test_exists_false(
         self,
         repository: RecordRepository,
@@ -339,7 +324,6 @@ class TestRecordRepository:
 
         assert result is False
 
-    @pytest.mark.anyio
     async def test_get_by_source_file_found(
         self,
         repository: RecordRepository,
@@ -356,7 +340,6 @@ class TestRecordRepository:
         assert result == sample_record
         assert result.source_file == "test.html"
 
-    @pytest.mark.anyio
     async def test_get_by_source_file_not_found(
         self,
         repository: RecordRepository,
@@ -391,7 +374,6 @@ class TestRecordRepositoryIntegration:
         """Create a RecordRepository with mock session."""
         return RecordRepository(mock_session)
 
-    @pytest.mark.anyio
     async def test_create_and_get_workflow(
         self,
         repository: RecordRepository,
@@ -420,7 +402,6 @@ class TestRecordRepositoryIntegration:
         fetched = await repository.get_by_id(record.id)
         assert fetched.id == record.id
 
-    @pytest.mark.anyio
     async def test_update_status_workflow(
         self,
         repository: RecordRepository,
@@ -447,7 +428,6 @@ class TestRecordRepositoryIntegration:
         assert updated.status == "approved"
         assert updated.reviewed_by == "admin"
 
-    @pytest.mark.anyio
     async def test_list_with_multiple_filters(
         self,
         repository: RecordRepository,
@@ -4,12 +4,12 @@ Unit tests for EmailExtractor.
 
 from datetime import datetime
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 import pytest
 
 from app.extractors.email_extractor import EmailExtractor
 from app.models.schemas import EmailType, RecordType
+from tests.helpers import dummy_files
 
 
 class TestEmailExtractor:
@@ -21,28 +21,23 @@ class TestEmailExtractor:
         return EmailExtractor()
 
     def test_extract_from_sample_eml(
-        self, extractor: EmailExtractor, sample_email_eml: str
+        self, extractor: EmailExtractor, sample_email_eml: str, tmp_path: Path
     ) -> None:
         """Test extraction from sample EML content."""
-        with NamedTemporaryFile(mode="w", suffix=".eml", delete=False, encoding="utf-8") as f:
-            f.write(sample_email_eml)
-            f.flush()
-            file_path = Path(f.name)
-
-        try:
-            result = extractor.extract(file_path)
-
-            assert result.record_type == RecordType.EMAIL
-            assert not result.has_errors
-            assert result.email_data is not None
-
-            data = result.email_data
-            assert data.sender_email == "test@example.gr"
-            assert data.email_type == EmailType.CLIENT_INQUIRY
-            assert "Test User" in (data.sender_name or "")
-            assert result.confidence_score >= 0.7
-        finally:
-            file_path.unlink()
+        file_path = tmp_path / "sample.eml"
+        file_path.write_text(sample_email_eml, encoding="utf-8")
+
+        result = extractor.extract(file_path)
+
+        assert result.record_type == RecordType.EMAIL
+        assert not result.has_errors
+        assert result.email_data is not None
+
+        data = result.email_data
+        assert data.sender_email == "test@example.gr"
+        assert data.email_type == EmailType.CLIENT_INQUIRY
+        assert "Test User" in (data.sender_name or "")
+        assert result.confidence_score >= 0.7
 
     def test_extract_client_inquiry(
         self, extractor: EmailExtractor, emails_path: Path
@@ -83,11 +78,9 @@ class TestEmailExtractor:
         # Invoice classification is correct - body extraction will be enhanced with AI
         # The important thing is correct classification based on subject/keywords
 
-    def test_extract_all_emails(
-        self, extractor: EmailExtractor, emails_path: Path
-    ) -> None:
+    def test_extract_all_emails(self, extractor: EmailExtractor) -> None:
         """Test extraction from all dummy data emails."""
-        email_files = list(emails_path.glob("*.eml"))
+        email_files = dummy_files("emails", ".eml")
         if not email_files:
             pytest.skip("No email files found")
 
@@ -4,9 +4,10 @@ Tests for base extractor class.
 
 import pytest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID
 
+from app.core.logging import AuditLogger
 from app.extractors.base import BaseExtractor
 from app.models.schemas import (
     ContactFormData,
@@ -16,9 +17,37 @@ from app.models.schemas import (
     InvoiceData,
     RecordType,
 )
+from collections.abc import Callable
 from datetime import datetime, timezone
 from decimal import Decimal
 
+from tests.helpers import (
+    EmailDataTD,
+    InvoiceDataTD,
+    make_email,
+    make_form,
+    make_invoice,
+    shared_corpus,
+)
+
+# Path objects are immutable, so tests share them instead of rebuilding each call
+_LOG_PATH_OK = Path("test.html")
+_LOG_PATH_BAD = Path("bad.html")
+_MISSING_HTML = Path("/nonexistent/file.html")
+_MISSING_FORM = Path("/nonexistent/form.html")
+
+CORPUS: dict[str, bytes] = {
+    "test.html": "<html><body>Test content</body></html>".encode("utf-8"),
+    "greek.html": "<p>Καλημέρα κόσμε</p>".encode("utf-8"),
+    "form.html": "<form>Test form</form>".encode("utf-8"),
+}
+
+
+@pytest.fixture(scope="session")
+def corpus(corpus_root: Path) -> dict[str, Path]:
+    """Input files for base extractor tests, written once per session."""
+    return shared_corpus(corpus_root, "extractors_base", CORPUS)
+
 
 class ConcreteExtractor(BaseExtractor):
     """Concrete implementation for testing."""
@@ -28,7 +57,7 @@ class ConcreteExtractor(BaseExtractor):
     def extract(self, file_path: Path) -> ExtractionResult:
         """Extract data from file."""
         content = self.read_file(file_path)
-        data = ContactFormData(
+        data = make_form(
             full_name="Test User",
             email="test@example.com",
         )
@@ -48,6 +77,42 @@ class ConcreteExtractor(BaseExtractor):
         return len(messages) == 0, messages
 
 
+class _EmailConcrete(BaseExtractor):
+    """Minimal email extractor for _create_result tests."""
+
+    record_type = RecordType.EMAIL
+
+    def extract(self, file_path: Path) -> ExtractionResult:
+        return ExtractionResult(
+            source_file="test.eml",
+            record_type=RecordType.EMAIL,
+            confidence_score=0.9,
+        )
+
+    def validate(self, data: EmailData) -> tuple[bool, list[str]]:
+        return True, []
+
+
+class _InvoiceConcrete(BaseExtractor):
+    """Minimal invoice extractor for _create_result tests."""
+
+    record_type = RecordType.INVOICE
+
+    def extract(self, file_path: Path) -> ExtractionResult:
+        return ExtractionResult(
+            source_file="test.html",
+            record_type=RecordType.INVOICE,
+            confidence_score=0.9,
+        )
+
+    def validate(self, data: InvoiceData) -> tuple[bool, list[str]]:
+        return True, []
+
+
+_EMAIL_EXTRACTOR = _EmailConcrete()
+_INVOICE_EXTRACTOR = _InvoiceConcrete()
+
+
 class TestBaseExtractor:
     """Tests for BaseExtractor abstract class."""
 
@@ -57,11 +122,9 @@ class TestBaseExtractor:
         return ConcreteExtractor()
 
     @pytest.fixture
-    def temp_file(self, tmp_path: Path) -> Path:
-        """Create a temporary test file."""
-        file = tmp_path / "test.html"
-        file.write_text("<html><body>Test content</body></html>", encoding="utf-8")
-        return file
+    def temp_file(self, corpus: dict[str, Path]) -> Path:
+        """Get the shared test file."""
+        return corpus["test.html"]
 
     def test_extractor_creation(self, extractor: ConcreteExtractor) -> None:
         """Test extractor can be instantiated."""
@@ -80,19 +143,29 @@ class TestBaseExtractor:
     def test_read_file_not_found(self, extractor: ConcreteExtractor) -> None:
         """Test reading a non-existent file."""
         with pytest.raises(FileNotFoundError, match="File not found"):
-            extractor.read_file(Path("/nonexistent/file.html"))
+            extractor.read_file(_MISSING_HTML)
 
     def test_read_file_utf8(
-        self, extractor: ConcreteExtractor, tmp_path: Path
+        self, extractor: ConcreteExtractor, corpus: dict[str, Path]
     ) -> None:
         """Test reading a file with Greek characters."""
-        file = tmp_path / "greek.html"
-        file.write_text("<p>Καλημέρα κόσμε</p>", encoding="utf-8")
-
-        content = extractor.read_file(file)
+        content = extractor.read_file(corpus["greek.html"])
         assert "Καλημέρα" in content
         assert "κόσμε" in content
 
+    def test_read_bytes_round_trips_through_parser(
+        self, extractor: ConcreteExtractor, corpus: dict[str, Path]
+    ) -> None:
+        """Test raw bytes parse to the same Greek text as the decoded file."""
+        raw = extractor.read_bytes(corpus["greek.html"])
+        assert isinstance(raw, bytes)
+        assert "Καλημέρα" in extractor.parse_html(raw).get_text()
+
+    def test_read_bytes_not_found(self, extractor: ConcreteExtractor) -> None:
+        """Test reading raw bytes from a non-existent file."""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            extractor.read_bytes(_MISSING_HTML)
+
 
 class TestCreateResult:
     """Tests for _create_result method."""
@@ -106,7 +179,7 @@ class TestCreateResult:
         self, extractor: ConcreteExtractor
     ) -> None:
         """Test creating result with ContactFormData."""
-        form_data = ContactFormData(
+        form_data = make_form(
             full_name="Μαρία Παπαδοπούλου",
             email="maria@example.gr",
             phone="210-1234567",
@@ -131,32 +204,19 @@ class TestCreateResult:
 
     def test_create_result_with_email_data(self) -> None:
         """Test creating result with EmailData."""
-
-        class EmailExtractor(BaseExtractor):
-            record_type = RecordType.EMAIL
-
-            def extract(self, file_path: Path) -> ExtractionResult:
-                return ExtractionResult(
-                    source_file="test.eml",
-                    record_type=RecordType.EMAIL,
-                    confidence_score=0.9,
-                )
-
-            def validate(self, data: EmailData) -> tuple[bool, list[str]]:
-                return True, []
-
-        extractor = EmailExtractor()
-        email_data = EmailData(
-            email_type=EmailType.CLIENT_INQUIRY,
-            sender_name="John Doe",
-            sender_email="john@example.com",
-            recipient_email="info@company.com",
-            subject="Inquiry",
-            date_sent=datetime.now(timezone.utc),
-            body="Hello",
+        email_data = make_email(
+            EmailDataTD(
+                email_type=EmailType.CLIENT_INQUIRY,
+                sender_name="John Doe",
+                sender_email="john@example.com",
+                recipient_email="info@company.com",
+                subject="Inquiry",
+                date_sent=datetime.now(timezone.utc),
+                body="Hello",
+            )
         )
 
-        result = extractor._create_result(
+        result = _EMAIL_EXTRACTOR._create_result(
             source_file="email.eml",
             data=email_data,
             confidence=0.88,
@@ -168,32 +228,19 @@ class TestCreateResult:
 
     def test_create_result_with_invoice_data(self) -> None:
         """Test creating result with InvoiceData."""
-
-        class InvoiceExtractor(BaseExtractor):
-            record_type = RecordType.INVOICE
-
-            def extract(self, file_path: Path) -> ExtractionResult:
-                return ExtractionResult(
-                    source_file="test.html",
-                    record_type=RecordType.INVOICE,
-                    confidence_score=0.9,
-                )
-
-            def validate(self, data: InvoiceData) -> tuple[bool, list[str]]:
-                return True, []
-
-        extractor = InvoiceExtractor()
-        invoice_data = InvoiceData(
-            invoice_number="INV-001",
-            invoice_date=datetime.now(timezone.utc),
-            client_name="Test Client",
-            net_amount=Decimal("1000.00"),
-            vat_rate=Decimal("24"),
-            vat_amount=Decimal("240.00"),
-            total_amount=Decimal("1240.00"),
+        invoice_data = make_invoice(
+            InvoiceDataTD(
+                invoice_number="INV-001",
+                invoice_date=datetime.now(timezone.utc),
+                client_name="Test Client",
+                net_amount=Decimal("1000.00"),
+                vat_rate=Decimal("24"),
+                vat_amount=Decimal("240.00"),
+                total_amount=Decimal("1240.00"),
+            )
         )
 
-        result = extractor._create_result(
+        result = _INVOICE_EXTRACTOR._create_result(
             source_file="invoice.html",
             data=invoice_data,
             confidence=0.95,
@@ -224,7 +271,7 @@ class TestCreateResult:
         self, extractor: ConcreteExtractor
     ) -> None:
         """Test that result has a valid UUID."""
-        form_data = ContactFormData(
+        form_data = make_form(
             full_name="Test",
             email="test@example.com",
         )
@@ -241,7 +288,7 @@ class TestCreateResult:
         self, extractor: ConcreteExtractor
     ) -> None:
         """Test result has empty lists when no warnings/errors."""
-        form_data = ContactFormData(
+        form_data = make_form(
             full_name="Test",
             email="test@example.com",
         )
@@ -255,6 +302,16 @@ class TestCreateResult:
         assert result.errors == []
 
 
+class _AuditRecorder:
+    """Records audit_logger calls as (method name, kwargs) tuples."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict[str, object]]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        return lambda **kwargs: self.calls.append((name, kwargs))
+
+
 class TestLogExtraction:
     """Tests for _log_extraction method."""
 
@@ -263,48 +320,89 @@ class TestLogExtraction:
         """Create extractor instance."""
         return ConcreteExtractor()
 
+    @pytest.fixture
+    def recorder(self, monkeypatch: pytest.MonkeyPatch) -> _AuditRecorder:
+        """Replace the audit logger with a recording stub."""
+        recorder = _AuditRecorder()
+        monkeypatch.setattr("app.extractors.base.audit_logger", recorder)
+        return recorder
+
     def test_log_extraction_success(
-        self, extractor: ConcreteExtractor
+        self, extractor: ConcreteExtractor, recorder: _AuditRecorder
     ) -> None:
         """Test logging successful extraction."""
-        with patch("app.extractors.base.audit_logger") as mock_audit:
-            extractor._log_extraction(
-                file_path=Path("test.html"),
-                extraction_id="test-123",
-                success=True,
-                confidence=0.95,
-            )
+        extractor._log_extraction(
+            file_path=_LOG_PATH_OK,
+            extraction_id="test-123",
+            success=True,
+            confidence=0.95,
+        )
 
-            mock_audit.log_extraction_started.assert_called_once_with(
-                file_path="test.html",
-                file_type="FORM",
-                extraction_id="test-123",
-            )
-            mock_audit.log_extraction_completed.assert_called_once_with(
-                extraction_id="test-123",
-                success=True,
-                confidence_score=0.95,
-                error_message=None,
-            )
+        assert recorder.calls == [
+            (
+                "log_extraction_started",
+                {"file_path": "test.html", "file_type": "FORM", "extraction_id": "test-123"},
+            ),
+            (
+                "log_extraction_completed",
+                {
+                    "extraction_id": "test-123",
+                    "success": True,
+                    "confidence_score": 0.95,
+                    "error_message": None,
+                },
+            ),
+        ]
 
     def test_log_extraction_failure(
-        self, extractor: ConcreteExtractor
+        self, extractor: ConcreteExtractor, recorder: _AuditRecorder
     ) -> None:
         """Test logging failed extraction."""
-        with patch("app.extractors.base.audit_logger") as mock_audit:
-            extractor._log_extraction(
-                file_path=Path("bad.html"),
-                extraction_id="test-456",
-                success=False,
-                error_message="Parse error",
-            )
+        extractor._log_extraction(
+            file_path=_LOG_PATH_BAD,
+            extraction_id="test-456",
+            success=False,
+            error_message="Parse error",
+        )
 
-            mock_audit.log_extraction_completed.assert_called_once_with(
-                extraction_id="test-456",
-                success=False,
-                confidence_score=None,
-                error_message="Parse error",
-            )
+        assert recorder.calls[1:] == [
+            (
+                "log_extraction_completed",
+                {
+                    "extraction_id": "test-456",
+                    "success": False,
+                    "confidence_score": None,
+                    "error_message": "Parse error",
+                },
+            ),
+        ]
+
+    async def test_extract_async_buffers_audit_rows(
+        self, corpus: dict[str, Path], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test audit rows logged in the worker thread reach the loop's buffer."""
+
+        class LoggingExtractor(ConcreteExtractor):
+            def extract(self, file_path: Path) -> ExtractionResult:
+                result = super().extract(file_path)
+                self._log_extraction(file_path, "test-789", True, 0.95)
+                return result
+
+        session = MagicMock()
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=None)
+        session.commit = AsyncMock()
+        audit = AuditLogger(session_factory=MagicMock(return_value=session))
+        monkeypatch.setattr("app.extractors.base.audit_logger", audit)
+
+        await LoggingExtractor().extract_async(corpus["test.html"])
+
+        assert [row["action"] for row in audit._buffer] == [
+            "extraction_started",
+            "extraction_completed",
+        ]
+        await audit.close()
+        session.commit.assert_awaited_once()
 
 
 class TestValidation:
@@ -349,11 +447,9 @@ class TestExtractMethod:
         return ConcreteExtractor()
 
     @pytest.fixture
-    def temp_file(self, tmp_path: Path) -> Path:
-        """Create a temporary test file."""
-        file = tmp_path / "form.html"
-        file.write_text("<form>Test form</form>", encoding="utf-8")
-        return file
+    def temp_file(self, corpus: dict[str, Path]) -> Path:
+        """Get the shared form file."""
+        return corpus["form.html"]
 
     def test_extract_returns_result(
         self, extractor: ConcreteExtractor, temp_file: Path
@@ -370,4 +466,4 @@ class TestExtractMethod:
     ) -> None:
         """Test extract with missing file."""
         with pytest.raises(FileNotFoundError):
-            extractor.extract(Path("/nonexistent/form.html"))
+            extractor.extract(_MISSING_FORM)
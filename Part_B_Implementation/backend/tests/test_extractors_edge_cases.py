@@ -3,48 +3,20 @@ Edge case tests for extractors to improve coverage.
 Tests malformed data, empty files, Greek characters, and error handling paths.
 """
 
+import email.policy
 import pytest
 from pathlib import Path
-from datetime import datetime, timezone
-from unittest.mock import Mock, patch, MagicMock
+from decimal import Decimal
 from email.message import EmailMessage
 
 from app.extractors.form_extractor import FormExtractor
 from app.extractors.email_extractor import EmailExtractor
 from app.extractors.invoice_extractor import InvoiceExtractor
+from app.models.schemas import ContactFormData
+from tests.helpers import shared_corpus
 
 
-class TestFormExtractorEdgeCases:
-    """Edge case tests for FormExtractor."""
-
-    @pytest.fixture
-    def extractor(self):
-        return FormExtractor()
-
-    def test_extract_empty_html(self, extractor, tmp_path):
-        """Test extracting from empty HTML file."""
-        file_path = tmp_path / "empty.html"
-        file_path.write_text("")
-
-        result = extractor.extract(file_path)
-
-        assert result.confidence_score < 0.5
-        assert len(result.errors) > 0 or len(result.warnings) > 0
-
-    def test_extract_html_no_form(self, extractor, tmp_path):
-        """Test extracting from HTML without form element."""
-        html = "<html><body><p>No form here</p></body></html>"
-        file_path = tmp_path / "no_form.html"
-        file_path.write_text(html)
-
-        result = extractor.extract(file_path)
-
-        # Should handle gracefully
-        assert result is not None
-
-    def test_extract_html_with_greek_characters(self, extractor, tmp_path):
-        """Test extracting form with Greek characters."""
-        html = """
+_GREEK_FORM_HTML = """
         <html><body>
         <form>
             <input name="full_name" value="Γιώργος Παπαδόπουλος">
@@ -54,43 +26,14 @@ class TestFormExtractorEdgeCases:
         </form>
         </body></html>
         """
-        file_path = tmp_path / "greek_form.html"
-        file_path.write_text(html, encoding="utf-8")
-
-        result = extractor.extract(file_path)
-
-        assert result.form_data is not None
-        assert "Γιώργος" in str(result.form_data.full_name) or result.form_data.full_name is not None
-
-    def test_extract_malformed_html(self, extractor, tmp_path):
-        """Test extracting from malformed HTML."""
-        html = "<html><body><form><input name='test' value='data'<broken>"
-        file_path = tmp_path / "malformed.html"
-        file_path.write_text(html)
-
-        result = extractor.extract(file_path)
 
-        # Should handle gracefully without crashing
-        assert result is not None
-
-    def test_extract_form_missing_required_fields(self, extractor, tmp_path):
-        """Test form with missing required fields."""
-        html = """
+_INCOMPLETE_FORM_HTML = """
         <form>
             <input name="message" value="Only message, no contact info">
         </form>
         """
-        file_path = tmp_path / "incomplete.html"
-        file_path.write_text(html)
-
-        result = extractor.extract(file_path)
 
-        # Should have low confidence or warnings
-        assert result.confidence_score < 1.0
-
-    def test_extract_form_with_select_elements(self, extractor, tmp_path):
-        """Test form with select/dropdown elements."""
-        html = """
+_SELECT_FORM_HTML = """
         <form>
             <input name="full_name" value="Test User">
             <input name="email" value="test@example.com">
@@ -102,71 +45,21 @@ class TestFormExtractorEdgeCases:
             </select>
         </form>
         """
-        file_path = tmp_path / "select_form.html"
-        file_path.write_text(html)
 
-        result = extractor.extract(file_path)
-
-        assert result.form_data is not None
-
-    def test_extract_file_not_found(self, extractor):
-        """Test extracting from non-existent file."""
-        result = extractor.extract(Path("/nonexistent/file.html"))
-
-        assert len(result.errors) > 0
-        assert result.confidence_score == 0.0
-
-
-class TestEmailExtractorEdgeCases:
-    """Edge case tests for EmailExtractor."""
-
-    @pytest.fixture
-    def extractor(self):
-        return EmailExtractor()
-
-    def test_extract_empty_email(self, extractor, tmp_path):
-        """Test extracting from empty EML file."""
-        file_path = tmp_path / "empty.eml"
-        file_path.write_text("")
-
-        result = extractor.extract(file_path)
-
-        assert result.confidence_score < 0.5
-
-    def test_extract_email_no_sender(self, extractor, tmp_path):
-        """Test email without sender address."""
-        eml = """Subject: Test Email
+_NO_SENDER_EML = """Subject: Test Email
 Date: Mon, 1 Jan 2024 12:00:00 +0000
 
 This is a test email without sender.
 """
-        file_path = tmp_path / "no_sender.eml"
-        file_path.write_text(eml)
-
-        result = extractor.extract(file_path)
-
-        # Should have error about missing sender
-        assert len(result.errors) > 0 or result.confidence_score < 0.5
 
-    def test_extract_email_invalid_date(self, extractor, tmp_path):
-        """Test email with invalid date format."""
-        eml = """From: test@example.com
+_INVALID_DATE_EML = """From: test@example.com
 Subject: Test Email
 Date: Invalid Date Format
 
 This is a test email.
 """
-        file_path = tmp_path / "invalid_date.eml"
-        file_path.write_text(eml)
-
-        result = extractor.extract(file_path)
 
-        # Should handle gracefully with warning
-        assert result is not None
-
-    def test_extract_email_with_greek_body(self, extractor, tmp_path):
-        """Test email with Greek content in body."""
-        eml = """From: =?utf-8?q?=CE=93=CE=B9=CF=8E=CF=81=CE=B3=CE=BF=CF=82?= <giorgos@example.gr>
+_GREEK_EML = """From: =?utf-8?q?=CE=93=CE=B9=CF=8E=CF=81=CE=B3=CE=BF=CF=82?= <giorgos@example.gr>
 To: info@techflow.gr
 Subject: =?utf-8?q?=CE=91=CE=AF=CF=84=CE=B7=CF=83=CE=B7_=CF=80=CE=BB=CE=B7=CF=81=CE=BF=CF=86=CE=BF=CF=81=CE=B9=CF=8E=CE=BD?=
 Date: Mon, 1 Jan 2024 12:00:00 +0200
@@ -179,63 +72,38 @@ Content-Type: text/plain; charset=utf-8
 Ευχαριστώ,
 Γιώργος
 """
-        file_path = tmp_path / "greek_email.eml"
-        file_path.write_bytes(eml.encode("utf-8"))
 
-        result = extractor.extract(file_path)
-
-        assert result is not None
-        assert result.email_data is not None
 
-    def test_extract_multipart_email(self, extractor, tmp_path):
-        """Test multipart email with HTML and plain text."""
-        eml = """From: test@example.com
-To: info@techflow.gr
-Subject: Multipart Test
-Date: Mon, 1 Jan 2024 12:00:00 +0000
-MIME-Version: 1.0
-Content-Type: multipart/alternative; boundary="boundary123"
-
---boundary123
-Content-Type: text/plain; charset=utf-8
-
-Plain text version of the email.
-
---boundary123
-Content-Type: text/html; charset=utf-8
-
-<html><body><p>HTML version of the email.</p></body></html>
-
---boundary123--
-"""
-        file_path = tmp_path / "multipart.eml"
-        file_path.write_text(eml)
-
-        result = extractor.extract(file_path)
-
-        assert result is not None
-
-    def test_extract_email_base64_encoded(self, extractor, tmp_path):
-        """Test email with base64 encoded body."""
-        # "Hello World" in base64
-        eml = """From: test@example.com
-Subject: Base64 Test
-Date: Mon, 1 Jan 2024 12:00:00 +0000
-Content-Type: text/plain; charset=utf-8
-Content-Transfer-Encoding: base64
-
-SGVsbG8gV29ybGQ=
-"""
-        file_path = tmp_path / "base64.eml"
-        file_path.write_text(eml)
-
-        result = extractor.extract(file_path)
-
-        assert result is not None
-
-    def test_extract_invoice_notification_email(self, extractor, tmp_path):
-        """Test invoice notification email classification."""
-        eml = """From: billing@company.com
+def _build_multipart() -> bytes:
+    """Build a multipart/alternative email with plain text and HTML parts."""
+    message = EmailMessage()
+    message["From"] = "test@example.com"
+    message["To"] = "info@techflow.gr"
+    message["Subject"] = "Multipart Test"
+    message["Date"] = "Mon, 1 Jan 2024 12:00:00 +0000"
+    message.set_content("Plain text version of the email.\n")
+    message.add_alternative(
+        "<html><body><p>HTML version of the email.</p></body></html>\n",
+        subtype="html",
+    )
+    message.set_boundary("boundary123")
+    return message.as_bytes(policy=email.policy.SMTP)
+
+
+_MULTIPART_EML = _build_multipart()
+
+# "Hello World" in base64, with RFC 5322 CRLF line endings
+_BASE64_EML = (
+    b"From: test@example.com\r\n"
+    b"Subject: Base64 Test\r\n"
+    b"Date: Mon, 1 Jan 2024 12:00:00 +0000\r\n"
+    b"Content-Type: text/plain; charset=utf-8\r\n"
+    b"Content-Transfer-Encoding: base64\r\n"
+    b"\r\n"
+    b"SGVsbG8gV29ybGQ=\r\n"
+)
+
+_INVOICE_EML = """From: billing@company.com
 To: info@techflow.gr
 Subject: Invoice #INV-2024-001 - Payment Due
 Date: Mon, 1 Jan 2024 12:00:00 +0000
@@ -248,42 +116,8 @@ Due Date: 15/01/2024
 
 Thank you for your business.
 """
-        file_path = tmp_path / "invoice_email.eml"
-        file_path.write_text(eml)
-
-        result = extractor.extract(file_path)
-
-        assert result.email_data is not None
-        # Should classify as invoice notification
-        assert result.email_data.email_type in ("invoice_notification", "inquiry")
-
-    def test_extract_file_not_found(self, extractor):
-        """Test extracting from non-existent file."""
-        result = extractor.extract(Path("/nonexistent/email.eml"))
-
-        assert len(result.errors) > 0
-        assert result.confidence_score == 0.0
-
-
-class TestInvoiceExtractorEdgeCases:
-    """Edge case tests for InvoiceExtractor."""
-
-    @pytest.fixture
-    def extractor(self):
-        return InvoiceExtractor()
-
-    def test_extract_empty_invoice(self, extractor, tmp_path):
-        """Test extracting from empty HTML invoice."""
-        file_path = tmp_path / "empty_invoice.html"
-        file_path.write_text("")
 
-        result = extractor.extract(file_path)
-
-        assert result.confidence_score < 0.5
-
-    def test_extract_invoice_greek_amounts(self, extractor, tmp_path):
-        """Test invoice with Greek number formatting."""
-        html = """
+_GREEK_INVOICE_HTML = """
         <html><body>
         <div class="invoice">
             <div class="invoice-number">ΤΙΜ-2024-001</div>
@@ -298,16 +132,8 @@ class TestInvoiceExtractorEdgeCases:
         </div>
         </body></html>
         """
-        file_path = tmp_path / "greek_invoice.html"
-        file_path.write_text(html, encoding="utf-8")
-
-        result = extractor.extract(file_path)
-
-        assert result is not None
 
-    def test_extract_invoice_missing_vat(self, extractor, tmp_path):
-        """Test invoice without VAT information."""
-        html = """
+_NO_VAT_INVOICE_HTML = """
         <html><body>
         <div class="invoice">
             <span>Invoice: INV-001</span>
@@ -317,17 +143,8 @@ class TestInvoiceExtractorEdgeCases:
         </div>
         </body></html>
         """
-        file_path = tmp_path / "no_vat_invoice.html"
-        file_path.write_text(html)
-
-        result = extractor.extract(file_path)
 
-        # Should have warning about missing VAT
-        assert result is not None
-
-    def test_extract_invoice_vat_mismatch(self, extractor, tmp_path):
-        """Test invoice where VAT calculation doesn't match."""
-        html = """
+_VAT_MISMATCH_HTML = """
         <html><body>
         <table class="invoice">
             <tr><td>Invoice Number:</td><td>INV-001</td></tr>
@@ -339,18 +156,8 @@ class TestInvoiceExtractorEdgeCases:
         </table>
         </body></html>
         """
-        file_path = tmp_path / "vat_mismatch.html"
-        file_path.write_text(html)
 
-        result = extractor.extract(file_path)
-
-        # Should have warning about VAT mismatch (200 != 240)
-        if result.invoice_data:
-            assert len(result.warnings) > 0 or result.confidence_score < 1.0
-
-    def test_extract_invoice_multiple_line_items(self, extractor, tmp_path):
-        """Test invoice with multiple line items."""
-        html = """
+_MULTI_ITEM_INVOICE_HTML = """
         <html><body>
         <div class="invoice">
             <h1>ΤΙΜΟΛΟΓΙΟ</h1>
@@ -368,27 +175,30 @@ class TestInvoiceExtractorEdgeCases:
         </div>
         </body></html>
         """
-        file_path = tmp_path / "multi_item_invoice.html"
-        file_path.write_text(html, encoding="utf-8")
 
-        result = extractor.extract(file_path)
+_SPECIAL_CHARS_INVOICE_HTML = """
+        <html><body>
+        <div class="invoice">
+            <p>Invoice: INV-001</p>
+            <p>Date: 01/01/2024</p>
+            <p>Client: O'Brien & Partners Ltd.</p>
+            <p>Address: 123 "Main" Street</p>
+            <p>Total: €1,000.00</p>
+        </div>
+        </body></html>
+        """
 
-        assert result is not None
-        if result.invoice_data:
-            assert len(result.invoice_data.items) >= 1 or result.invoice_data.total_amount > 0
+DATE_FORMATS = [
+    "01/01/2024",
+    "2024-01-01",
+    "01-01-2024",
+    "January 1, 2024",
+    "1 Ιανουαρίου 2024",
+]
 
-    def test_extract_invoice_different_date_formats(self, extractor, tmp_path):
-        """Test invoice with various date formats."""
-        date_formats = [
-            "01/01/2024",
-            "2024-01-01",
-            "01-01-2024",
-            "January 1, 2024",
-            "1 Ιανουαρίου 2024",
-        ]
 
-        for i, date_str in enumerate(date_formats):
-            html = f"""
+def _date_format_invoice(i: int, date_str: str) -> str:
+    return f"""
             <html><body>
             <div class="invoice">
                 <p>Invoice: INV-{i:03d}</p>
@@ -398,36 +208,226 @@ class TestInvoiceExtractorEdgeCases:
             </div>
             </body></html>
             """
-            file_path = tmp_path / f"date_format_{i}.html"
-            file_path.write_text(html, encoding="utf-8")
 
-            result = extractor.extract(file_path)
-            assert result is not None
 
-    def test_extract_file_not_found(self, extractor):
-        """Test extracting from non-existent file."""
-        result = extractor.extract(Path("/nonexistent/invoice.html"))
+CORPUS: dict[str, bytes] = {
+    name: payload if isinstance(payload, bytes) else payload.encode("utf-8")
+    for name, payload in {
+        "empty.html": "",
+        "no_form.html": "<html><body><p>No form here</p></body></html>",
+        "greek_form.html": _GREEK_FORM_HTML,
+        "malformed.html": "<html><body><form><input name='test' value='data'<broken>",
+        "incomplete.html": _INCOMPLETE_FORM_HTML,
+        "select_form.html": _SELECT_FORM_HTML,
+        "empty.eml": "",
+        "no_sender.eml": _NO_SENDER_EML,
+        "invalid_date.eml": _INVALID_DATE_EML,
+        "greek_email.eml": _GREEK_EML,
+        "multipart.eml": _MULTIPART_EML,
+        "base64.eml": _BASE64_EML,
+        "invoice_email.eml": _INVOICE_EML,
+        "empty_invoice.html": "",
+        "greek_invoice.html": _GREEK_INVOICE_HTML,
+        "no_vat_invoice.html": _NO_VAT_INVOICE_HTML,
+        "vat_mismatch.html": _VAT_MISMATCH_HTML,
+        "multi_item_invoice.html": _MULTI_ITEM_INVOICE_HTML,
+        "special_chars.html": _SPECIAL_CHARS_INVOICE_HTML,
+        **{
+            f"date_format_{i}.html": _date_format_invoice(i, date_str)
+            for i, date_str in enumerate(DATE_FORMATS)
+        },
+    }.items()
+}
+
+
+@pytest.fixture(scope="session")
+def corpus(corpus_root: Path) -> dict[str, Path]:
+    """All edge-case input files, written once per session."""
+    return shared_corpus(corpus_root, "edge_cases", CORPUS)
+
+
+MISSING_FILES = [
+    (FormExtractor, Path("/nonexistent/file.html")),
+    (EmailExtractor, Path("/nonexistent/email.eml")),
+    (InvoiceExtractor, Path("/nonexistent/invoice.html")),
+]
+
+
+@pytest.fixture(
+    scope="session",
+    params=MISSING_FILES,
+    ids=[factory.__name__ for factory, _ in MISSING_FILES],
+)
+def missing_file_case(request):
+    """Extractor instance paired with a path that does not exist."""
+    factory, path = request.param
+    return factory(), path
+
+
+def test_extract_file_not_found(missing_file_case):
+    """Test that every extractor reports a missing file as an error result."""
+    extractor, path = missing_file_case
+    result = extractor.extract(path)
+
+    assert len(result.errors) > 0
+    assert result.confidence_score == 0.0
 
-        assert len(result.errors) > 0
-        assert result.confidence_score == 0.0
 
-    def test_extract_invoice_with_special_characters(self, extractor, tmp_path):
-        """Test invoice with special characters in client name."""
-        html = """
-        <html><body>
-        <div class="invoice">
-            <p>Invoice: INV-001</p>
-            <p>Date: 01/01/2024</p>
-            <p>Client: O'Brien & Partners Ltd.</p>
-            <p>Address: 123 "Main" Street</p>
-            <p>Total: €1,000.00</p>
-        </div>
-        </body></html>
-        """
-        file_path = tmp_path / "special_chars.html"
-        file_path.write_text(html)
+class TestFormExtractorEdgeCases:
+    """Edge case tests for FormExtractor."""
+
+    @pytest.fixture
+    def extractor(self):
+        return FormExtractor()
 
-        result = extractor.extract(file_path)
+    def test_extract_empty_html(self, extractor, corpus):
+        """Test extracting from empty HTML file."""
+        result = extractor.extract(corpus["empty.html"])
+
+        assert result.confidence_score < 0.5
+        assert len(result.errors) > 0 or len(result.warnings) > 0
+
+    def test_extract_html_no_form(self, extractor, corpus):
+        """Test extracting from HTML without form element."""
+        result = extractor.extract(corpus["no_form.html"])
+
+        # Should handle gracefully
+        assert result is not None
+
+    def test_extract_html_with_greek_characters(self, extractor, corpus):
+        """Test extracting form with Greek characters."""
+        result = extractor.extract(corpus["greek_form.html"])
+
+        assert result.form_data is not None
+        assert "Γιώργος" in str(result.form_data.full_name) or result.form_data.full_name is not None
+
+    def test_extract_malformed_html(self, extractor, corpus):
+        """Test extracting from malformed HTML."""
+        result = extractor.extract(corpus["malformed.html"])
+
+        # Should handle gracefully without crashing
+        assert result is not None
+
+    def test_extract_form_missing_required_fields(self, extractor, corpus):
+        """Test form with missing required fields."""
+        result = extractor.extract(corpus["incomplete.html"])
+
+        # Should have low confidence or warnings
+        assert result.confidence_score < 1.0
+
+    def test_extract_form_with_select_elements(self, extractor, corpus):
+        """Test form with select/dropdown elements."""
+        result = extractor.extract(corpus["select_form.html"])
+
+        assert result.form_data is not None
+
+
+class TestEmailExtractorEdgeCases:
+    """Edge case tests for EmailExtractor."""
+
+    @pytest.fixture
+    def extractor(self):
+        return EmailExtractor()
+
+    def test_extract_empty_email(self, extractor, corpus):
+        """Test extracting from empty EML file."""
+        result = extractor.extract(corpus["empty.eml"])
+
+        assert result.confidence_score < 0.5
+
+    def test_extract_email_no_sender(self, extractor, corpus):
+        """Test email without sender address."""
+        result = extractor.extract(corpus["no_sender.eml"])
+
+        # Should have error about missing sender
+        assert len(result.errors) > 0 or result.confidence_score < 0.5
+
+    def test_extract_email_invalid_date(self, extractor, corpus):
+        """Test email with invalid date format."""
+        result = extractor.extract(corpus["invalid_date.eml"])
+
+        # Should handle gracefully with warning
+        assert result is not None
+
+    def test_extract_email_with_greek_body(self, extractor, corpus):
+        """Test email with Greek content in body."""
+        result = extractor.extract(corpus["greek_email.eml"])
+
+        assert result is not None
+        assert result.email_data is not None
+
+    def test_extract_multipart_email(self, extractor, corpus):
+        """Test multipart email with HTML and plain text."""
+        result = extractor.extract(corpus["multipart.eml"])
+
+        assert result is not None
+
+    def test_extract_email_base64_encoded(self, extractor, corpus):
+        """Test email with base64 encoded body."""
+        result = extractor.extract(corpus["base64.eml"])
+
+        assert result is not None
+
+    def test_extract_invoice_notification_email(self, extractor, corpus):
+        """Test invoice notification email classification."""
+        result = extractor.extract(corpus["invoice_email.eml"])
+
+        assert result.email_data is not None
+        # Should classify as invoice notification
+        assert result.email_data.email_type in ("invoice_notification", "inquiry")
+
+
+class TestInvoiceExtractorEdgeCases:
+    """Edge case tests for InvoiceExtractor."""
+
+    @pytest.fixture
+    def extractor(self):
+        return InvoiceExtractor()
+
+    def test_extract_empty_invoice(self, extractor, corpus):
+        """Test extracting from empty HTML invoice."""
+        result = extractor.extract(corpus["empty_invoice.html"])
+
+        assert result.confidence_score < 0.5
+
+    def test_extract_invoice_greek_amounts(self, extractor, corpus):
+        """Test invoice with Greek number formatting."""
+        result = extractor.extract(corpus["greek_invoice.html"])
+
+        assert result is not None
+
+    def test_extract_invoice_missing_vat(self, extractor, corpus):
+        """Test invoice without VAT information."""
+        result = extractor.extract(corpus["no_vat_invoice.html"])
+
+        # Should have warning about missing VAT
+        assert result is not None
+
+    def test_extract_invoice_vat_mismatch(self, extractor, corpus):
+        """Test invoice where VAT calculation doesn't match."""
+        result = extractor.extract(corpus["vat_mismatch.html"])
+
+        # Should have warning about VAT mismatch (200 != 240)
+        if result.invoice_data:
+            assert len(result.warnings) > 0 or result.confidence_score < 1.0
+
+    def test_extract_invoice_multiple_line_items(self, extractor, corpus):
+        """Test invoice with multiple line items."""
+        result = extractor.extract(corpus["multi_item_invoice.html"])
+
+        assert result is not None
+        if result.invoice_data:
+            assert len(result.invoice_data.items) >= 1 or result.invoice_data.total_amount > 0
+
+    def test_extract_invoice_different_date_formats(self, extractor, corpus):
+        """Test invoice with various date formats."""
+        for i in range(len(DATE_FORMATS)):
+            result = extractor.extract(corpus[f"date_format_{i}.html"])
+            assert result is not None
+
+    def test_extract_invoice_with_special_characters(self, extractor, corpus):
+        """Test invoice with special characters in client name."""
+        result = extractor.extract(corpus["special_chars.html"])
 
         assert result is not None
 
@@ -435,50 +435,60 @@ class TestInvoiceExtractorEdgeCases:
 class TestBackgroundSyncWorker:
     """Tests for background sync worker functions."""
 
-    @pytest.mark.anyio
-    async def test_background_sync_worker_no_session(self):
+    @pytest.fixture
+    def no_session(self, monkeypatch):
+        """Simulate AsyncSessionLocal being unavailable."""
+        monkeypatch.setattr("app.services.record_service.AsyncSessionLocal", None)
+
+    async def test_background_sync_worker_no_session(self, no_session):
         """Test background sync worker when session is not available."""
         from app.services.record_service import background_sync_worker
         from uuid import uuid4
 
         # Should handle gracefully when AsyncSessionLocal is None
-        with patch("app.services.record_service.AsyncSessionLocal", None):
-            await background_sync_worker(uuid4(), "approved")
-            # Should not raise exception
+        await background_sync_worker(uuid4(), "approved")
+        # Should not raise exception
 
-    @pytest.mark.anyio
-    async def test_background_export_sync_worker_no_session(self):
+    async def test_background_export_sync_worker_no_session(self, no_session):
         """Test background export sync worker when session is not available."""
         from app.services.record_service import background_export_sync_worker
 
-        with patch("app.services.record_service.AsyncSessionLocal", None):
-            await background_export_sync_worker(["id1", "id2"])
-            # Should not raise exception
+        await background_export_sync_worker(["id1", "id2"])
+        # Should not raise exception
 
 
-class TestGreekTextProcessing:
-    """Tests for Greek text processing in extractors."""
+GREEK_PHONES = [
+    "210-1234567",
+    "2101234567",
+    "6971234567",
+    "697 123 4567",
+    "+30 210 1234567",
+    "+30-6971234567",
+]
 
-    def test_greek_phone_numbers(self):
-        """Test extraction of Greek phone number formats."""
-        from app.extractors.form_extractor import FormExtractor
+# Greek number formats (comma as decimal separator)
+GREEK_AMOUNTS = [
+    ("1.500,00 €", Decimal("1500.00")),
+    ("€1.500,00", Decimal("1500.00")),
+    ("1500,00€", Decimal("1500.00")),
+    ("1.234.567,89 €", Decimal("1234567.89")),
+]
 
-        extractor = FormExtractor()
 
-        # Greek phone formats
-        test_phones = [
-            "210-1234567",
-            "2101234567",
-            "6971234567",
-            "697 123 4567",
-            "+30 210 1234567",
-            "+30-6971234567",
-        ]
+@pytest.fixture(scope="module")
+def invoice_extractor() -> InvoiceExtractor:
+    """Share one stateless invoice extractor across the Greek text tests."""
+    return InvoiceExtractor()
 
-        for phone in test_phones:
-            # Should handle Greek phone formats
-            result = extractor._normalize_phone(phone) if hasattr(extractor, '_normalize_phone') else phone
-            assert result is not None
+
+class TestGreekTextProcessing:
+    """Tests for Greek text processing in extractors."""
+
+    @pytest.mark.parametrize("phone", GREEK_PHONES)
+    def test_greek_phone_numbers(self, phone):
+        """Test Greek phone number formats pass ContactFormData phone validation."""
+        form = ContactFormData(full_name="Test", email="test@example.gr", phone=phone)
+        assert form.phone == phone
 
     def test_greek_company_names(self):
         """Test handling of Greek company name suffixes."""
@@ -493,22 +503,7 @@ class TestGreekTextProcessing:
             # Company names should be preserved
             assert "ΑΕ" in company or "ΕΠΕ" in company or "ΟΕ" in company or "ΙΚΕ" in company
 
-    def test_greek_currency_parsing(self):
+    @pytest.mark.parametrize("amount_str,expected", GREEK_AMOUNTS)
+    def test_greek_currency_parsing(self, invoice_extractor, amount_str, expected):
         """Test parsing of Greek currency formats."""
-        from app.extractors.invoice_extractor import InvoiceExtractor
-
-        extractor = InvoiceExtractor()
-
-        # Greek number formats (comma as decimal separator)
-        test_amounts = [
-            ("1.500,00 €", 1500.00),
-            ("€1.500,00", 1500.00),
-            ("1500,00€", 1500.00),
-            ("1.234.567,89 €", 1234567.89),
-        ]
-
-        for amount_str, expected in test_amounts:
-            # The extractor should handle Greek number format
-            result = extractor._parse_amount(amount_str) if hasattr(extractor, '_parse_amount') else None
-            # Just verify no crash
-            assert True
+        assert invoice_extractor._parse_amount(amount_str) == expected
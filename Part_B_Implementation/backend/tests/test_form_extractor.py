@@ -4,18 +4,21 @@ Unit tests for FormExtractor.
 
 from datetime import datetime
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 import pytest
+from bs4 import BeautifulSoup
 
 from app.extractors.form_extractor import FormExtractor
 from app.models.schemas import Priority, RecordType
+from tests.helpers import dummy_files
+
+FORMS = dummy_files("forms", ".html")
 
 
 class TestFormExtractor:
     """Tests for the FormExtractor class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def extractor(self) -> FormExtractor:
         """Create a FormExtractor instance."""
         return FormExtractor()
@@ -24,27 +27,30 @@ class TestFormExtractor:
         self, extractor: FormExtractor, sample_form_html: str
     ) -> None:
         """Test extraction from sample HTML content."""
-        with NamedTemporaryFile(mode="w", suffix=".html", delete=False, encoding="utf-8") as f:
-            f.write(sample_form_html)
-            f.flush()
-            file_path = Path(f.name)
-
-        try:
-            result = extractor.extract(file_path)
-
-            assert result.record_type == RecordType.FORM
-            assert not result.has_errors
-            assert result.form_data is not None
-
-            data = result.form_data
-            assert data.full_name == "Τεστ Χρήστης"
-            assert data.email == "test@example.gr"
-            assert data.phone == "210-1234567"
-            assert data.company == "Test Company"
-            assert data.priority == Priority.HIGH
-            assert result.confidence_score >= 0.8
-        finally:
-            file_path.unlink()
+        result = extractor.extract_from_bytes(sample_form_html.encode("utf-8"), Path("form.html"))
+
+        assert result.record_type == RecordType.FORM
+        assert not result.has_errors
+        assert result.form_data is not None
+
+        data = result.form_data
+        assert data.full_name == "Τεστ Χρήστης"
+        assert data.email == "test@example.gr"
+        assert data.phone == "210-1234567"
+        assert data.company == "Test Company"
+        assert data.priority == Priority.HIGH
+        assert result.confidence_score >= 0.8
+
+    def test_extract_form_fields(
+        self, extractor: FormExtractor, sample_form_soup: BeautifulSoup
+    ) -> None:
+        """Test raw field extraction from a pre-parsed form."""
+        fields = extractor._extract_form_fields(sample_form_soup)
+
+        assert fields["full_name"] == "Τεστ Χρήστης"
+        assert fields["service"] == "web_development"
+        assert fields["message"] == "Test message"
+        assert fields["priority"] == "high"
 
     def test_extract_from_real_form(
         self, extractor: FormExtractor, forms_path: Path
@@ -66,20 +72,16 @@ class TestFormExtractor:
         assert data.phone == "210-1234567"
         assert data.company == "Digital Marketing Pro"
 
+    @pytest.mark.parametrize("form_file", FORMS, ids=lambda p: p.name)
     def test_extract_all_forms(
-        self, extractor: FormExtractor, forms_path: Path
+        self, extractor: FormExtractor, form_file: Path
     ) -> None:
-        """Test extraction from all dummy data forms."""
-        form_files = list(forms_path.glob("*.html"))
-        if not form_files:
-            pytest.skip("No form files found")
-
-        for form_file in form_files:
-            result = extractor.extract(form_file)
+        """Test extraction from each dummy data form."""
+        result = extractor.extract(form_file)
 
-            assert not result.has_errors, f"Errors in {form_file.name}: {result.errors}"
-            assert result.form_data is not None, f"No data extracted from {form_file.name}"
-            assert result.confidence_score >= 0.5, f"Low confidence for {form_file.name}"
+        assert not result.has_errors, f"Errors in {form_file.name}: {result.errors}"
+        assert result.form_data is not None, f"No data extracted from {form_file.name}"
+        assert result.confidence_score >= 0.5, f"Low confidence for {form_file.name}"
 
     def test_missing_file(self, extractor: FormExtractor) -> None:
         """Test extraction from non-existent file."""
@@ -144,6 +146,13 @@ class TestFormExtractor:
         assert result is not None
         assert result.day == 15
 
+        # Full timestamp and dashed Greek format
+        assert extractor._parse_date("2024-01-15 14:30:05") == datetime(2024, 1, 15, 14, 30, 5)
+        assert extractor._parse_date("15-01-2024") == datetime(2024, 1, 15)
+
         # Invalid format
         result = extractor._parse_date("invalid")
         assert result is None
+
+        # Well-formed but out of range
+        assert extractor._parse_date("2024-13-01") is None
@@ -4,18 +4,25 @@ Unit tests for InvoiceExtractor.
 
 from decimal import Decimal
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 import pytest
+from bs4 import BeautifulSoup
 
 from app.extractors.invoice_extractor import InvoiceExtractor
 from app.models.schemas import RecordType
+from tests.decimals import D_1, D_24, D_100, D_24_00, D_100_00, D_124_00, D_850_00, D_1054_00
+from tests.helpers import FROZEN_NOW, dummy_files, make_soup
+
+INVOICES = dummy_files("invoices", ".html")
+
+# Standard Greek VAT rate as a fraction, computed once
+VAT_FRACTION = D_24 / D_100
 
 
 class TestInvoiceExtractor:
     """Tests for the InvoiceExtractor class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def extractor(self) -> InvoiceExtractor:
         """Create an InvoiceExtractor instance."""
         return InvoiceExtractor()
@@ -24,26 +31,28 @@ class TestInvoiceExtractor:
         self, extractor: InvoiceExtractor, sample_invoice_html: str
     ) -> None:
         """Test extraction from sample HTML content."""
-        with NamedTemporaryFile(mode="w", suffix=".html", delete=False, encoding="utf-8") as f:
-            f.write(sample_invoice_html)
-            f.flush()
-            file_path = Path(f.name)
-
-        try:
-            result = extractor.extract(file_path)
-
-            assert result.record_type == RecordType.INVOICE
-            assert not result.has_errors, f"Errors: {result.errors}"
-            assert result.invoice_data is not None
-
-            data = result.invoice_data
-            assert data.invoice_number == "TF-2024-999"
-            assert data.net_amount == Decimal("100.00")
-            assert data.vat_amount == Decimal("24.00")
-            assert data.total_amount == Decimal("124.00")
-            assert result.confidence_score >= 0.7
-        finally:
-            file_path.unlink()
+        result = extractor.extract_from_bytes(sample_invoice_html.encode("utf-8"), Path("invoice.html"))
+
+        assert result.record_type == RecordType.INVOICE
+        assert not result.has_errors, f"Errors: {result.errors}"
+        assert result.invoice_data is not None
+
+        data = result.invoice_data
+        assert data.invoice_number == "TF-2024-999"
+        assert data.net_amount == D_100_00
+        assert data.vat_amount == D_24_00
+        assert data.total_amount == D_124_00
+        assert result.confidence_score >= 0.7
+
+    def test_totals_extraction(
+        self, extractor: InvoiceExtractor, sample_invoice_soup: BeautifulSoup
+    ) -> None:
+        """Test totals extraction from a pre-parsed invoice."""
+        totals = extractor._extract_totals(sample_invoice_soup)
+
+        assert totals["net_amount"] == D_100_00
+        assert totals["vat_amount"] == D_24_00
+        assert totals["total_amount"] == D_124_00
 
     def test_extract_from_real_invoice(
         self, extractor: InvoiceExtractor, invoices_path: Path
@@ -62,31 +71,27 @@ class TestInvoiceExtractor:
         data = result.invoice_data
         assert data.invoice_number == "TF-2024-001"
         assert data.client_name == "Office Solutions Ltd"
-        assert data.net_amount == Decimal("850.00")
-        assert data.vat_rate == Decimal("24")
+        assert data.net_amount == D_850_00
+        assert data.vat_rate == D_24
         assert data.vat_amount == Decimal("204.00")
-        assert data.total_amount == Decimal("1054.00")
+        assert data.total_amount == D_1054_00
 
+    @pytest.mark.parametrize("invoice_file", INVOICES, ids=lambda p: p.name)
     def test_extract_all_invoices(
-        self, extractor: InvoiceExtractor, invoices_path: Path
+        self, extractor: InvoiceExtractor, invoice_file: Path
     ) -> None:
-        """Test extraction from all dummy data invoices."""
-        invoice_files = list(invoices_path.glob("*.html"))
-        if not invoice_files:
-            pytest.skip("No invoice files found")
-
-        for invoice_file in invoice_files:
-            result = extractor.extract(invoice_file)
+        """Test extraction from each dummy data invoice."""
+        result = extractor.extract(invoice_file)
 
-            assert not result.has_errors, f"Errors in {invoice_file.name}: {result.errors}"
-            assert result.invoice_data is not None, f"No data from {invoice_file.name}"
-            assert result.confidence_score >= 0.5, f"Low confidence for {invoice_file.name}"
+        assert not result.has_errors, f"Errors in {invoice_file.name}: {result.errors}"
+        assert result.invoice_data is not None, f"No data from {invoice_file.name}"
+        assert result.confidence_score >= 0.5, f"Low confidence for {invoice_file.name}"
 
-            # Verify VAT calculation (24%)
-            data = result.invoice_data
-            expected_vat = data.net_amount * Decimal("24") / Decimal("100")
-            assert abs(data.vat_amount - expected_vat) < Decimal("1"), \
-                f"VAT mismatch in {invoice_file.name}"
+        # Verify VAT calculation (24%)
+        data = result.invoice_data
+        expected_vat = data.net_amount * VAT_FRACTION
+        assert abs(data.vat_amount - expected_vat) < D_1, \
+            f"VAT mismatch in {invoice_file.name}"
 
     def test_missing_file(self, extractor: InvoiceExtractor) -> None:
         """Test extraction from non-existent file."""
@@ -98,26 +103,22 @@ class TestInvoiceExtractor:
 
     def test_invoice_number_extraction(self, extractor: InvoiceExtractor) -> None:
         """Test invoice number extraction from various formats."""
-        from bs4 import BeautifulSoup
-
         # Test from text
         html = "<html><body>Αριθμός: TF-2024-001</body></html>"
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         assert extractor._extract_invoice_number(soup, "test.html") == "TF-2024-001"
 
         # Test from filename
         html = "<html><body>Some content</body></html>"
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         assert extractor._extract_invoice_number(
             soup, "invoice_TF-2024-002.html"
         ) == "TF-2024-002"
 
     def test_date_extraction(self, extractor: InvoiceExtractor) -> None:
         """Test date extraction."""
-        from bs4 import BeautifulSoup
-
         html = "<html><body>Ημερομηνία: 21/01/2024</body></html>"
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         date = extractor._extract_date(soup)
 
         assert date is not None
@@ -127,17 +128,15 @@ class TestInvoiceExtractor:
 
     def test_amount_parsing(self, extractor: InvoiceExtractor) -> None:
         """Test amount parsing."""
-        assert extractor._parse_amount("€850.00") == Decimal("850.00")
-        assert extractor._parse_amount("1,054.00") == Decimal("1054.00")
-        assert extractor._parse_amount("1.054,00") == Decimal("1054.00")
+        assert extractor._parse_amount("€850.00") == D_850_00
+        assert extractor._parse_amount("1,054.00") == D_1054_00
+        assert extractor._parse_amount("1.054,00") == D_1054_00
         assert extractor._parse_amount("€ 2,976.00") == Decimal("2976.00")
         assert extractor._parse_amount(None) is None
         assert extractor._parse_amount("") is None
 
     def test_line_items_extraction(self, extractor: InvoiceExtractor) -> None:
         """Test line items extraction from table."""
-        from bs4 import BeautifulSoup
-
         html = '''
         <table class="invoice-table">
             <thead><tr><th>Περιγραφή</th><th>Qty</th><th>Price</th><th>Total</th></tr></thead>
@@ -147,7 +146,7 @@ class TestInvoiceExtractor:
             </tbody>
         </table>
         '''
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         items = extractor._extract_line_items(soup)
 
         assert len(items) == 2
@@ -162,12 +161,12 @@ class TestInvoiceExtractor:
 
         data = InvoiceData(
             invoice_number="TF-2024-001",
-            invoice_date=extractor._extract_date.__func__.__globals__["datetime"].utcnow(),
+            invoice_date=FROZEN_NOW,
             client_name="Test Client",
-            net_amount=Decimal("100.00"),
-            vat_rate=Decimal("24"),
-            vat_amount=Decimal("24.00"),
-            total_amount=Decimal("124.00"),
+            net_amount=D_100_00,
+            vat_rate=D_24,
+            vat_amount=D_24_00,
+            total_amount=D_124_00,
         )
 
         is_valid, messages = extractor.validate(data)
@@ -176,16 +175,14 @@ class TestInvoiceExtractor:
 
     def test_validate_vat_mismatch(self, extractor: InvoiceExtractor) -> None:
         """Test validation catches VAT mismatch."""
-        from datetime import datetime
-
         from app.models.schemas import InvoiceData
 
         data = InvoiceData(
             invoice_number="TF-2024-001",
-            invoice_date=datetime.utcnow(),
+            invoice_date=FROZEN_NOW,
             client_name="Test Client",
-            net_amount=Decimal("100.00"),
-            vat_rate=Decimal("24"),
+            net_amount=D_100_00,
+            vat_rate=D_24,
             vat_amount=Decimal("30.00"),  # Wrong VAT
             total_amount=Decimal("130.00"),
         )
@@ -0,0 +1,48 @@
+"""
+Tests for the application lifespan.
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from app import main
+
+
+@pytest.fixture
+def lifespan_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> list[object]:
+    """
+    Stub out the lifespan's I/O.
+
+    Returns the task factory seen when audit_logger.close() runs.
+    """
+    factories: list[object] = []
+
+    async def close_audit_logger() -> None:
+        factories.append(asyncio.get_running_loop().get_task_factory())
+
+    async def noop() -> None:
+        pass
+
+    monkeypatch.setattr(main.settings, "database_url", "postgresql://test/db")
+    monkeypatch.setattr(main.settings, "data_path", tmp_path)
+    monkeypatch.setattr(main.settings, "output_path", tmp_path / "output")
+    monkeypatch.setattr(main, "init_db", noop)
+    monkeypatch.setattr(main, "close_db", noop)
+    monkeypatch.setattr(main, "start_embedding_model_loading", lambda: None)
+    monkeypatch.setattr(main.audit_logger, "close", close_audit_logger)
+    return factories
+
+
+async def test_lifespan_restores_task_factory(lifespan_env: list[object]) -> None:
+    """Test the eager task factory is installed only while the app runs."""
+    loop = asyncio.get_running_loop()
+    previous = loop.get_task_factory()
+
+    async with main.lifespan(main.app):
+        assert loop.get_task_factory() is asyncio.eager_task_factory
+
+    # Audit rows are flushed while tasks still start eagerly
+    assert lifespan_env == [asyncio.eager_task_factory]
+    assert loop.get_task_factory() is previous
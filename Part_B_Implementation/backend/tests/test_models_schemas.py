@@ -2,7 +2,6 @@
 Tests for Pydantic models/schemas.
 """
 
-from datetime import datetime
 from decimal import Decimal
 from uuid import uuid4
 
@@ -24,6 +23,8 @@ from app.models.schemas import (
     EditRequest,
     ExportRequest,
 )
+from tests.decimals import D_24, D_100, D_240_00
+from tests.helpers import FROZEN_NOW, make_form, make_item
 
 
 class TestPriority:
@@ -79,7 +80,7 @@ class TestContactFormData:
             company="Test Company",
             service_interest="CRM System",
             message="Test message",
-            submission_date=datetime.now(),
+            submission_date=FROZEN_NOW,
             priority=Priority.HIGH,
         )
         assert form.phone == "210-1234567"
@@ -103,6 +104,21 @@ class TestContactFormData:
         assert "Κώστας" in form.full_name
         assert "Καλημέρα" in form.message
 
+    def test_frozen(self) -> None:
+        """Test that extracted form data cannot be reassigned."""
+        form = ContactFormData(full_name="Test", email="test@example.com")
+        with pytest.raises(ValidationError):
+            form.full_name = "Changed"
+
+    def test_extra_fields_ignored(self) -> None:
+        """Test that unknown fields are dropped rather than rejected."""
+        form = ContactFormData(
+            full_name="Test",
+            email="test@example.com",
+            unexpected="value",
+        )
+        assert not hasattr(form, "unexpected")
+
 
 class TestEmailData:
     """Tests for EmailData model."""
@@ -116,7 +132,7 @@ class TestEmailData:
             sender_email="sender@example.com",
             recipient_email="info@techflow.gr",
             subject="Test Subject",
-            date_sent=datetime.now(),
+            date_sent=FROZEN_NOW,
             body="Test body content",
         )
         assert email.sender_name == "Test Sender"
@@ -131,7 +147,7 @@ class TestEmailData:
             sender_email="test@example.com",
             recipient_email="info@techflow.gr",
             subject="Inquiry",
-            date_sent=datetime.now(),
+            date_sent=FROZEN_NOW,
             body="Body",
         )
         assert email.email_type == EmailType.CLIENT_INQUIRY
@@ -146,11 +162,11 @@ class TestInvoiceItem:
             description="Χαρτί Α4",
             quantity=20,
             unit_price=Decimal("12.00"),
-            total=Decimal("240.00"),
+            total=D_240_00,
         )
         assert item.description == "Χαρτί Α4"
         assert item.quantity == 20
-        assert item.total == Decimal("240.00")
+        assert item.total == D_240_00
 
 
 class TestInvoiceData:
@@ -160,38 +176,38 @@ class TestInvoiceData:
         """Test valid invoice data."""
         invoice = InvoiceData(
             invoice_number="TF-2024-001",
-            invoice_date=datetime.now(),
+            invoice_date=FROZEN_NOW,
             client_name="Test Client",
             net_amount=Decimal("1000.00"),
-            vat_rate=Decimal("24"),
-            vat_amount=Decimal("240.00"),
+            vat_rate=D_24,
+            vat_amount=D_240_00,
             total_amount=Decimal("1240.00"),
         )
         assert invoice.invoice_number == "TF-2024-001"
-        assert invoice.vat_rate == Decimal("24")
+        assert invoice.vat_rate == D_24
 
     def test_invoice_with_items(self) -> None:
         """Test invoice with line items."""
         items = [
-            InvoiceItem(
+            make_item(
                 description="Item 1",
                 quantity=1,
-                unit_price=Decimal("100"),
-                total=Decimal("100"),
+                unit_price=D_100,
+                total=D_100,
             ),
-            InvoiceItem(
+            make_item(
                 description="Item 2",
                 quantity=2,
                 unit_price=Decimal("50"),
-                total=Decimal("100"),
+                total=D_100,
             ),
         ]
         invoice = InvoiceData(
             invoice_number="TF-2024-002",
-            invoice_date=datetime.now(),
+            invoice_date=FROZEN_NOW,
             client_name="Client",
             net_amount=Decimal("200"),
-            vat_rate=Decimal("24"),
+            vat_rate=D_24,
             vat_amount=Decimal("48"),
             total_amount=Decimal("248"),
             items=items,
@@ -204,7 +220,7 @@ class TestExtractionResult:
 
     def test_result_with_form_data(self) -> None:
         """Test extraction result with form data."""
-        form = ContactFormData(
+        form = make_form(
             full_name="Test",
             email="test@test.com",
         )
@@ -239,6 +255,27 @@ class TestExtractionResult:
         )
         assert len(result.warnings) == 1
 
+    def test_result_json_round_trip(self) -> None:
+        """Test extraction result survives a JSON round trip."""
+        result = ExtractionResult(
+            source_file="form_1.html",
+            record_type=RecordType.FORM,
+            form_data=make_form(submission_date=FROZEN_NOW),
+            confidence_score=0.95,
+            extracted_at=FROZEN_NOW,
+        )
+        encoded = result.model_dump_json()
+        assert ExtractionResult.model_validate_json(encoded).model_dump_json() == encoded
+
+    def test_result_is_frozen(self) -> None:
+        """Test that extraction results cannot be reassigned."""
+        result = ExtractionResult(
+            source_file="file.html",
+            record_type=RecordType.FORM,
+        )
+        with pytest.raises(ValidationError):
+            result.confidence_score = 0.5
+
 
 class TestApproveRequest:
     """Tests for ApproveRequest model."""
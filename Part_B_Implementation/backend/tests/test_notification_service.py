@@ -2,12 +2,16 @@
 Tests for the notification service (WebSocket notifications).
 """
 
+import asyncio
+import json
+from typing import Any
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
-from starlette.websockets import WebSocketState
 
+from app.services import notification_service
 from app.services.notification_service import (
     NotificationManager,
     get_notification_manager,
@@ -15,6 +19,11 @@ from app.services.notification_service import (
 )
 
 
+def _sent(ws: MagicMock) -> dict[str, Any]:
+    """Decode the last payload broadcast to a mock WebSocket."""
+    return json.loads(ws.send_text.call_args[0][0])
+
+
 class TestNotificationManager:
     """Tests for NotificationManager class."""
 
@@ -29,22 +38,14 @@ class TestNotificationManager:
         ws = MagicMock()
         ws.accept = AsyncMock()
         ws.send_json = AsyncMock()
-        ws.client_state = WebSocketState.CONNECTED
-        return ws
-
-    @pytest.fixture
-    def disconnected_websocket(self) -> MagicMock:
-        """Create a mock disconnected WebSocket."""
-        ws = MagicMock()
-        ws.client_state = WebSocketState.DISCONNECTED
+        ws.send_text = AsyncMock()
         return ws
 
     def test_manager_creation(self, manager: NotificationManager) -> None:
         """Test NotificationManager can be instantiated."""
         assert manager is not None
-        assert manager.active_connections == []
+        assert manager.active_connections == set()
 
-    @pytest.mark.anyio
     async def test_connect(self, manager: NotificationManager, mock_websocket: MagicMock) -> None:
         """Test connecting a WebSocket."""
         await manager.connect(mock_websocket)
@@ -53,14 +54,12 @@ class TestNotificationManager:
         assert mock_websocket in manager.active_connections
         assert len(manager.active_connections) == 1
 
-    @pytest.mark.anyio
     async def test_connect_multiple(
         self, manager: NotificationManager, mock_websocket: MagicMock
     ) -> None:
         """Test connecting multiple WebSockets."""
         ws2 = MagicMock()
         ws2.accept = AsyncMock()
-        ws2.client_state = WebSocketState.CONNECTED
 
         await manager.connect(mock_websocket)
         await manager.connect(ws2)
@@ -69,7 +68,7 @@ class TestNotificationManager:
 
     def test_disconnect(self, manager: NotificationManager, mock_websocket: MagicMock) -> None:
         """Test disconnecting a WebSocket."""
-        manager.active_connections.append(mock_websocket)
+        manager.active_connections.add(mock_websocket)
         assert len(manager.active_connections) == 1
 
         manager.disconnect(mock_websocket)
@@ -85,50 +84,49 @@ class TestNotificationManager:
         manager.disconnect(mock_websocket)
         assert len(manager.active_connections) == 0
 
-    @pytest.mark.anyio
     async def test_send_personal_message(
         self, manager: NotificationManager, mock_websocket: MagicMock
     ) -> None:
         """Test sending a personal message."""
         message = {"type": "test", "data": "hello"}
+        await manager.connect(mock_websocket)
 
         await manager.send_personal_message(message, mock_websocket)
 
         mock_websocket.send_json.assert_called_once_with(message)
 
-    @pytest.mark.anyio
     async def test_send_personal_message_disconnected(
-        self, manager: NotificationManager, disconnected_websocket: MagicMock
+        self, manager: NotificationManager, mock_websocket: MagicMock
     ) -> None:
         """Test sending to disconnected WebSocket doesn't call send_json."""
-        disconnected_websocket.send_json = AsyncMock()
+        await manager.connect(mock_websocket)
+        manager.disconnect(mock_websocket)
 
-        await manager.send_personal_message({"test": "data"}, disconnected_websocket)
+        await manager.send_personal_message({"test": "data"}, mock_websocket)
 
-        disconnected_websocket.send_json.assert_not_called()
+        mock_websocket.send_json.assert_not_called()
 
-    @pytest.mark.anyio
     async def test_broadcast(self, manager: NotificationManager, mock_websocket: MagicMock) -> None:
         """Test broadcasting to all connections."""
         ws2 = MagicMock()
-        ws2.send_json = AsyncMock()
-        ws2.client_state = WebSocketState.CONNECTED
+        ws2.send_text = AsyncMock()
 
-        manager.active_connections = [mock_websocket, ws2]
+        manager.active_connections = {mock_websocket, ws2}
         message = {"type": "broadcast", "data": "hello all"}
 
         await manager.broadcast(message)
 
-        mock_websocket.send_json.assert_called_once_with(message)
-        ws2.send_json.assert_called_once_with(message)
+        assert _sent(mock_websocket) == message
+        assert _sent(ws2) == message
+        # Every client receives the same pre-serialized payload
+        assert mock_websocket.send_text.call_args == ws2.send_text.call_args
 
-    @pytest.mark.anyio
     async def test_broadcast_handles_errors(
         self, manager: NotificationManager, mock_websocket: MagicMock
     ) -> None:
         """Test broadcast handles errors gracefully."""
-        mock_websocket.send_json = AsyncMock(side_effect=Exception("Connection error"))
-        manager.active_connections = [mock_websocket]
+        mock_websocket.send_text = AsyncMock(side_effect=Exception("Connection error"))
+        manager.active_connections = {mock_websocket}
 
         # Should not raise
         await manager.broadcast({"test": "data"})
@@ -136,12 +134,63 @@ class TestNotificationManager:
         # Connection should be removed
         assert mock_websocket not in manager.active_connections
 
-    @pytest.mark.anyio
+    async def test_broadcast_no_connections_skips_encoding(
+        self, manager: NotificationManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test broadcast with no listeners doesn't serialize the message."""
+        encode = MagicMock()
+        monkeypatch.setattr(notification_service, "_encode", encode)
+
+        await manager.broadcast({"test": "data"})
+
+        encode.assert_not_called()
+
+    async def test_notify_no_connections_completes_eagerly(
+        self, manager: NotificationManager
+    ) -> None:
+        """Test a notification with no clients finishes without being scheduled."""
+        # Match the app, which installs the eager task factory at startup
+        loop = asyncio.get_running_loop()
+        loop.set_task_factory(asyncio.eager_task_factory)
+        try:
+            task = asyncio.create_task(
+                manager.notify_record_created("uuid-1", "file.html", "FORM")
+            )
+            assert task.done()
+            await task
+        finally:
+            loop.set_task_factory(None)
+
+    async def test_broadcast_is_concurrent(self, manager: NotificationManager) -> None:
+        """Test broadcast sends to all connections concurrently."""
+        connections = 10
+        in_flight = 0
+        all_started = asyncio.Event()
+
+        async def blocking_send(_payload: str) -> None:
+            nonlocal in_flight
+            in_flight += 1
+            if in_flight == connections:
+                all_started.set()
+            # Only released once every send has started, so sequential
+            # sends would stall on the first one
+            await all_started.wait()
+
+        for _ in range(connections):
+            ws = MagicMock()
+            ws.send_text = AsyncMock(side_effect=blocking_send)
+            manager.active_connections.add(ws)
+
+        await asyncio.wait_for(manager.broadcast({"type": "broadcast"}), timeout=1)
+
+        assert in_flight == connections
+        assert all(ws.send_text.await_count == 1 for ws in manager.active_connections)
+
     async def test_notify_record_created(
         self, manager: NotificationManager, mock_websocket: MagicMock
     ) -> None:
         """Test notifying clients of record creation."""
-        manager.active_connections = [mock_websocket]
+        manager.active_connections = {mock_websocket}
 
         await manager.notify_record_created(
             record_id="uuid-123",
@@ -149,20 +198,19 @@ class TestNotificationManager:
             record_type="FORM",
         )
 
-        mock_websocket.send_json.assert_called_once()
-        call_args = mock_websocket.send_json.call_args[0][0]
+        mock_websocket.send_text.assert_called_once()
+        call_args = _sent(mock_websocket)
         assert call_args["type"] == "record_created"
         assert call_args["data"]["record_id"] == "uuid-123"
         assert call_args["data"]["source_file"] == "form_1.html"
         assert call_args["data"]["record_type"] == "FORM"
         assert "message" in call_args
 
-    @pytest.mark.anyio
     async def test_notify_record_approved(
         self, manager: NotificationManager, mock_websocket: MagicMock
     ) -> None:
         """Test notifying clients of record approval."""
-        manager.active_connections = [mock_websocket]
+        manager.active_connections = {mock_websocket}
 
         await manager.notify_record_approved(
             record_id="uuid-123",
@@ -170,31 +218,29 @@ class TestNotificationManager:
             user_id="admin",
         )
 
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _sent(mock_websocket)
         assert call_args["type"] == "record_approved"
         assert call_args["data"]["user_id"] == "admin"
 
-    @pytest.mark.anyio
     async def test_notify_record_approved_no_user(
         self, manager: NotificationManager, mock_websocket: MagicMock
     ) -> None:
         """Test notifying approval without user ID."""
-        manager.active_connections = [mock_websocket]
+        manager.active_connections = {mock_websocket}
 
         await manager.notify_record_approved(
             record_id="uuid-123",
             source_file="form.html",
         )
 
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _sent(mock_websocket)
         assert call_args["data"]["user_id"] is None
 
-    @pytest.mark.anyio
     async def test_notify_record_rejected(
         self, manager: NotificationManager, mock_websocket: MagicMock
     ) -> None:
         """Test notifying clients of record rejection."""
-        manager.active_connections = [mock_websocket]
+        manager.active_connections = {mock_websocket}
 
         await manager.notify_record_rejected(
             record_id="uuid-123",
@@ -202,16 +248,15 @@ class TestNotificationManager:
             reason="Invalid data format",
         )
 
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _sent(mock_websocket)
         assert call_args["type"] == "record_rejected"
         assert call_args["data"]["reason"] == "Invalid data format"
 
-    @pytest.mark.anyio
     async def test_notify_batch_operation(
         self, manager: NotificationManager, mock_websocket: MagicMock
     ) -> None:
         """Test notifying clients of batch operation."""
-        manager.active_connections = [mock_websocket]
+        manager.active_connections = {mock_websocket}
 
         await manager.notify_batch_operation(
             operation="approved",
@@ -219,32 +264,30 @@ class TestNotificationManager:
             record_type="FORM",
         )
 
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _sent(mock_websocket)
         assert call_args["type"] == "batch_approved"
         assert call_args["data"]["count"] == 5
         assert call_args["data"]["operation"] == "approved"
 
-    @pytest.mark.anyio
     async def test_notify_batch_operation_no_type(
         self, manager: NotificationManager, mock_websocket: MagicMock
     ) -> None:
         """Test batch notification without record type."""
-        manager.active_connections = [mock_websocket]
+        manager.active_connections = {mock_websocket}
 
         await manager.notify_batch_operation(
             operation="rejected",
             count=3,
         )
 
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _sent(mock_websocket)
         assert call_args["data"]["record_type"] is None
 
-    @pytest.mark.anyio
     async def test_notify_export_complete(
         self, manager: NotificationManager, mock_websocket: MagicMock
     ) -> None:
         """Test notifying clients of export completion."""
-        manager.active_connections = [mock_websocket]
+        manager.active_connections = {mock_websocket}
 
         await manager.notify_export_complete(
             format="csv",
@@ -252,18 +295,17 @@ class TestNotificationManager:
             filename="export_20240115.csv",
         )
 
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _sent(mock_websocket)
         assert call_args["type"] == "export_complete"
         assert call_args["data"]["format"] == "csv"
         assert call_args["data"]["count"] == 25
         assert call_args["data"]["filename"] == "export_20240115.csv"
 
-    @pytest.mark.anyio
     async def test_notify_export_xlsx(
         self, manager: NotificationManager, mock_websocket: MagicMock
     ) -> None:
         """Test Excel export notification."""
-        manager.active_connections = [mock_websocket]
+        manager.active_connections = {mock_websocket}
 
         await manager.notify_export_complete(
             format="xlsx",
@@ -271,72 +313,85 @@ class TestNotificationManager:
             filename="report.xlsx",
         )
 
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _sent(mock_websocket)
         assert "XLSX" in call_args["message"]
 
-    @pytest.mark.anyio
     async def test_notify_google_sheets_sync(
         self, manager: NotificationManager, mock_websocket: MagicMock
     ) -> None:
         """Test notifying clients of Google Sheets sync."""
-        manager.active_connections = [mock_websocket]
+        manager.active_connections = {mock_websocket}
 
         await manager.notify_google_sheets_sync(
             synced_count=15,
             spreadsheet_url="https://docs.google.com/spreadsheets/d/123",
         )
 
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _sent(mock_websocket)
         assert call_args["type"] == "sheets_sync_complete"
         assert call_args["data"]["synced_count"] == 15
         assert call_args["data"]["spreadsheet_url"] == "https://docs.google.com/spreadsheets/d/123"
 
-    @pytest.mark.anyio
     async def test_notify_error(
         self, manager: NotificationManager, mock_websocket: MagicMock
     ) -> None:
         """Test notifying clients of an error."""
-        manager.active_connections = [mock_websocket]
+        manager.active_connections = {mock_websocket}
 
         await manager.notify_error(
             error_type="extraction_failed",
             message="Failed to parse invoice PDF",
         )
 
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _sent(mock_websocket)
         assert call_args["type"] == "error"
         assert call_args["data"]["error_type"] == "extraction_failed"
         assert call_args["message"] == "Failed to parse invoice PDF"
 
-    @pytest.mark.anyio
     async def test_notification_includes_id(
         self, manager: NotificationManager, mock_websocket: MagicMock
     ) -> None:
         """Test that notifications include unique IDs."""
-        manager.active_connections = [mock_websocket]
+        manager.active_connections = {mock_websocket}
 
         await manager.notify_record_created("uuid-1", "file.html", "FORM")
 
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _sent(mock_websocket)
         assert "id" in call_args
         # ID should be a valid UUID string
         assert len(call_args["id"]) == 36
 
-    @pytest.mark.anyio
     async def test_notification_includes_timestamp(
         self, manager: NotificationManager, mock_websocket: MagicMock
     ) -> None:
         """Test that notifications include timestamps."""
-        manager.active_connections = [mock_websocket]
+        manager.active_connections = {mock_websocket}
 
         await manager.notify_record_approved("uuid-1", "file.html")
 
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = _sent(mock_websocket)
         assert "timestamp" in call_args
         # Timestamp should be ISO format
         assert "T" in call_args["timestamp"]
 
 
+class TestNowIso:
+    """Tests for the cached notification timestamp."""
+
+    def test_reused_within_a_millisecond(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test calls in the same millisecond share one formatted timestamp."""
+        clock = iter([1_700_000_000.0, 1_700_000_000.0005, 1_700_000_000.002])
+        monkeypatch.setattr(notification_service, "_timestamp_cache", (0.0, ""))
+        monkeypatch.setattr(notification_service.time, "time", lambda: next(clock))
+
+        first = notification_service._now_iso()
+        second = notification_service._now_iso()
+        third = notification_service._now_iso()
+
+        assert first == second == "2023-11-14T22:13:20+00:00"
+        assert third == "2023-11-14T22:13:20.002000+00:00"
+
+
 class TestGetNotificationManager:
     """Tests for get_notification_manager function."""
 
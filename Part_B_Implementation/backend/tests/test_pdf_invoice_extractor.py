@@ -2,6 +2,7 @@
 Unit tests for PDFInvoiceExtractor.
 """
 
+import asyncio
 from decimal import Decimal
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
@@ -67,12 +68,43 @@ class TestPDFInvoiceExtractor:
             assert result.has_errors
             assert "not supported" in result.errors[0].lower() or "pdfplumber" in result.errors[0].lower()
 
+    def test_extract_when_pdfplumber_import_fails(self, extractor: PDFInvoiceExtractor) -> None:
+        """Test that a failing lazy import is reported like a missing package."""
+        with patch('app.extractors.pdf_invoice_extractor.PDF_SUPPORT', True), \
+                patch('app.extractors.pdf_invoice_extractor._get_pdfplumber', return_value=None):
+            result = extractor.extract(Path("/some/file.pdf"))
+
+        assert result.has_errors
+        assert "not supported" in result.errors[0].lower()
+
+    async def test_extract_async_does_not_block_loop(self, extractor: PDFInvoiceExtractor) -> None:
+        """Test that the event loop keeps running while extract_async works."""
+        ticks = 0
+        done = False
+
+        async def tick() -> None:
+            nonlocal ticks
+            while not done:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.create_task(tick())
+        result = await extractor.extract_async(Path("/nonexistent/file.pdf"))
+        done = True
+        await ticker
+
+        assert result.has_errors
+        assert ticks > 0
+
     def test_amount_parsing(self, extractor: PDFInvoiceExtractor) -> None:
         """Test amount parsing."""
         assert extractor._parse_amount("€850.00") == Decimal("850.00")
         assert extractor._parse_amount("1,054.00") == Decimal("1054.00")
         assert extractor._parse_amount("1.054,00") == Decimal("1054.00")
         assert extractor._parse_amount("€ 2,976.00") == Decimal("2976.00")
+        assert extractor._parse_amount("500,00\xa0€") == Decimal("500.00")
+        assert extractor._parse_amount("12,50 \xa0") == Decimal("12.50")
+        assert extractor._parse_amount("1\n234") is None
         assert extractor._parse_amount(None) is None
         assert extractor._parse_amount("") is None
 
@@ -3,10 +3,11 @@ Extended tests for RecordService to increase coverage.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
-from datetime import datetime, timezone
+from types import SimpleNamespace
 
+from app.services import record_service as record_service_module
 from app.services.record_service import RecordService
 from app.db.models import ExtractionRecordDB
 from app.models.schemas import (
@@ -17,27 +18,54 @@ from app.models.schemas import (
     ContactFormData,
     RecordType,
 )
+from tests.helpers import FROZEN_NOW, AsyncStub
 
+pytestmark = [
+    pytest.mark.xdist_group(name="record_service"),
+    # Fail on the first use of a deprecated Pydantic v1-style API
+    pytest.mark.filterwarnings("error::pydantic.PydanticDeprecatedSince20"),
+]
 
-@pytest.fixture
+# Fixed values for sample records; tests needing another ID make their own
+SAMPLE_RECORD_ID = uuid4()
+
+
+@pytest.fixture(scope="module")
 def mock_repository():
-    """Create a mock repository."""
+    """Create a mock repository shared by the module."""
     repo = AsyncMock()
     repo.session = AsyncMock()
     return repo
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_repository(mock_repository):
+    """Clear calls, return values and side effects left by each test."""
+    yield
+    mock_repository.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(autouse=True)
+def mock_notification_manager(monkeypatch):
+    """Replace the notification manager the service looks up."""
+    manager = AsyncMock()
+    monkeypatch.setattr(record_service_module, "get_notification_manager", lambda: manager)
+    return manager
+
+
 @pytest.fixture
 def record_service(mock_repository):
     """Create RecordService with mock repository."""
+    # Function-scoped: tests install similarity/sheets services on it
     return RecordService(repository=mock_repository)
 
 
 @pytest.fixture
 def sample_record():
     """Create a sample extraction record."""
+    # Function-scoped: approve/reject move it out of "pending"
     return ExtractionRecordDB(
-        id=uuid4(),
+        id=SAMPLE_RECORD_ID,
         source_file="/app/data/forms/form_1.html",
         record_type="FORM",
         extracted_data={
@@ -48,8 +76,44 @@ def sample_record():
         warnings=[],
         errors=[],
         status="pending",
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+        created_at=FROZEN_NOW,
+        updated_at=FROZEN_NOW,
+    )
+
+
+@pytest.fixture(scope="module")
+def opaque_record():
+    """Stand-in for tests that only pass a record through (and log its id)."""
+    return SimpleNamespace(id=SAMPLE_RECORD_ID)
+
+
+@pytest.fixture(scope="module")
+def sample_extraction():
+    """Create a form extraction result (frozen, so safe to share)."""
+    return ExtractionResult(
+        id=uuid4(),
+        source_file="form.html",
+        record_type=RecordType.FORM,
+        form_data=ContactFormData(
+            full_name="Test User",
+            email="test@example.com",
+        ),
+        confidence_score=0.95,
+    )
+
+
+@pytest.fixture(scope="module")
+def created_record(sample_extraction):
+    """Create the record the repository hands back for sample_extraction."""
+    return ExtractionRecordDB(
+        id=sample_extraction.id,
+        source_file="form.html",
+        record_type="FORM",
+        extracted_data={"full_name": "Test User", "email": "test@example.com"},
+        confidence_score=0.95,
+        status="pending",
+        created_at=FROZEN_NOW,
+        updated_at=FROZEN_NOW,
     )
 
 
@@ -80,57 +144,46 @@ class TestRecordServiceSetters:
 class TestApproveWithNotifications:
     """Test approve with notification handling."""
 
-    @pytest.mark.anyio
     async def test_approve_with_notify_false(
-        self, record_service, mock_repository, sample_record
+        self, record_service, mock_repository, sample_record, mock_notification_manager
     ):
         """Test approve without sending notification."""
         mock_repository.get_by_id.return_value = sample_record
         mock_repository.update.return_value = sample_record
 
-        with patch("app.services.record_service.get_notification_manager") as mock_nm:
-            mock_manager = AsyncMock()
-            mock_nm.return_value = mock_manager
-
-            result = await record_service.approve(
-                sample_record.id,
-                ApproveRequest(),
-                notify=False,
-            )
+        result = await record_service.approve(
+            sample_record.id,
+            ApproveRequest(),
+            notify=False,
+        )
 
-            # Notification should not be called
-            mock_manager.notify_record_approved.assert_not_called()
+        # Notification should not be called
+        mock_notification_manager.notify_record_approved.assert_not_called()
 
 
 class TestRejectWithNotifications:
     """Test reject with notification handling."""
 
-    @pytest.mark.anyio
     async def test_reject_with_notify_false(
-        self, record_service, mock_repository, sample_record
+        self, record_service, mock_repository, sample_record, mock_notification_manager
     ):
         """Test reject without sending notification."""
         mock_repository.get_by_id.return_value = sample_record
         mock_repository.update.return_value = sample_record
 
-        with patch("app.services.record_service.get_notification_manager") as mock_nm:
-            mock_manager = AsyncMock()
-            mock_nm.return_value = mock_manager
-
-            result = await record_service.reject(
-                sample_record.id,
-                RejectRequest(reason="Test"),
-                notify=False,
-            )
+        result = await record_service.reject(
+            sample_record.id,
+            RejectRequest(reason="Test"),
+            notify=False,
+        )
 
-            # Notification should not be called
-            mock_manager.notify_record_rejected.assert_not_called()
+        # Notification should not be called
+        mock_notification_manager.notify_record_rejected.assert_not_called()
 
 
 class TestBatchOperationsExtended:
     """Extended tests for batch operations."""
 
-    @pytest.mark.anyio
     async def test_approve_batch_with_errors(
         self, record_service, mock_repository, sample_record
     ):
@@ -144,19 +197,14 @@ class TestBatchOperationsExtended:
 
         record_ids = [sample_record.id, uuid4()]
 
-        with patch("app.services.record_service.get_notification_manager") as mock_nm:
-            mock_manager = AsyncMock()
-            mock_nm.return_value = mock_manager
-
-            result = await record_service.approve_batch(
-                record_ids,
-                ApproveRequest(),
-            )
+        result = await record_service.approve_batch(
+            record_ids,
+            ApproveRequest(),
+        )
 
-            assert result["approved_count"] == 1
-            assert result["error_count"] == 1
+        assert result["approved_count"] == 1
+        assert result["error_count"] == 1
 
-    @pytest.mark.anyio
     async def test_reject_batch_with_errors(
         self, record_service, mock_repository, sample_record
     ):
@@ -169,199 +217,109 @@ class TestBatchOperationsExtended:
 
         record_ids = [sample_record.id, uuid4()]
 
-        with patch("app.services.record_service.get_notification_manager") as mock_nm:
-            mock_manager = AsyncMock()
-            mock_nm.return_value = mock_manager
-
-            result = await record_service.reject_batch(
-                record_ids,
-                RejectRequest(reason="Batch reject"),
-            )
+        result = await record_service.reject_batch(
+            record_ids,
+            RejectRequest(reason="Batch reject"),
+        )
 
-            assert result["rejected_count"] == 1
-            assert result["error_count"] == 1
+        assert result["rejected_count"] == 1
+        assert result["error_count"] == 1
 
 
 class TestCreateFromExtraction:
     """Tests for create_from_extraction method."""
 
-    @pytest.mark.anyio
     async def test_create_from_extraction_basic(
-        self, record_service, mock_repository
+        self, record_service, mock_repository, sample_extraction, created_record
     ):
         """Test basic record creation from extraction."""
-        form_data = ContactFormData(
-            full_name="Test User",
-            email="test@example.com",
-        )
+        mock_repository.create.return_value = created_record
 
-        extraction = ExtractionResult(
-            id=uuid4(),
-            source_file="form.html",
-            record_type=RecordType.FORM,
-            form_data=form_data,
-            confidence_score=0.95,
+        result = await record_service.create_from_extraction(
+            sample_extraction,
+            generate_embedding=False,
         )
 
-        mock_record = ExtractionRecordDB(
-            id=extraction.id,
-            source_file="form.html",
-            record_type="FORM",
-            extracted_data={"full_name": "Test User", "email": "test@example.com"},
-            confidence_score=0.95,
-            status="pending",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-        mock_repository.create.return_value = mock_record
+        assert result is not None
+        mock_repository.create.assert_called_once()
 
-        with patch("app.services.record_service.get_notification_manager") as mock_nm:
-            mock_manager = AsyncMock()
-            mock_nm.return_value = mock_manager
-
-            result = await record_service.create_from_extraction(
-                extraction,
-                generate_embedding=False,
-            )
-
-            assert result is not None
-            mock_repository.create.assert_called_once()
-
-    @pytest.mark.anyio
     async def test_create_from_extraction_with_embedding(
-        self, record_service, mock_repository
+        self, record_service, mock_repository, sample_extraction, created_record
     ):
         """Test record creation with embedding generation."""
-        form_data = ContactFormData(
-            full_name="Test",
-            email="test@example.com",
-        )
-
-        extraction = ExtractionResult(
-            id=uuid4(),
-            source_file="form.html",
-            record_type=RecordType.FORM,
-            form_data=form_data,
-            confidence_score=0.95,
-        )
-
-        mock_record = ExtractionRecordDB(
-            id=extraction.id,
-            source_file="form.html",
-            record_type="FORM",
-            extracted_data={},
-            confidence_score=0.95,
-            status="pending",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-        mock_repository.create.return_value = mock_record
+        mock_repository.create.return_value = created_record
 
         # Add mock similarity service
-        mock_similarity = AsyncMock()
+        mock_similarity = AsyncStub(create_embedding=None)
         record_service.set_similarity_service(mock_similarity)
 
-        with patch("app.services.record_service.get_notification_manager") as mock_nm:
-            mock_manager = AsyncMock()
-            mock_nm.return_value = mock_manager
-
-            result = await record_service.create_from_extraction(
-                extraction,
-                generate_embedding=True,
-            )
+        result = await record_service.create_from_extraction(
+            sample_extraction,
+            generate_embedding=True,
+        )
 
-            # Similarity service should be called
-            mock_similarity.create_embedding.assert_called_once()
+        # Similarity service should be called
+        assert len(mock_similarity.calls["create_embedding"]) == 1
 
-    @pytest.mark.anyio
     async def test_create_from_extraction_embedding_fails(
-        self, record_service, mock_repository
+        self, record_service, mock_repository, sample_extraction, created_record
     ):
         """Test record creation when embedding fails (should not fail creation)."""
-        form_data = ContactFormData(
-            full_name="Test",
-            email="test@example.com",
-        )
-
-        extraction = ExtractionResult(
-            id=uuid4(),
-            source_file="form.html",
-            record_type=RecordType.FORM,
-            form_data=form_data,
-            confidence_score=0.95,
-        )
-
-        mock_record = ExtractionRecordDB(
-            id=extraction.id,
-            source_file="form.html",
-            record_type="FORM",
-            extracted_data={},
-            confidence_score=0.95,
-            status="pending",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-        mock_repository.create.return_value = mock_record
+        mock_repository.create.return_value = created_record
 
         # Add mock similarity service that fails
-        mock_similarity = AsyncMock()
-        mock_similarity.create_embedding.side_effect = Exception("Embedding failed")
+        mock_similarity = AsyncStub(create_embedding=Exception("Embedding failed"))
         record_service.set_similarity_service(mock_similarity)
 
-        with patch("app.services.record_service.get_notification_manager") as mock_nm:
-            mock_manager = AsyncMock()
-            mock_nm.return_value = mock_manager
-
-            # Should not raise despite embedding failure
-            result = await record_service.create_from_extraction(
-                extraction,
-                generate_embedding=True,
-            )
+        # Should not raise despite embedding failure
+        result = await record_service.create_from_extraction(
+            sample_extraction,
+            generate_embedding=True,
+        )
 
-            assert result is not None
+        assert result is not None
 
 
 class TestTriggerAutoSync:
     """Tests for auto-sync triggering."""
 
-    @pytest.mark.anyio
     async def test_trigger_auto_sync_with_sheets_service(
-        self, record_service, mock_repository, sample_record
+        self, record_service, opaque_record
     ):
         """Test auto-sync triggers when sheets service is configured."""
-        mock_sheets = AsyncMock()
+        mock_sheets = AsyncStub(auto_sync_record=None)
         record_service.set_sheets_service(mock_sheets)
 
-        await record_service._trigger_auto_sync(sample_record, "approved")
+        await record_service._trigger_auto_sync(opaque_record, "approved")
 
-        mock_sheets.auto_sync_record.assert_called_once_with(sample_record, "approved")
+        # Identity check: the record is handed through untouched
+        [(args, kwargs)] = mock_sheets.calls["auto_sync_record"]
+        assert args[0] is opaque_record
+        assert args[1:] == ("approved",)
+        assert kwargs == {}
 
-    @pytest.mark.anyio
     async def test_trigger_auto_sync_without_sheets_service(
-        self, record_service, mock_repository, sample_record
+        self, record_service, opaque_record
     ):
         """Test auto-sync does nothing when no sheets service."""
         # No sheets service set
-        await record_service._trigger_auto_sync(sample_record, "approved")
+        await record_service._trigger_auto_sync(opaque_record, "approved")
         # Should complete without error
 
-    @pytest.mark.anyio
     async def test_trigger_auto_sync_handles_error(
-        self, record_service, mock_repository, sample_record
+        self, record_service, opaque_record
     ):
         """Test auto-sync handles errors gracefully."""
-        mock_sheets = AsyncMock()
-        mock_sheets.auto_sync_record.side_effect = Exception("Sync failed")
+        mock_sheets = AsyncStub(auto_sync_record=Exception("Sync failed"))
         record_service.set_sheets_service(mock_sheets)
 
         # Should not raise
-        await record_service._trigger_auto_sync(sample_record, "approved")
+        await record_service._trigger_auto_sync(opaque_record, "approved")
 
 
 class TestGetStats:
     """Tests for get_stats method."""
 
-    @pytest.mark.anyio
     async def test_get_stats_empty(self, record_service, mock_repository):
         """Test stats with no records."""
         mock_repository.get_stats.return_value = {
@@ -375,7 +333,6 @@ class TestGetStats:
         assert stats["pending_count"] == 0
         assert stats["approved_count"] == 0
 
-    @pytest.mark.anyio
     async def test_get_stats_with_exported(self, record_service, mock_repository):
         """Test stats includes exported count."""
         mock_repository.get_stats.return_value = {
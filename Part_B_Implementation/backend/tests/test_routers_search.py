@@ -2,6 +2,9 @@
 Tests for search router and models.
 """
 
+from types import SimpleNamespace
+from uuid import uuid4
+
 import pytest
 from pydantic import ValidationError
 
@@ -16,6 +19,27 @@ from app.routers.search import (
     _get_highlight,
 )
 
+pytestmark = [
+    pytest.mark.xdist_group(name="search_router"),
+    pytest.mark.filterwarnings("error::pydantic.PydanticDeprecatedSince20"),
+]
+
+# Longer than the 200-character highlight limit
+LONG_BODY = "x" * 300
+
+
+@pytest.fixture(scope="module", autouse=True)
+def warm_search_models() -> None:
+    """
+    Validate one instance of each search model before this module's tests.
+
+    Lives here rather than in conftest.py so the rest of the suite does not
+    need the AI dependencies that app.routers.search imports.
+    """
+    SearchRequest(query="warmup")
+    SearchResponse(query="warmup", results=[], total=0, model="warmup")
+    SimilarRecordsResponse(record_id="warmup", similar=[], total=0)
+
 
 class TestSearchRequest:
     """Tests for SearchRequest model."""
@@ -45,47 +69,28 @@ class TestSearchRequest:
         assert request.status == "pending"
         assert request.search_mode == "semantic"
 
-    def test_empty_query_fails(self) -> None:
-        """Test that empty query fails validation."""
-        with pytest.raises(ValidationError):
-            SearchRequest(query="")
-
-    def test_query_max_length(self) -> None:
-        """Test query max length validation."""
-        long_query = "x" * 1001
-        with pytest.raises(ValidationError):
-            SearchRequest(query=long_query)
-
-    def test_limit_bounds(self) -> None:
-        """Test limit boundary validation."""
-        # Below minimum
+    @pytest.mark.parametrize("mode", ["hybrid", "semantic", "keyword"])
+    def test_valid_search_modes(self, mode: str) -> None:
+        """Test each supported search mode is accepted."""
+        request = SearchRequest(query="test", search_mode=mode)
+        assert request.search_mode == mode
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"query": ""}, id="empty-query"),
+            pytest.param({"query": "x" * 1001}, id="query-too-long"),
+            pytest.param({"query": "test", "limit": 0}, id="limit-below-min"),
+            pytest.param({"query": "test", "limit": 101}, id="limit-above-max"),
+            pytest.param({"query": "test", "min_similarity": -0.1}, id="similarity-below-min"),
+            pytest.param({"query": "test", "min_similarity": 1.1}, id="similarity-above-max"),
+            pytest.param({"query": "test", "search_mode": "invalid"}, id="invalid-mode"),
+        ],
+    )
+    def test_invalid_requests(self, kwargs: dict) -> None:
+        """Test that out-of-range or malformed fields fail validation."""
         with pytest.raises(ValidationError):
-            SearchRequest(query="test", limit=0)
-
-        # Above maximum
-        with pytest.raises(ValidationError):
-            SearchRequest(query="test", limit=101)
-
-    def test_similarity_bounds(self) -> None:
-        """Test similarity threshold bounds."""
-        # Below minimum
-        with pytest.raises(ValidationError):
-            SearchRequest(query="test", min_similarity=-0.1)
-
-        # Above maximum
-        with pytest.raises(ValidationError):
-            SearchRequest(query="test", min_similarity=1.1)
-
-    def test_search_mode_validation(self) -> None:
-        """Test search mode validation."""
-        # Valid modes
-        for mode in ["hybrid", "semantic", "keyword"]:
-            request = SearchRequest(query="test", search_mode=mode)
-            assert request.search_mode == mode
-
-        # Invalid mode
-        with pytest.raises(ValidationError):
-            SearchRequest(query="test", search_mode="invalid")
+            SearchRequest(**kwargs)
 
 
 class TestSearchResponse:
@@ -129,8 +134,6 @@ class TestGenerateEmbeddingsRequest:
 
     def test_with_record_ids(self) -> None:
         """Test request with specific record IDs."""
-        from uuid import uuid4
-
         ids = [uuid4(), uuid4()]
         request = GenerateEmbeddingsRequest(record_ids=ids)
         assert len(request.record_ids) == 2
@@ -166,88 +169,55 @@ class TestSimilarRecordsResponse:
 class TestGetHighlight:
     """Tests for _get_highlight helper function."""
 
-    def test_highlight_form_record(self) -> None:
-        """Test highlight for form record."""
-
-        class MockRecord:
-            record_type = "FORM"
-
-            @property
-            def final_data(self):
-                return {
+    @pytest.mark.parametrize(
+        "record_type, data, query, expected",
+        [
+            pytest.param(
+                "FORM",
+                {
                     "message": "Χρειαζόμαστε CRM σύστημα",
                     "service_interest": "CRM System",
-                }
-
-        record = MockRecord()
-        highlight = _get_highlight(record, "CRM")
-        assert highlight is not None
-        assert "CRM" in highlight
-
-    def test_highlight_email_record(self) -> None:
-        """Test highlight for email record."""
-
-        class MockRecord:
-            record_type = "EMAIL"
-
-            @property
-            def final_data(self):
-                return {
+                },
+                "CRM",
+                "CRM",
+                id="form",
+            ),
+            pytest.param(
+                "EMAIL",
+                {
                     "subject": "Αίτημα για πληροφορίες",
                     "body": "Καλησπέρα, θα ήθελα πληροφορίες για τις υπηρεσίες σας.",
-                }
-
-        record = MockRecord()
-        highlight = _get_highlight(record, "πληροφορίες")
-        assert highlight is not None
-
-    def test_highlight_invoice_record(self) -> None:
-        """Test highlight for invoice record."""
-
-        class MockRecord:
-            record_type = "INVOICE"
-
-            @property
-            def final_data(self):
-                return {
+                },
+                "πληροφορίες",
+                "πληροφορίες",
+                id="email",
+            ),
+            pytest.param(
+                "INVOICE",
+                {
                     "client_name": "Office Solutions Ltd",
                     "notes": "Πληρωμή εντός 30 ημερών",
-                }
-
-        record = MockRecord()
-        highlight = _get_highlight(record, "Office")
-        assert highlight is not None
-        assert "Office" in highlight
-
-    def test_highlight_empty_data(self) -> None:
-        """Test highlight with empty data."""
-
-        class MockRecord:
-            record_type = "FORM"
-
-            @property
-            def final_data(self):
-                return {}
-
-        record = MockRecord()
-        highlight = _get_highlight(record, "test")
-        assert highlight is None
-
-    def test_highlight_truncation(self) -> None:
-        """Test that long content is handled properly."""
-
-        class MockRecord:
-            record_type = "EMAIL"
-
-            @property
-            def final_data(self):
-                return {
-                    "body": "x" * 300,
-                }
-
-        record = MockRecord()
-        highlight = _get_highlight(record, "test")
-        assert highlight is not None
-        # Function slices body to 200 chars, then may add "..." if total > 200
-        # So the result should be <= 203 characters
-        assert len(highlight) <= 203
+                },
+                "Office",
+                "Office",
+                id="invoice",
+            ),
+            pytest.param("FORM", {}, "test", None, id="empty-data"),
+            # Function slices body to 200 chars, then may add "..." if total > 200
+            pytest.param("EMAIL", {"body": LONG_BODY}, "test", "x", id="truncation"),
+        ],
+    )
+    def test_highlight(
+        self, record_type: str, data: dict, query: str, expected: str | None
+    ) -> None:
+        """Test highlight snippets for each record type."""
+        record = SimpleNamespace(record_type=record_type, final_data=data)
+
+        highlight = _get_highlight(record, query)
+
+        if expected is None:
+            assert highlight is None
+        else:
+            assert highlight is not None
+            assert expected in highlight
+            assert len(highlight) <= 203
@@ -2,14 +2,18 @@
 Tests for service layer (RecordService, ExportService).
 """
 
+import csv
+import io
+import json
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
-from datetime import datetime, timezone
+from uuid import UUID, uuid4
 
 from app.services.record_service import RecordService
 from app.services.export_service import ExportService
 from app.db.models import ExtractionRecordDB
+from app.db.repositories import RecordRepository
 from app.models.schemas import (
     ApproveRequest,
     RejectRequest,
@@ -18,31 +22,63 @@ from app.models.schemas import (
     ExtractionResult,
     RecordType,
 )
+from tests.helpers import FROZEN_NOW
 
+pytestmark = pytest.mark.xdist_group(name="services")
 
-@pytest.fixture
+FORM_RECORD_ID = UUID("00000000-0000-0000-0000-000000000001")
+INVOICE_RECORD_ID = UUID("00000000-0000-0000-0000-000000000002")
+EMAIL_RECORD_ID = UUID("00000000-0000-0000-0000-000000000003")
+
+# Request payloads shared by tests that only read them
+APPROVE_REQUEST = ApproveRequest()
+REJECT_REQUEST = RejectRequest(reason="Test")
+EDIT_REQUEST = EditRequest(data={"test": "data"})
+CSV_EXPORT = ExportRequest(format="csv")
+JSON_EXPORT = ExportRequest(format="json")
+XLSX_EXPORT = ExportRequest(format="xlsx")
+
+
+@pytest.fixture(scope="module")
 def mock_repository():
-    """Create a mock repository."""
-    return AsyncMock()
+    """Create a mock repository shared by the module."""
+    return AsyncMock(spec=RecordRepository)
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_mock_repository(mock_repository):
+    """Clear calls, return values and side effects left by each test."""
+    yield
+    mock_repository.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
 def record_service(mock_repository):
     """Create RecordService with mock repository."""
     return RecordService(repository=mock_repository)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def export_service(mock_repository):
     """Create ExportService with mock repository."""
     return ExportService(repository=mock_repository)
 
 
-@pytest.fixture
-def sample_record():
+@pytest.fixture(scope="module")
+def export_service_lite():
+    """Create ExportService for helpers that never touch the repository."""
+    return ExportService(repository=MagicMock(spec=[]))
+
+
+def csv_rows(content: bytes) -> list[dict[str, str]]:
+    """Parse exported CSV bytes (with the Excel BOM) into dict rows."""
+    return list(csv.DictReader(io.StringIO(content.decode("utf-8-sig"))))
+
+
+def make_form_record() -> ExtractionRecordDB:
     """Create a sample extraction record."""
     return ExtractionRecordDB(
-        id=uuid4(),
+        id=FORM_RECORD_ID,
         source_file="/app/data/forms/contact_form_1.html",
         record_type="FORM",
         extracted_data={
@@ -58,16 +94,35 @@ def sample_record():
         warnings=[],
         errors=[],
         status="pending",
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+        created_at=FROZEN_NOW,
+        updated_at=FROZEN_NOW,
     )
 
 
 @pytest.fixture
-def sample_invoice_record():
+def sample_record():
+    """Fresh form record for tests that change its status."""
+    return make_form_record()
+
+
+@pytest.fixture
+def stored_record(mock_repository, sample_record):
+    """Fresh form record that the mock repository loads and saves."""
+    mock_repository.get_by_id.return_value = sample_record
+    mock_repository.update.return_value = sample_record
+    return sample_record
+
+
+@pytest.fixture(scope="module")
+def shared_sample_record():
+    """Form record shared by tests that only read it."""
+    return make_form_record()
+
+
+def make_invoice_record() -> ExtractionRecordDB:
     """Create a sample invoice record."""
     return ExtractionRecordDB(
-        id=uuid4(),
+        id=INVOICE_RECORD_ID,
         source_file="/app/data/invoices/invoice_001.html",
         record_type="INVOICE",
         extracted_data={
@@ -82,16 +137,27 @@ def sample_invoice_record():
         warnings=[],
         errors=[],
         status="approved",
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+        created_at=FROZEN_NOW,
+        updated_at=FROZEN_NOW,
     )
 
 
 @pytest.fixture
-def sample_email_record():
+def sample_invoice_record():
+    """Fresh invoice record for tests that change its status."""
+    return make_invoice_record()
+
+
+@pytest.fixture(scope="module")
+def shared_invoice_record():
+    """Invoice record shared by tests that only read it."""
+    return make_invoice_record()
+
+
+def make_email_record() -> ExtractionRecordDB:
     """Create a sample email record."""
     return ExtractionRecordDB(
-        id=uuid4(),
+        id=EMAIL_RECORD_ID,
         source_file="/app/data/emails/email_01.eml",
         record_type="EMAIL",
         extracted_data={
@@ -104,25 +170,35 @@ def sample_email_record():
         warnings=[],
         errors=[],
         status="pending",
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+        created_at=FROZEN_NOW,
+        updated_at=FROZEN_NOW,
     )
 
 
+@pytest.fixture
+def sample_email_record():
+    """Fresh email record for tests that change its status."""
+    return make_email_record()
+
+
+@pytest.fixture(scope="module")
+def shared_email_record():
+    """Email record shared by tests that only read it."""
+    return make_email_record()
+
+
 class TestRecordService:
     """Tests for RecordService."""
 
-    @pytest.mark.anyio
-    async def test_get_record_found(self, record_service, mock_repository, sample_record):
+    async def test_get_record_found(self, record_service, mock_repository, shared_sample_record):
         """Test getting an existing record."""
-        mock_repository.get_by_id.return_value = sample_record
+        mock_repository.get_by_id.return_value = shared_sample_record
 
-        result = await record_service.get_record(sample_record.id)
+        result = await record_service.get_record(shared_sample_record.id)
 
-        assert result == sample_record
-        mock_repository.get_by_id.assert_called_once_with(sample_record.id)
+        assert result == shared_sample_record
+        mock_repository.get_by_id.assert_called_once_with(shared_sample_record.id)
 
-    @pytest.mark.anyio
     async def test_get_record_not_found(self, record_service, mock_repository):
         """Test getting a non-existent record."""
         mock_repository.get_by_id.return_value = None
@@ -133,10 +209,9 @@ class TestRecordService:
         assert result is None
         mock_repository.get_by_id.assert_called_once_with(record_id)
 
-    @pytest.mark.anyio
-    async def test_list_records(self, record_service, mock_repository, sample_record):
+    async def test_list_records(self, record_service, mock_repository, shared_sample_record):
         """Test listing records with pagination."""
-        mock_repository.list_records.return_value = ([sample_record], 1)
+        mock_repository.list_records.return_value = ([shared_sample_record], 1)
 
         records, total = await record_service.list_records(
             status="pending", record_type="FORM", skip=0, limit=10
@@ -148,125 +223,90 @@ class TestRecordService:
             status="pending", record_type="FORM", skip=0, limit=10
         )
 
-    @pytest.mark.anyio
-    async def test_approve_pending_record(self, record_service, mock_repository, sample_record):
-        """Test approving a pending record."""
-        mock_repository.get_by_id.return_value = sample_record
-        mock_repository.update.return_value = sample_record
+    @pytest.mark.parametrize(
+        "action,initial_status,request_model,expected",
+        [
+            (
+                "approve", "pending", ApproveRequest(notes="Looks good!"),
+                {"status": "approved", "review_notes": "Looks good!"},
+            ),
+            (
+                "approve", "edited", ApproveRequest(notes="Approved after edit"),
+                {"status": "approved", "review_notes": "Approved after edit"},
+            ),
+            (
+                "reject", "pending", RejectRequest(reason="Data is incorrect"),
+                {"status": "rejected", "rejection_reason": "Data is incorrect"},
+            ),
+            (
+                "edit", "pending",
+                EditRequest(
+                    data={"full_name": "Updated Name", "email": "updated@example.com"},
+                    notes="Fixed name",
+                ),
+                {
+                    "status": "edited",
+                    "edited_data": {"full_name": "Updated Name", "email": "updated@example.com"},
+                },
+            ),
+            (
+                "edit", "edited", EditRequest(data={"full_name": "Another Update"}),
+                {"status": "edited", "edited_data": {"full_name": "Another Update"}},
+            ),
+        ],
+        ids=["approve-pending", "approve-edited", "reject-pending", "edit-pending", "edit-edited"],
+    )
+    async def test_review_transition(
+        self, record_service, mock_repository, stored_record,
+        action, initial_status, request_model, expected,
+    ):
+        """Test the review actions on records in a reviewable status."""
+        stored_record.status = initial_status
 
-        request = ApproveRequest(notes="Looks good!")
-        result = await record_service.approve(sample_record.id, request, user_id="test_user")
+        review = getattr(record_service, action)
+        result = await review(stored_record.id, request_model, user_id="test_user")
 
-        assert result.status == "approved"
         assert result.reviewed_by == "test_user"
+        for field, value in expected.items():
+            assert getattr(result, field) == value
         mock_repository.update.assert_called_once()
 
-    @pytest.mark.anyio
-    async def test_approve_edited_record(self, record_service, mock_repository, sample_record):
-        """Test approving an edited record."""
-        sample_record.status = "edited"
-        mock_repository.get_by_id.return_value = sample_record
-        mock_repository.update.return_value = sample_record
-
-        request = ApproveRequest(notes="Approved after edit")
-        result = await record_service.approve(sample_record.id, request)
-
-        assert result.status == "approved"
-        mock_repository.update.assert_called_once()
-
-    @pytest.mark.anyio
-    async def test_approve_not_found(self, record_service, mock_repository):
-        """Test approving a non-existent record."""
-        mock_repository.get_by_id.return_value = None
-
-        with pytest.raises(ValueError, match="Record not found"):
-            await record_service.approve(uuid4(), ApproveRequest())
-
-    @pytest.mark.anyio
-    async def test_approve_invalid_status(self, record_service, mock_repository, sample_record):
-        """Test approving a record with invalid status."""
-        sample_record.status = "rejected"
-        mock_repository.get_by_id.return_value = sample_record
-
-        with pytest.raises(ValueError, match="Cannot approve record with status"):
-            await record_service.approve(sample_record.id, ApproveRequest())
-
-    @pytest.mark.anyio
-    async def test_reject_pending_record(self, record_service, mock_repository, sample_record):
-        """Test rejecting a pending record."""
-        mock_repository.get_by_id.return_value = sample_record
-        mock_repository.update.return_value = sample_record
-
-        request = RejectRequest(reason="Data is incorrect")
-        result = await record_service.reject(sample_record.id, request, user_id="test_user")
-
-        assert result.status == "rejected"
-        assert result.rejection_reason == "Data is incorrect"
-        mock_repository.update.assert_called_once()
-
-    @pytest.mark.anyio
-    async def test_reject_not_found(self, record_service, mock_repository):
-        """Test rejecting a non-existent record."""
-        mock_repository.get_by_id.return_value = None
-
-        with pytest.raises(ValueError, match="Record not found"):
-            await record_service.reject(uuid4(), RejectRequest(reason="Test"))
-
-    @pytest.mark.anyio
-    async def test_reject_invalid_status(self, record_service, mock_repository, sample_record):
-        """Test rejecting a record with invalid status."""
-        sample_record.status = "approved"
-        mock_repository.get_by_id.return_value = sample_record
-
-        with pytest.raises(ValueError, match="Cannot reject record with status"):
-            await record_service.reject(sample_record.id, RejectRequest(reason="Test"))
-
-    @pytest.mark.anyio
-    async def test_edit_pending_record(self, record_service, mock_repository, sample_record):
-        """Test editing a pending record."""
-        mock_repository.get_by_id.return_value = sample_record
-        mock_repository.update.return_value = sample_record
-
-        new_data = {"full_name": "Updated Name", "email": "updated@example.com"}
-        request = EditRequest(data=new_data, notes="Fixed name")
-        result = await record_service.edit(sample_record.id, request, user_id="test_user")
-
-        assert result.status == "edited"
-        assert result.edited_data == new_data
-        mock_repository.update.assert_called_once()
-
-    @pytest.mark.anyio
-    async def test_edit_already_edited_record(self, record_service, mock_repository, sample_record):
-        """Test editing an already edited record."""
-        sample_record.status = "edited"
-        mock_repository.get_by_id.return_value = sample_record
-        mock_repository.update.return_value = sample_record
-
-        new_data = {"full_name": "Another Update"}
-        request = EditRequest(data=new_data)
-        result = await record_service.edit(sample_record.id, request)
-
-        assert result.status == "edited"
-        mock_repository.update.assert_called_once()
+    @pytest.mark.parametrize(
+        "action,initial_status,request_model",
+        [
+            ("approve", "rejected", APPROVE_REQUEST),
+            ("reject", "approved", REJECT_REQUEST),
+            ("edit", "approved", EDIT_REQUEST),
+        ],
+        ids=["approve-rejected", "reject-approved", "edit-approved"],
+    )
+    async def test_review_invalid_status(
+        self, record_service, mock_repository, stored_record,
+        action, initial_status, request_model,
+    ):
+        """Test that review actions refuse records outside pending/edited."""
+        stored_record.status = initial_status
+
+        with pytest.raises(ValueError, match=f"Cannot {action} record with status"):
+            await getattr(record_service, action)(stored_record.id, request_model)
+        mock_repository.update.assert_not_called()
 
-    @pytest.mark.anyio
-    async def test_edit_not_found(self, record_service, mock_repository):
-        """Test editing a non-existent record."""
+    @pytest.mark.parametrize(
+        "action,request_model",
+        [
+            ("approve", APPROVE_REQUEST),
+            ("reject", REJECT_REQUEST),
+            ("edit", EDIT_REQUEST),
+        ],
+        ids=["approve", "reject", "edit"],
+    )
+    async def test_review_not_found(self, record_service, mock_repository, action, request_model):
+        """Test review actions on a non-existent record."""
         mock_repository.get_by_id.return_value = None
 
         with pytest.raises(ValueError, match="Record not found"):
-            await record_service.edit(uuid4(), EditRequest(data={"test": "data"}))
+            await getattr(record_service, action)(uuid4(), request_model)
 
-    @pytest.mark.anyio
-    async def test_edit_invalid_status(self, record_service, mock_repository, sample_record):
-        """Test editing a record with invalid status."""
-        sample_record.status = "approved"
-        mock_repository.get_by_id.return_value = sample_record
-
-        with pytest.raises(ValueError, match="Cannot edit record with status"):
-            await record_service.edit(sample_record.id, EditRequest(data={"test": "data"}))
-
-    @pytest.mark.anyio
     async def test_get_stats(self, record_service, mock_repository):
         """Test getting dashboard statistics."""
         mock_repository.get_stats.return_value = {
@@ -286,95 +326,85 @@ class TestRecordService:
 class TestExportService:
     """Tests for ExportService."""
 
-    @pytest.mark.anyio
     async def test_export_csv(self, export_service, mock_repository, sample_record):
         """Test exporting records to CSV."""
         sample_record.status = "approved"
         mock_repository.get_exportable_records.return_value = [sample_record]
-        mock_repository.update.return_value = sample_record
 
-        request = ExportRequest(format="csv")
-        content, filename, content_type, exported_ids = await export_service.export_records(request)
+        content, filename, content_type, exported_ids = await export_service.export_records(CSV_EXPORT)
 
         assert filename.endswith(".csv")
         assert content_type == "text/csv; charset=utf-8"
-        assert b"Client_Name" in content  # Header present
-        assert b"Test User" in content  # Data present
+        [row] = csv_rows(content)
+        assert row["Type"] == "FORM"
+        assert row["Client_Name"] == "Test User"
+        assert row["Email"] == "test@example.com"
         mock_repository.update.assert_called()  # Record marked as exported
 
-    @pytest.mark.anyio
     async def test_export_json(self, export_service, mock_repository, sample_record):
         """Test exporting records to JSON."""
         sample_record.status = "approved"
         mock_repository.get_exportable_records.return_value = [sample_record]
-        mock_repository.update.return_value = sample_record
 
-        request = ExportRequest(format="json")
-        content, filename, content_type, _ = await export_service.export_records(request)
+        content, filename, content_type, _ = await export_service.export_records(JSON_EXPORT)
 
         assert filename.endswith(".json")
         assert content_type == "application/json; charset=utf-8"
-        import json
         data = json.loads(content)
         assert "records" in data
         assert data["record_count"] == 1
 
-    @pytest.mark.anyio
-    async def test_export_xlsx(self, export_service, mock_repository, sample_record):
-        """Test exporting records to Excel."""
+    async def test_export_xlsx(self, export_service, mock_repository, sample_record, monkeypatch):
+        """Test exporting records to Excel dispatches to the xlsx writer."""
         sample_record.status = "approved"
         mock_repository.get_exportable_records.return_value = [sample_record]
-        mock_repository.update.return_value = sample_record
 
-        request = ExportRequest(format="xlsx")
-        content, filename, content_type, _ = await export_service.export_records(request)
+        # Workbook generation itself is covered in test_services_extended.py
+        write_xlsx = MagicMock(return_value=(b"PK\x03\x04stub", "techflow_export_stub.xlsx"))
+        monkeypatch.setattr(export_service, "_export_xlsx", write_xlsx)
 
+        content, filename, content_type, _ = await export_service.export_records(XLSX_EXPORT)
+
+        write_xlsx.assert_called_once()
+        (data, _), _ = write_xlsx.call_args
+        assert len(data) == 1
+        assert data[0]["Type"] == "FORM"
+        assert data[0]["Client_Name"] == "Test User"
+        assert content == b"PK\x03\x04stub"
         assert filename.endswith(".xlsx")
         assert "spreadsheetml" in content_type
-        # Excel files start with PK (zip format)
-        assert content[:2] == b"PK"
 
-    @pytest.mark.anyio
     async def test_export_no_records(self, export_service, mock_repository):
         """Test exporting when no records available."""
         mock_repository.get_exportable_records.return_value = []
 
-        request = ExportRequest(format="csv")
         with pytest.raises(ValueError, match="No records to export"):
-            await export_service.export_records(request)
+            await export_service.export_records(CSV_EXPORT)
 
-    @pytest.mark.anyio
     async def test_export_invoice_record(self, export_service, mock_repository, sample_invoice_record):
         """Test exporting invoice records."""
         mock_repository.get_exportable_records.return_value = [sample_invoice_record]
-        mock_repository.update.return_value = sample_invoice_record
 
-        request = ExportRequest(format="csv")
-        content, filename, _, _ = await export_service.export_records(request)
+        content, filename, _, _ = await export_service.export_records(CSV_EXPORT)
 
-        content_str = content.decode("utf-8")
-        assert "INV-001" in content_str
-        assert "1000" in content_str or "1000.0" in content_str
+        [row] = csv_rows(content)
+        assert row["Invoice_Number"] == "INV-001"
+        assert float(row["Amount"]) == 1000.00
 
-    @pytest.mark.anyio
     async def test_export_email_record(self, export_service, mock_repository, sample_email_record):
         """Test exporting email records."""
         sample_email_record.status = "approved"
         mock_repository.get_exportable_records.return_value = [sample_email_record]
-        mock_repository.update.return_value = sample_email_record
 
-        request = ExportRequest(format="csv")
-        content, filename, _, _ = await export_service.export_records(request)
+        content, filename, _, _ = await export_service.export_records(CSV_EXPORT)
 
-        content_str = content.decode("utf-8")
-        assert "john@example.com" in content_str
+        [row] = csv_rows(content)
+        assert row["Email"] == "john@example.com"
 
-    @pytest.mark.anyio
     async def test_export_with_specific_ids(self, export_service, mock_repository, sample_record):
         """Test exporting specific records by ID."""
         sample_record.status = "approved"
         mock_repository.get_exportable_records.return_value = [sample_record]
-        mock_repository.update.return_value = sample_record
 
         record_ids = [sample_record.id]  # Use UUID objects directly
         request = ExportRequest(format="csv", record_ids=record_ids)
@@ -384,13 +414,10 @@ class TestExportService:
             record_ids=record_ids, include_rejected=False
         )
 
-    @pytest.mark.anyio
     async def test_export_include_rejected(self, export_service, mock_repository, sample_record):
         """Test exporting with rejected records included."""
         sample_record.status = "rejected"
         mock_repository.get_exportable_records.return_value = [sample_record]
-        # Rejected records shouldn't be updated to exported
-        mock_repository.update.return_value = sample_record
 
         request = ExportRequest(format="csv", include_rejected=True)
         content, _, _, _ = await export_service.export_records(request)
@@ -401,49 +428,61 @@ class TestExportService:
         # update should not be called for rejected records
         mock_repository.update.assert_not_called()
 
-    def test_truncate_text_short(self, export_service):
-        """Test truncating text shorter than max length."""
-        result = export_service._truncate_text("Short text", 100)
-        assert result == "Short text"
-
-    def test_truncate_text_long(self, export_service):
-        """Test truncating text longer than max length."""
-        long_text = "A" * 100
-        result = export_service._truncate_text(long_text, 50)
-        assert len(result) == 50
-        assert result.endswith("...")
-
-    def test_truncate_text_none(self, export_service):
-        """Test truncating None text."""
-        result = export_service._truncate_text(None, 100)
-        assert result is None
 
-    def test_flatten_form_record(self, export_service, sample_record):
-        """Test flattening a form record."""
-        flat = export_service._flatten_record(sample_record)
-
-        assert flat["Type"] == "FORM"
-        assert flat["Client_Name"] == "Test User"
-        assert flat["Email"] == "test@example.com"
-        assert flat["Priority"] == "high"
-        assert flat["Invoice_Number"] is None
-
-    def test_flatten_invoice_record(self, export_service, sample_invoice_record):
-        """Test flattening an invoice record."""
-        flat = export_service._flatten_record(sample_invoice_record)
-
-        assert flat["Type"] == "INVOICE"
-        assert flat["Client_Name"] == "Test Client"
-        assert flat["Invoice_Number"] == "INV-001"
-        assert flat["Amount"] == 1000.00
-        assert flat["VAT"] == 240.00
-        assert flat["Priority"] is None
-
-    def test_flatten_email_record(self, export_service, sample_email_record):
-        """Test flattening an email record."""
-        flat = export_service._flatten_record(sample_email_record)
-
-        assert flat["Type"] == "EMAIL"
-        assert flat["Client_Name"] == "John Doe"
-        assert flat["Email"] == "john@example.com"
-        assert "test email body" in flat["Message"]
+class TestExportServiceHelpers:
+    """Tests for ExportService's synchronous formatting helpers."""
+
+    @pytest.mark.parametrize(
+        "text,max_length,expected",
+        [
+            ("Short text", 100, "Short text"),
+            ("A" * 100, 50, "A" * 47 + "..."),
+            (None, 100, None),
+        ],
+        ids=["short", "long", "none"],
+    )
+    def test_truncate_text(self, export_service_lite, text, max_length, expected):
+        """Test truncating text to a maximum length with an ellipsis."""
+        assert export_service_lite._truncate_text(text, max_length) == expected
+
+    @pytest.mark.parametrize(
+        "record_fixture,expected",
+        [
+            (
+                "shared_sample_record",
+                {
+                    "Type": "FORM",
+                    "Client_Name": "Test User",
+                    "Email": "test@example.com",
+                    "Priority": "high",
+                    "Invoice_Number": None,
+                },
+            ),
+            (
+                "shared_invoice_record",
+                {
+                    "Type": "INVOICE",
+                    "Client_Name": "Test Client",
+                    "Invoice_Number": "INV-001",
+                    "Amount": 1000.00,
+                    "VAT": 240.00,
+                    "Priority": None,
+                },
+            ),
+            (
+                "shared_email_record",
+                {
+                    "Type": "EMAIL",
+                    "Client_Name": "John Doe",
+                    "Email": "john@example.com",
+                    "Message": "This is a test email body.",
+                },
+            ),
+        ],
+        ids=["form", "invoice", "email"],
+    )
+    def test_flatten_record(self, export_service_lite, request, record_fixture, expected):
+        """Test flattening each record type into export columns."""
+        flat = export_service_lite._flatten_record(request.getfixturevalue(record_fixture))
+
+        assert {column: flat[column] for column in expected} == expected
@@ -3,11 +3,16 @@ Extended service tests for better coverage.
 Tests error handling, edge cases, and background operations.
 """
 
+import asyncio
+import json
+
 import pytest
+from fastapi import BackgroundTasks
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
-from datetime import datetime, timezone
 
+from app.core.logging import AuditLogger, audit_logger
+from app.db.repositories import RecordRepository
 from app.services.record_service import RecordService
 from app.services.export_service import ExportService
 from app.services.notification_service import NotificationManager, get_notification_manager
@@ -18,25 +23,30 @@ from app.models.schemas import (
     EditRequest,
     ExportRequest,
 )
+from tests.helpers import FROZEN_NOW, AsyncStub
+
+
+@pytest.fixture(scope="module")
+def mock_repository():
+    """Create a mock repository shared by the module."""
+    return AsyncMock(spec=RecordRepository)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_repository(mock_repository):
+    """Clear calls, return values and side effects left by each test."""
+    yield
+    mock_repository.reset_mock(return_value=True, side_effect=True)
 
 
 class TestRecordServiceExtended:
     """Extended tests for RecordService."""
 
-    @pytest.fixture
-    def mock_repository(self):
-        """Create a mock repository."""
-        repo = AsyncMock()
-        repo.commit = AsyncMock()
-        return repo
-
     @pytest.fixture
     def mock_sheets_service(self):
-        """Create a mock Google Sheets service."""
-        service = MagicMock()
-        service.is_configured.return_value = True
-        service.auto_sync_record = AsyncMock()
-        return service
+        """Create a stub Google Sheets service that records auto-sync calls."""
+        # RecordService only awaits auto_sync_record on the service it is given
+        return AsyncStub(auto_sync_record=None)
 
     @pytest.fixture
     def record_service(self, mock_repository, mock_sheets_service):
@@ -49,6 +59,7 @@ class TestRecordServiceExtended:
     @pytest.fixture
     def sample_record(self):
         """Create a sample record."""
+        # Function-scoped: approve/reject/edit change its status
         return ExtractionRecordDB(
             id=uuid4(),
             source_file="test.html",
@@ -56,67 +67,41 @@ class TestRecordServiceExtended:
             extracted_data={"full_name": "Test User", "email": "test@example.com"},
             status="pending",
             confidence_score=0.95,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-
-    @pytest.mark.anyio
-    async def test_approve_with_auto_sync(self, record_service, mock_repository, mock_sheets_service, sample_record):
-        """Test approve triggers auto-sync when configured."""
-        mock_repository.get_by_id.return_value = sample_record
-        mock_repository.update.return_value = sample_record
-
-        background_tasks = MagicMock()
-        background_tasks.add_task = MagicMock()
-
-        result = await record_service.approve(
-            sample_record.id,
-            ApproveRequest(notes="Approved"),
-            user_id="test_user",
-            background_tasks=background_tasks,
+            created_at=FROZEN_NOW,
+            updated_at=FROZEN_NOW,
         )
 
-        assert result.status == "approved"
-        # Auto-sync should be triggered
-        mock_repository.commit.assert_called()
-
-    @pytest.mark.anyio
-    async def test_reject_with_auto_sync(self, record_service, mock_repository, mock_sheets_service, sample_record):
-        """Test reject triggers auto-sync when configured."""
-        mock_repository.get_by_id.return_value = sample_record
-        mock_repository.update.return_value = sample_record
-
-        background_tasks = MagicMock()
-        background_tasks.add_task = MagicMock()
-
-        result = await record_service.reject(
-            sample_record.id,
-            RejectRequest(reason="Invalid data"),
-            user_id="test_user",
-            background_tasks=background_tasks,
-        )
-
-        assert result.status == "rejected"
-
-    @pytest.mark.anyio
-    async def test_edit_with_auto_sync(self, record_service, mock_repository, mock_sheets_service, sample_record):
-        """Test edit triggers auto-sync when configured."""
+    @pytest.mark.parametrize(
+        "action,request_model,expected_status",
+        [
+            ("approve", ApproveRequest(notes="Approved"), "approved"),
+            ("reject", RejectRequest(reason="Invalid data"), "rejected"),
+            ("edit", EditRequest(data={"full_name": "Updated Name"}), "edited"),
+        ],
+        ids=["approve", "reject", "edit"],
+    )
+    async def test_review_with_auto_sync(
+        self, record_service, mock_repository, sample_record,
+        action, request_model, expected_status,
+    ):
+        """Test review actions queue a background sync when configured."""
         mock_repository.get_by_id.return_value = sample_record
         mock_repository.update.return_value = sample_record
 
-        background_tasks = MagicMock()
-        background_tasks.add_task = MagicMock()
+        background_tasks = MagicMock(spec=BackgroundTasks)
 
-        result = await record_service.edit(
+        result = await getattr(record_service, action)(
             sample_record.id,
-            EditRequest(data={"full_name": "Updated Name"}),
+            request_model,
             user_id="test_user",
             background_tasks=background_tasks,
         )
 
-        assert result.status == "edited"
+        assert result.status == expected_status
+        # Auto-sync commits first, then hands the record id to the worker
+        mock_repository.commit.assert_called_once()
+        background_tasks.add_task.assert_called_once()
 
-    @pytest.mark.anyio
     async def test_approve_without_sheets_service(self, mock_repository, sample_record):
         """Test approve works when sheets service is not configured."""
         service = RecordService(repository=mock_repository, sheets_service=None)
@@ -130,7 +115,6 @@ class TestRecordServiceExtended:
 
         assert result.status == "approved"
 
-    @pytest.mark.anyio
     async def test_trigger_auto_sync_no_background_tasks(self, record_service, mock_repository, mock_sheets_service, sample_record):
         """Test auto-sync runs immediately without background tasks."""
         mock_repository.get_by_id.return_value = sample_record
@@ -144,18 +128,13 @@ class TestRecordServiceExtended:
 
         assert result.status == "approved"
         # Immediate sync should be called
-        mock_sheets_service.auto_sync_record.assert_called()
+        [(args, _)] = mock_sheets_service.calls["auto_sync_record"]
+        assert args == (sample_record, "approved")
 
 
 class TestExportServiceExtended:
     """Extended tests for ExportService."""
 
-    @pytest.fixture
-    def mock_repository(self):
-        repo = AsyncMock()
-        repo.commit = AsyncMock()
-        return repo
-
     @pytest.fixture
     def export_service(self, mock_repository):
         return ExportService(repository=mock_repository)
@@ -163,6 +142,7 @@ class TestExportServiceExtended:
     @pytest.fixture
     def sample_records(self):
         """Create multiple sample records of different types."""
+        # Function-scoped: exporting moves approved records to "exported"
         return [
             ExtractionRecordDB(
                 id=uuid4(),
@@ -171,8 +151,8 @@ class TestExportServiceExtended:
                 extracted_data={"full_name": "Form User", "email": "form@example.com"},
                 status="approved",
                 confidence_score=0.95,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc),
+                created_at=FROZEN_NOW,
+                updated_at=FROZEN_NOW,
             ),
             ExtractionRecordDB(
                 id=uuid4(),
@@ -181,8 +161,8 @@ class TestExportServiceExtended:
                 extracted_data={"sender_email": "sender@example.com", "body_preview": "Test email"},
                 status="approved",
                 confidence_score=0.90,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc),
+                created_at=FROZEN_NOW,
+                updated_at=FROZEN_NOW,
             ),
             ExtractionRecordDB(
                 id=uuid4(),
@@ -197,28 +177,31 @@ class TestExportServiceExtended:
                 },
                 status="approved",
                 confidence_score=0.92,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc),
+                created_at=FROZEN_NOW,
+                updated_at=FROZEN_NOW,
             ),
         ]
 
-    @pytest.mark.anyio
-    async def test_export_mixed_record_types(self, export_service, mock_repository, sample_records):
+    async def test_export_mixed_record_types(self, export_service, mock_repository, sample_records, monkeypatch):
         """Test exporting records of different types."""
         mock_repository.get_exportable_records.return_value = sample_records
-        mock_repository.update.return_value = sample_records[0]
+
+        # Assert on the flattened rows handed to the writer; CSV encoding
+        # itself is covered in test_services.py
+        write_csv = MagicMock(return_value=(b"stub", "techflow_export_stub.csv"))
+        monkeypatch.setattr(export_service, "_export_csv", write_csv)
 
         request = ExportRequest(format="csv")
         content, filename, content_type, exported_ids = await export_service.export_records(request)
 
         assert filename.endswith(".csv")
-        content_str = content.decode("utf-8")
-        # Should contain data from all record types
-        assert "FORM" in content_str or "Form User" in content_str
-        assert "EMAIL" in content_str or "sender@example.com" in content_str
-        assert "INVOICE" in content_str or "INV-001" in content_str
+        (data, _), _ = write_csv.call_args
+        assert [row["Type"] for row in data] == ["FORM", "EMAIL", "INVOICE"]
+        assert data[0]["Client_Name"] == "Form User"
+        assert data[1]["Email"] == "sender@example.com"
+        assert data[2]["Invoice_Number"] == "INV-001"
+        assert len(exported_ids) == len(sample_records)
 
-    @pytest.mark.anyio
     async def test_export_xlsx_with_summary_sheet(self, export_service, mock_repository, sample_records):
         """Test XLSX export includes summary sheet."""
         mock_repository.get_exportable_records.return_value = sample_records
@@ -231,7 +214,6 @@ class TestExportServiceExtended:
         # Excel files are ZIP format (PK header)
         assert content[:2] == b"PK"
 
-    @pytest.mark.anyio
     async def test_export_json_structure(self, export_service, mock_repository, sample_records):
         """Test JSON export has correct structure."""
         mock_repository.get_exportable_records.return_value = sample_records
@@ -240,7 +222,6 @@ class TestExportServiceExtended:
         request = ExportRequest(format="json")
         content, filename, content_type, exported_ids = await export_service.export_records(request)
 
-        import json
         data = json.loads(content)
 
         assert "exported_at" in data
@@ -248,7 +229,6 @@ class TestExportServiceExtended:
         assert "records" in data
         assert data["record_count"] == len(sample_records)
 
-    @pytest.mark.anyio
     async def test_export_rejected_records_not_marked_exported(self, export_service, mock_repository):
         """Test rejected records keep their status after export."""
         rejected_record = ExtractionRecordDB(
@@ -259,8 +239,8 @@ class TestExportServiceExtended:
             status="rejected",
             rejection_reason="Invalid data",
             confidence_score=0.5,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
+            created_at=FROZEN_NOW,
+            updated_at=FROZEN_NOW,
         )
         mock_repository.get_exportable_records.return_value = [rejected_record]
 
@@ -271,6 +251,14 @@ class TestExportServiceExtended:
         assert len(exported_ids) == 0  # No IDs marked as exported
 
 
+@pytest.fixture(scope="class")
+def manager_with_mock_broadcast():
+    """Create one manager whose broadcast is stubbed for the whole class."""
+    manager = NotificationManager()
+    manager.broadcast = AsyncMock()
+    return manager, manager.broadcast
+
+
 class TestNotificationManager:
     """Tests for NotificationManager."""
 
@@ -285,191 +273,126 @@ class TestNotificationManager:
         manager = NotificationManager()
         assert manager is not None
 
-    @pytest.mark.anyio
-    async def test_notify_record_created(self):
-        """Test record created notification."""
-        manager = NotificationManager()
-
-        # Mock the broadcast method
-        with patch.object(manager, "broadcast", new_callable=AsyncMock) as mock_broadcast:
-            await manager.notify_record_created(
-                record_id=str(uuid4()),
-                source_file="test.html",
-                record_type="FORM",
-            )
-
-            mock_broadcast.assert_called_once()
-
-    @pytest.mark.anyio
-    async def test_notify_record_approved(self):
-        """Test record approval notification."""
-        manager = NotificationManager()
-
-        with patch.object(manager, "broadcast", new_callable=AsyncMock) as mock_broadcast:
-            await manager.notify_record_approved(
-                record_id=str(uuid4()),
-                source_file="test.html",
-                user_id="test_user",
-            )
-
-            mock_broadcast.assert_called_once()
-
-    @pytest.mark.anyio
-    async def test_notify_record_rejected(self):
-        """Test record rejection notification."""
-        manager = NotificationManager()
-
-        with patch.object(manager, "broadcast", new_callable=AsyncMock) as mock_broadcast:
-            await manager.notify_record_rejected(
-                record_id=str(uuid4()),
-                source_file="test.html",
-                reason="Invalid data",
-            )
-
-            mock_broadcast.assert_called_once()
-
-    @pytest.mark.anyio
-    async def test_notify_export_complete(self):
-        """Test export complete notification."""
-        manager = NotificationManager()
-
-        with patch.object(manager, "broadcast", new_callable=AsyncMock) as mock_broadcast:
-            await manager.notify_export_complete(
-                format="csv",
-                count=10,
-                filename="export.csv",
-            )
-
-            mock_broadcast.assert_called_once()
+    @pytest.mark.parametrize(
+        "method_name,kwargs",
+        [
+            (
+                "notify_record_created",
+                {"record_id": str(uuid4()), "source_file": "test.html", "record_type": "FORM"},
+            ),
+            (
+                "notify_record_approved",
+                {"record_id": str(uuid4()), "source_file": "test.html", "user_id": "test_user"},
+            ),
+            (
+                "notify_record_rejected",
+                {"record_id": str(uuid4()), "source_file": "test.html", "reason": "Invalid data"},
+            ),
+            (
+                "notify_export_complete",
+                {"format": "csv", "count": 10, "filename": "export.csv"},
+            ),
+            (
+                "notify_batch_operation",
+                {"operation": "approved", "count": 5, "record_type": "FORM"},
+            ),
+        ],
+        ids=["record-created", "record-approved", "record-rejected", "export-complete", "batch-operation"],
+    )
+    async def test_notify_broadcasts_once(self, manager_with_mock_broadcast, method_name, kwargs):
+        """Test each notify helper sends exactly one broadcast."""
+        manager, mock_broadcast = manager_with_mock_broadcast
+        mock_broadcast.reset_mock()
 
-    @pytest.mark.anyio
-    async def test_notify_batch_operation(self):
-        """Test batch operation notification."""
-        manager = NotificationManager()
+        await getattr(manager, method_name)(**kwargs)
 
-        with patch.object(manager, "broadcast", new_callable=AsyncMock) as mock_broadcast:
-            await manager.notify_batch_operation(
-                operation="approved",
-                count=5,
-                record_type="FORM",
-            )
-
-            mock_broadcast.assert_called_once()
+        mock_broadcast.assert_called_once()
 
 
 class TestLoggingEdgeCases:
     """Tests for logging edge cases."""
 
-    def test_audit_logger_extraction_started(self):
-        """Test audit logger for extraction started events."""
-        from app.core.logging import audit_logger
-
-        # Should not raise exception
-        audit_logger.log_extraction_started(
-            file_path="test.html",
-            file_type="FORM",
-            extraction_id=str(uuid4()),
-        )
-
-    def test_audit_logger_extraction_completed(self):
-        """Test audit logger for extraction completed events."""
-        from app.core.logging import audit_logger
-
-        audit_logger.log_extraction_completed(
-            extraction_id=str(uuid4()),
-            success=True,
-            confidence_score=0.95,
-        )
-
-    def test_audit_logger_extraction_completed_failure(self):
-        """Test audit logger for failed extraction events."""
-        from app.core.logging import audit_logger
-
-        audit_logger.log_extraction_completed(
-            extraction_id=str(uuid4()),
-            success=False,
-            error_message="Extraction failed",
-        )
-
-    def test_audit_logger_user_action(self):
-        """Test audit logger for user actions."""
-        from app.core.logging import audit_logger
-
-        audit_logger.log_user_action(
-            action="approve",
-            extraction_id=str(uuid4()),
-            user_id="test_user",
-            details={"notes": "Test approval"},
-        )
-
-    def test_audit_logger_export(self):
-        """Test audit logger for export events."""
-        from app.core.logging import audit_logger
-
-        audit_logger.log_export(
-            export_format="csv",
-            record_count=5,
-            destination="export.csv",
-        )
-
-    def test_audit_logger_user_action_invalid_uuid(self):
-        """Test audit logger with invalid UUID (not a valid UUID string)."""
-        from app.core.logging import audit_logger
-
-        # Should not raise - invalid UUID is handled gracefully
-        audit_logger.log_user_action(
-            action="view",
-            extraction_id="not-a-valid-uuid",
-            user_id="test_user",
-        )
-
-    def test_audit_logger_user_action_no_details(self):
-        """Test audit logger without details."""
-        from app.core.logging import audit_logger
-
-        audit_logger.log_user_action(
-            action="delete",
-            extraction_id=str(uuid4()),
-        )
-
-    def test_audit_logger_user_action_no_user(self):
-        """Test audit logger without user_id."""
-        from app.core.logging import audit_logger
-
-        audit_logger.log_user_action(
-            action="view",
-            extraction_id=str(uuid4()),
-            details={"source": "api"},
-        )
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param(
+                {
+                    "action": "approve",
+                    "extraction_id": str(uuid4()),
+                    "user_id": "test_user",
+                    "details": {"notes": "Test approval"},
+                },
+                id="with_details",
+            ),
+            pytest.param(
+                {"action": "view", "extraction_id": "not-a-valid-uuid", "user_id": "test_user"},
+                id="invalid_uuid",
+            ),
+            pytest.param(
+                {"action": "delete", "extraction_id": str(uuid4())},
+                id="no_details",
+            ),
+            pytest.param(
+                {"action": "view", "extraction_id": str(uuid4()), "details": {"source": "api"}},
+                id="no_user",
+            ),
+            pytest.param(
+                {"action": "test", "extraction_id": ""},
+                id="empty_extraction_id",
+            ),
+        ],
+    )
+    def test_log_user_action_variants(self, kwargs):
+        """Test audit logger user actions handle optional and invalid fields."""
+        # Should not raise - invalid or missing values are handled gracefully
+        audit_logger.log_user_action(**kwargs)
+
+    @pytest.mark.parametrize(
+        "method_name,kwargs",
+        [
+            pytest.param(
+                "log_extraction_started",
+                {"file_path": "test.html", "file_type": "FORM", "extraction_id": str(uuid4())},
+                id="extraction_started",
+            ),
+            pytest.param(
+                "log_extraction_completed",
+                {"extraction_id": str(uuid4()), "success": True, "confidence_score": 0.95},
+                id="extraction_completed",
+            ),
+            pytest.param(
+                "log_extraction_completed",
+                {"extraction_id": str(uuid4()), "success": False, "error_message": "Extraction failed"},
+                id="extraction_failed",
+            ),
+            pytest.param(
+                "log_export",
+                {"export_format": "csv", "record_count": 5, "destination": "export.csv"},
+                id="export",
+            ),
+        ],
+    )
+    def test_log_event_variants(self, method_name, kwargs):
+        """Test audit logger extraction and export events."""
+        getattr(audit_logger, method_name)(**kwargs)
 
-    @pytest.mark.anyio
-    async def test_audit_logger_persist_in_async_context(self):
-        """Test audit logger works in async context."""
-        from app.core.logging import audit_logger
+    async def test_audit_logger_persist_in_async_context(self, audit_session):
+        """Test audit logger queues rows in async context and flushes them."""
+        logger = AuditLogger(session_factory=MagicMock(return_value=audit_session))
 
-        # In async context, it should try to create a task
-        audit_logger.log_user_action(
+        logger.log_user_action(
             action="async_test",
             extraction_id=str(uuid4()),
             user_id="async_user",
         )
-        # Give the task a chance to run
-        import asyncio
-        await asyncio.sleep(0.1)
+        await logger.flush()
 
-    def test_audit_logger_with_empty_extraction_id(self):
-        """Test audit logger with empty extraction_id."""
-        from app.core.logging import audit_logger
-
-        audit_logger.log_user_action(
-            action="test",
-            extraction_id="",
-        )
+        (rows,), _ = audit_session.add_all.call_args
+        assert [(row.action, row.user_id) for row in rows] == [("async_test", "async_user")]
+        audit_session.commit.assert_awaited_once()
 
     def test_audit_logger_with_none_extraction_id(self):
         """Test audit logger handles None extraction_id."""
-        from app.core.logging import AuditLogger
-
         logger = AuditLogger()
         # Call internal method directly with None
         logger._persist_to_db(
@@ -481,8 +404,6 @@ class TestLoggingEdgeCases:
 
     def test_audit_logger_no_database_configured(self):
         """Test audit logger when database is not configured."""
-        from app.core.logging import AuditLogger
-
         logger = AuditLogger()
 
         # Mock AsyncSessionLocal to be None
@@ -495,22 +416,97 @@ class TestLoggingEdgeCases:
                 details={"test": True},
             )
 
-    def test_audit_logger_database_persist_exception(self):
+    @pytest.fixture
+    def audit_session(self):
+        """Create a mock session usable as an async context manager."""
+        session = MagicMock()
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=None)
+        session.commit = AsyncMock()
+        return session
+
+    async def test_audit_logger_database_persist_exception(self, audit_session):
         """Test audit logger handles database persist exception."""
-        from app.core.logging import AuditLogger
-
-        logger = AuditLogger()
+        # Simulate a database error from an injected session factory
+        audit_session.add_all = MagicMock(side_effect=Exception("DB Error"))
 
-        # Mock to simulate database error
-        mock_session = MagicMock()
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-        mock_session.add = MagicMock(side_effect=Exception("DB Error"))
+        logger = AuditLogger(session_factory=MagicMock(return_value=audit_session))
 
-        with patch("app.db.database.AsyncSessionLocal", return_value=mock_session):
+        with patch.object(logger._logger, "warning") as mock_warning:
             # Should not raise - gracefully handles database errors
             logger._persist_to_db(
                 action="test_db_error",
                 record_id=str(uuid4()),
                 user_id="test_user",
             )
+            await logger.close()
+
+        mock_warning.assert_called_once()
+        assert mock_warning.call_args.args[0] == "audit_db_persist_failed"
+
+    async def test_audit_logger_retries_failed_batch_per_row(self, audit_session):
+        """Test a failed batch only loses the rows that fail on their own."""
+        def add_all(rows):
+            if any(row.action == "bad" for row in rows):
+                raise Exception("DB Error")
+
+        audit_session.add_all = MagicMock(side_effect=add_all)
+        logger = AuditLogger(session_factory=MagicMock(return_value=audit_session))
+
+        with patch.object(logger._logger, "warning") as mock_warning:
+            for action in ("approve", "bad", "reject"):
+                logger.log_user_action(action=action, extraction_id=str(uuid4()))
+            await logger.close()
+
+        # One failed batch, then one transaction per row
+        assert audit_session.add_all.call_count == 4
+        assert audit_session.commit.await_count == 2
+        mock_warning.assert_called_once()
+        assert mock_warning.call_args.kwargs["action"] == "bad"
+
+    async def test_audit_logger_batches_rows_into_one_commit(self, audit_session):
+        """Test rows logged together are written in a single transaction."""
+        session_factory = MagicMock(return_value=audit_session)
+        logger = AuditLogger(session_factory=session_factory)
+
+        logger.log_user_action(action="approve", extraction_id=str(uuid4()), user_id="u1")
+        logger.log_user_action(action="reject", extraction_id="not-a-uuid")
+        logger.log_export(export_format="csv", record_count=3, destination="export.csv")
+
+        # Nothing is written until the buffer is flushed
+        session_factory.assert_not_called()
+        await logger.close()
+
+        session_factory.assert_called_once()
+        audit_session.commit.assert_awaited_once()
+        (rows,), _ = audit_session.add_all.call_args
+        assert [row.action for row in rows] == ["approve", "reject", "data_export"]
+        assert rows[1].record_id is None
+        assert rows[1].details == {"identifier": "not-a-uuid"}
+
+    async def test_audit_logger_flushes_when_buffer_is_full(self, audit_session):
+        """Test a full buffer is written without waiting for the interval."""
+        logger = AuditLogger(session_factory=MagicMock(return_value=audit_session))
+        logger.FLUSH_SIZE = 2
+        logger.FLUSH_INTERVAL = 60
+
+        logger.log_user_action(action="approve", extraction_id=str(uuid4()))
+        timer = logger._flush_task
+        logger.log_user_action(action="approve", extraction_id=str(uuid4()))
+        await logger.close()
+
+        (rows,), _ = audit_session.add_all.call_args
+        assert len(rows) == 2
+        audit_session.commit.assert_awaited_once()
+
+        # The size-triggered flush took the buffer, so the interval flush is dropped
+        with pytest.raises(asyncio.CancelledError):
+            await timer
+
+    def test_audit_logger_sync_context_skips_buffer(self, audit_session):
+        """Test rows logged outside an event loop are not queued."""
+        logger = AuditLogger(session_factory=MagicMock(return_value=audit_session))
+
+        logger.log_user_action(action="approve", extraction_id=str(uuid4()))
+
+        assert logger._buffer == []